@@ -0,0 +1,58 @@
+"""Add public_search_log bucket columns
+
+Revision ID: 0013_7d3e2b91c4a8
+Revises: 0012_145d0d20f797
+Create Date: 2026-10-18 16:31:47.552918
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0013_7d3e2b91c4a8"
+down_revision: Union[str, None] = "0012_145d0d20f797"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "public_search_log",
+        sa.Column("bucket_at", sa.DateTime(), nullable=True, comment="집계 구간 시작 시각"),
+    )
+    op.add_column(
+        "public_search_log",
+        sa.Column(
+            "search_count",
+            sa.Integer(),
+            server_default="1",
+            nullable=False,
+            comment="구간 내 검색 수",
+        ),
+    )
+    # 기존 행은 한 건씩 기록된 것으로 보고 생성 시각을 구간 시작 시각으로 사용
+    op.execute("UPDATE public_search_log SET bucket_at = created_at")
+    op.alter_column(
+        "public_search_log",
+        "bucket_at",
+        existing_type=sa.DateTime(),
+        nullable=False,
+        existing_comment="집계 구간 시작 시각",
+    )
+    op.create_index(
+        "ix_public_search_log_bucket_at_category",
+        "public_search_log",
+        ["bucket_at", "search_category", "politician_id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_public_search_log_bucket_at_category", table_name="public_search_log"
+    )
+    op.drop_column("public_search_log", "search_count")
+    op.drop_column("public_search_log", "bucket_at")
@@ -0,0 +1,33 @@
+"""Add public_data_version table
+
+Revision ID: 0014_3f8a61c2d9e5
+Revises: 0013_7d3e2b91c4a8
+Create Date: 2026-10-18 21:12:05.318264
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0014_3f8a61c2d9e5"
+down_revision: Union[str, None] = "0013_7d3e2b91c4a8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "public_data_version",
+        sa.Column("name", sa.String(length=50), nullable=False, comment="데이터 이름"),
+        sa.Column("version", sa.BigInteger(), nullable=False, comment="공개 데이터 버전"),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("name"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("public_data_version")
@@ -0,0 +1,43 @@
+"""Add bulk_import_job table
+
+Revision ID: 0015_9b2e47d1c6f3
+Revises: 0014_3f8a61c2d9e5
+Create Date: 2026-10-18 22:04:51.730112
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0015_9b2e47d1c6f3"
+down_revision: Union[str, None] = "0014_3f8a61c2d9e5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "bulk_import_job",
+        sa.Column("id", sa.String(length=32), nullable=False, comment="작업 id"),
+        sa.Column("admin_id", sa.Integer(), nullable=False, comment="관리자 id"),
+        sa.Column("status", sa.String(length=20), nullable=False, comment="작업 상태"),
+        sa.Column("body_bytes", sa.BigInteger(), nullable=False, comment="요청 body 크기"),
+        sa.Column("processed_count", sa.Integer(), nullable=False, comment="처리한 행 수"),
+        sa.Column("inserted_count", sa.Integer(), nullable=False, comment="등록한 의원 수"),
+        sa.Column("error_count", sa.Integer(), nullable=False, comment="오류 행 수"),
+        sa.Column("error_list", sa.JSON(), nullable=True, comment="행 오류 목록"),
+        sa.Column("failure_detail", sa.JSON(), nullable=True, comment="작업 실패 사유"),
+        sa.Column("started_at", sa.DateTime(), nullable=True, comment="작업 시작 시각"),
+        sa.Column("finished_at", sa.DateTime(), nullable=True, comment="작업 종료 시각"),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["admin_id"], ["admin.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("bulk_import_job")
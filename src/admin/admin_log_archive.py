@@ -0,0 +1,336 @@
+import asyncio
+import fcntl
+import gzip
+import json
+import logging
+import os
+import time
+from datetime import date, datetime, timedelta
+from typing import AsyncIterator, List, Optional
+from uuid import uuid4
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from config import settings
+from database.connection import SessionFactory
+from repositories.admin_repository import AdminRepository
+
+logger = logging.getLogger("uvicorn")
+
+READ_LINE_HINT = 65536
+
+
+class AdminLogArchiveSegment:
+    """
+    하루치 보관 로그를 gzip NDJSON 임시 파일에 기록, close() 에서 최종 경로로 이동
+    """
+
+    def __init__(self, archive_dir: str, day: date) -> None:
+        self.day = day
+        self.id_list: List[int] = []
+        self.start_at: Optional[datetime] = None
+        self.end_at: Optional[datetime] = None
+        self.pending_line_list: List[str] = []
+        self.temp_path = os.path.join(
+            archive_dir, f".admin_log_{day.isoformat()}.{uuid4().hex}.tmp"
+        )
+        self.file = gzip.open(self.temp_path, "wt", encoding="utf-8")
+
+    def add(self, admin_log) -> None:
+        self.id_list.append(admin_log.id)
+        if self.start_at is None:
+            self.start_at = admin_log.created_at
+        self.end_at = admin_log.created_at
+        self.pending_line_list.append(
+            json.dumps(
+                {
+                    "id": admin_log.id,
+                    "admin_id": admin_log.admin_id,
+                    "admin_nickname": admin_log.nickname,
+                    "action": admin_log.action,
+                    "politician_id": admin_log.politician_id,
+                    "politician_name": admin_log.politician_name,
+                    "detail": admin_log.detail,
+                    "created_at": admin_log.created_at.isoformat(),
+                },
+                ensure_ascii=False,
+            )
+            + "\n"
+        )
+
+    def write_pending_lines(self) -> None:
+        self.file.writelines(self.pending_line_list)
+        self.pending_line_list.clear()
+
+    def get_file_name(self) -> str:
+        return os.path.join(
+            self.day.strftime("%Y"),
+            self.day.strftime("%m"),
+            f"admin_log_{self.day.isoformat()}_{min(self.id_list)}_"
+            f"{max(self.id_list)}.ndjson.gz",
+        )
+
+    def close(self, file_path: str) -> None:
+        self.write_pending_lines()
+        self.file.close()
+        with open(self.temp_path, "rb") as file:
+            os.fsync(file.fileno())
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        os.replace(self.temp_path, file_path)
+
+    def discard(self) -> None:
+        self.file.close()
+        try:
+            os.remove(self.temp_path)
+        except FileNotFoundError:
+            pass
+
+
+class AdminLogArchiver:
+    """
+    관리자 활동 로그 보관 이전
+    - retention_days 일 이전(자정 기준) 로그를 하루 단위 gzip NDJSON 세그먼트로 옮긴 뒤 테이블에서 삭제
+    - 세그먼트 목록은 archive_dir/index.json 에 기록 (파일, 기간, id 범위, 행 수)
+    - 파일 이동 → 목록 기록 → 행 삭제 순서, 파일명이 (날짜, 최소 id, 최대 id) 로 정해지므로
+      삭제 전에 중단되면 다음 실행에서 같은 세그먼트를 다시 써서 덮어씀
+    - 여러 워커가 동시에 옮기지 않도록 archive_dir/.lock 파일 잠금 (같은 호스트 기준)
+    """
+
+    index_file_name = "index.json"
+    lock_file_name = ".lock"
+
+    def __init__(
+        self,
+        retention_days: int,
+        archive_dir: str,
+        interval: float,
+        batch_size: int,
+        session_factory: async_sessionmaker = SessionFactory,
+    ) -> None:
+        self.retention_days = retention_days
+        self.archive_dir = archive_dir
+        self.interval = interval
+        self.batch_size = batch_size
+        self.session_factory = session_factory
+        self.scheduler_task: Optional[asyncio.Task] = None
+        self.run_count = 0
+        self.archived_count = 0
+        self.last_run_ms: Optional[float] = None
+
+    def start(self) -> None:
+        if self.retention_days <= 0 or self.scheduler_task is not None:
+            return
+        self.scheduler_task = asyncio.create_task(self.run_scheduler())
+
+    async def stop(self) -> None:
+        if self.scheduler_task is None:
+            return
+        self.scheduler_task.cancel()
+        await asyncio.gather(self.scheduler_task, return_exceptions=True)
+        self.scheduler_task = None
+
+    async def run_scheduler(self) -> None:
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.exception(f"Admin log archive failed: {e}")
+            await asyncio.sleep(self.interval)
+
+    def get_cutoff(self, now: Optional[datetime] = None) -> datetime:
+        today = (now or datetime.now()).date()
+        return datetime.combine(
+            today - timedelta(days=self.retention_days), datetime.min.time()
+        )
+
+    async def run_once(self, now: Optional[datetime] = None) -> int:
+        os.makedirs(self.archive_dir, exist_ok=True)
+        with open(os.path.join(self.archive_dir, self.lock_file_name), "w") as lock:
+            try:
+                fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                logger.info("Admin log archive is running in another worker")
+                return 0
+            return await self.archive_before(self.get_cutoff(now))
+
+    async def archive_before(self, cutoff: datetime) -> int:
+        start_time = time.perf_counter()
+        archived_count = 0
+        segment: Optional[AdminLogArchiveSegment] = None
+        after = None
+        try:
+            while True:
+                async with self.session_factory() as session:
+                    admin_log_list = await AdminRepository(
+                        session
+                    ).select_admin_log_before(cutoff, self.batch_size, after)
+                if not admin_log_list:
+                    break
+                after = (admin_log_list[-1].created_at, admin_log_list[-1].id)
+                for admin_log in admin_log_list:
+                    day = admin_log.created_at.date()
+                    if segment is not None and segment.day != day:
+                        archived_count += await self.finish_segment(segment)
+                        segment = None
+                    if segment is None:
+                        segment = AdminLogArchiveSegment(self.archive_dir, day)
+                    segment.add(admin_log)
+                await asyncio.to_thread(segment.write_pending_lines)
+            if segment is not None:
+                archived_count += await self.finish_segment(segment)
+                segment = None
+        finally:
+            if segment is not None:
+                segment.discard()
+
+        self.run_count += 1
+        self.archived_count += archived_count
+        self.last_run_ms = (time.perf_counter() - start_time) * 1000
+        if archived_count:
+            logger.info(
+                f"Archived {archived_count} admin logs before {cutoff.isoformat()}"
+            )
+        return archived_count
+
+    async def finish_segment(self, segment: AdminLogArchiveSegment) -> int:
+        file_name = segment.get_file_name()
+        file_path = os.path.join(self.archive_dir, file_name)
+        await asyncio.to_thread(segment.close, file_path)
+        await asyncio.to_thread(
+            self.add_index_entry,
+            {
+                "file": file_name,
+                "start_at": segment.start_at.isoformat(),
+                "end_at": segment.end_at.isoformat(),
+                "first_id": min(segment.id_list),
+                "last_id": max(segment.id_list),
+                "row_count": len(segment.id_list),
+                "bytes": os.path.getsize(file_path),
+            },
+        )
+        async with self.session_factory() as session:
+            admin_repo = AdminRepository(session)
+            for start in range(0, len(segment.id_list), self.batch_size):
+                await admin_repo.delete_admin_log_by_id_list(
+                    segment.id_list[start : start + self.batch_size]
+                )
+            await session.commit()
+        return len(segment.id_list)
+
+    def read_index(self) -> List[dict]:
+        try:
+            with open(
+                os.path.join(self.archive_dir, self.index_file_name), encoding="utf-8"
+            ) as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return []
+
+    def add_index_entry(self, entry: dict) -> None:
+        entry_list = [
+            index_entry
+            for index_entry in self.read_index()
+            if index_entry["file"] != entry["file"]
+        ]
+        entry_list.append(entry)
+        entry_list.sort(
+            key=lambda index_entry: (index_entry["start_at"], index_entry["first_id"])
+        )
+        index_path = os.path.join(self.archive_dir, self.index_file_name)
+        with open(f"{index_path}.tmp", "w", encoding="utf-8") as file:
+            json.dump(entry_list, file, ensure_ascii=False)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(f"{index_path}.tmp", index_path)
+
+    def select_segment_list(
+        self, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None
+    ) -> List[dict]:
+        return [
+            entry
+            for entry in self.read_index()
+            if (
+                start_date is None
+                or datetime.fromisoformat(entry["end_at"]) >= start_date
+            )
+            and (
+                end_date is None or datetime.fromisoformat(entry["start_at"]) < end_date
+            )
+        ]
+
+    async def iter_admin_log(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        admin_id: Optional[int] = None,
+        action: Optional[str] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        기간이 겹치는 세그먼트만 열어 조건에 맞는 로그를 NDJSON 으로 반환 (오래된 순)
+        - 세그먼트 전체를 메모리에 올리지 않고 READ_LINE_HINT 바이트 정도씩 읽음
+        """
+        for entry in await asyncio.to_thread(
+            self.select_segment_list, start_date, end_date
+        ):
+            try:
+                file = await asyncio.to_thread(
+                    gzip.open,
+                    os.path.join(self.archive_dir, entry["file"]),
+                    "rt",
+                    encoding="utf-8",
+                )
+            except FileNotFoundError:
+                logger.error(f"Admin log archive segment not found: {entry['file']}")
+                continue
+            try:
+                while True:
+                    line_list = await asyncio.to_thread(file.readlines, READ_LINE_HINT)
+                    if not line_list:
+                        break
+                    matched_line_list = [
+                        line
+                        for line in line_list
+                        if self.is_matched(
+                            json.loads(line), start_date, end_date, admin_id, action
+                        )
+                    ]
+                    if matched_line_list:
+                        yield "".join(matched_line_list).encode()
+            finally:
+                file.close()
+
+    @staticmethod
+    def is_matched(
+        admin_log: dict,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        admin_id: Optional[int],
+        action: Optional[str],
+    ) -> bool:
+        if admin_id is not None and admin_log["admin_id"] != admin_id:
+            return False
+        if action is not None and admin_log["action"] != action:
+            return False
+        if start_date is None and end_date is None:
+            return True
+        created_at = datetime.fromisoformat(admin_log["created_at"])
+        return (start_date is None or created_at >= start_date) and (
+            end_date is None or created_at < end_date
+        )
+
+    def get_stats(self) -> dict:
+        return {
+            "retention_days": self.retention_days,
+            "running": self.scheduler_task is not None,
+            "run_count": self.run_count,
+            "archived_count": self.archived_count,
+            "last_run_ms": self.last_run_ms,
+        }
+
+
+admin_log_archiver = AdminLogArchiver(
+    int(settings.admin_log_retention_days),
+    settings.admin_log_archive_dir,
+    float(settings.admin_log_archive_interval),
+    int(settings.admin_log_archive_batch_size),
+)
@@ -0,0 +1,329 @@
+import asyncio
+import glob
+import json
+import logging
+import os
+import re
+import time
+from datetime import datetime
+from typing import List, Optional, Tuple
+from uuid import uuid4
+
+from sqlalchemy.exc import DataError, IntegrityError
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from common.process import is_process_alive
+from config import settings
+from database.connection import SessionFactory
+from repositories.admin_repository import AdminRepository
+
+logger = logging.getLogger("uvicorn")
+
+# 대체 파일 이름의 접미사: .{기록한 워커 pid} 또는 .{가져간 워커 pid}.{임의 값}.replay
+FALLBACK_SUFFIX_PATTERN = re.compile(r"^\.(\d+)(\.[0-9a-f]+\.replay)?$")
+
+
+class AuditLogWriter:
+    """
+    관리자 활동 로그 버퍼
+    - record() 는 메모리 버퍼에 추가만 하므로 관리자 쓰기 트랜잭션에 로그 INSERT 가 포함되지 않음
+      (서비스에서 커밋이 끝난 뒤 호출)
+    - batch_size 만큼 쌓이거나 flush_interval 초가 지나면 별도 세션으로 한 번에 삽입
+    - DB 삽입이 실패하면 워커별 파일 fallback_path.{pid} 에 JSON 줄로 덧붙이고, 다음 삽입 성공 후/시작 시 재삽입
+    - 재삽입할 파일은 이름을 바꿔 가져가므로(rename 은 원자적) 파일마다 한 워커만 재삽입,
+      실행 중인 다른 워커의 파일은 가져가지 않음
+    - 읽을 수 없는 줄과 DB 가 항상 거부하는 행(무결성/데이터 오류)은 fallback_path.{pid}.rejected 로 격리
+    - 종료 시 남은 버퍼를 모두 삽입 (프로세스가 비정상 종료되면 최대 flush_interval 동안의 로그 유실 가능)
+    """
+
+    def __init__(
+        self,
+        batch_size: int,
+        flush_interval: float,
+        fallback_path: str,
+        session_factory: async_sessionmaker = SessionFactory,
+    ) -> None:
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.fallback_path = fallback_path
+        self.session_factory = session_factory
+        self.buffer: List[dict] = []
+        self.flush_lock = asyncio.Lock()
+        self.flush_event: Optional[asyncio.Event] = None
+        self.flusher_task: Optional[asyncio.Task] = None
+        self.recorded_count = 0
+        self.flushed_count = 0
+        self.flush_count = 0
+        self.failed_flush_count = 0
+        self.fallback_count = 0
+        self.replayed_count = 0
+        self.rejected_count = 0
+        self.last_flush_ms: Optional[float] = None
+
+    def record(
+        self,
+        admin_id: int,
+        action: str,
+        politician_id: Optional[int] = None,
+        detail: Optional[dict] = None,
+    ) -> None:
+        created_at = datetime.now()
+        self.buffer.append(
+            {
+                "admin_id": admin_id,
+                "politician_id": politician_id,
+                "action": action,
+                "detail": detail,
+                "created_at": created_at,
+                "updated_at": created_at,
+            }
+        )
+        self.recorded_count += 1
+        if len(self.buffer) >= self.batch_size and self.flush_event is not None:
+            self.flush_event.set()
+
+    def start(self) -> None:
+        if self.flusher_task is not None:
+            return
+        self.flush_event = asyncio.Event()
+        self.flusher_task = asyncio.create_task(self.run_flusher())
+
+    async def stop(self) -> None:
+        if self.flusher_task is not None:
+            self.flusher_task.cancel()
+            await asyncio.gather(self.flusher_task, return_exceptions=True)
+            self.flusher_task = None
+            self.flush_event = None
+        await self.flush()
+
+    async def run_flusher(self) -> None:
+        await self.replay_fallback_file()
+        while True:
+            try:
+                await asyncio.wait_for(
+                    self.flush_event.wait(), timeout=self.flush_interval
+                )
+            except asyncio.TimeoutError:
+                pass
+            self.flush_event.clear()
+            await self.flush()
+
+    async def flush(self) -> None:
+        is_inserted = False
+        async with self.flush_lock:
+            while self.buffer:
+                batch = self.buffer[: self.batch_size]
+                del self.buffer[: self.batch_size]
+                if not await self.insert_batch(batch):
+                    # DB 를 쓸 수 없으면 남은 버퍼까지 모두 파일로 옮김
+                    batch.extend(self.buffer)
+                    self.buffer.clear()
+                    await self.write_fallback_file(batch)
+                    return
+                self.flushed_count += len(batch)
+                is_inserted = True
+        if is_inserted:
+            await self.replay_fallback_file()
+
+    async def insert_batch(self, batch: List[dict]) -> bool:
+        start_time = time.perf_counter()
+        try:
+            async with self.session_factory() as session:
+                await AdminRepository(session).bulk_insert_admin_log_data(batch)
+                await session.commit()
+        except Exception as e:
+            self.failed_flush_count += 1
+            logger.error(f"Failed to flush {len(batch)} admin logs: {e}")
+            return False
+        self.flush_count += 1
+        self.last_flush_ms = (time.perf_counter() - start_time) * 1000
+        return True
+
+    @staticmethod
+    def to_line(admin_log: dict) -> str:
+        return (
+            json.dumps(
+                {
+                    **admin_log,
+                    "created_at": admin_log["created_at"].isoformat(),
+                    "updated_at": admin_log["updated_at"].isoformat(),
+                },
+                ensure_ascii=False,
+            )
+            + "\n"
+        )
+
+    @staticmethod
+    async def write_lines(file_path: str, mode: str, line_list: List[str]) -> None:
+        def write() -> None:
+            with open(file_path, mode, encoding="utf-8") as file:
+                file.writelines(line_list)
+                file.flush()
+                os.fsync(file.fileno())
+
+        await asyncio.to_thread(write)
+
+    def get_worker_fallback_path(self) -> str:
+        return f"{self.fallback_path}.{os.getpid()}"
+
+    async def write_fallback_file(self, batch: List[dict]) -> None:
+        worker_fallback_path = self.get_worker_fallback_path()
+        try:
+            await self.write_lines(
+                worker_fallback_path, "a", [self.to_line(row) for row in batch]
+            )
+        except OSError as e:
+            logger.error(f"Lost {len(batch)} admin logs: {e} - {batch}")
+            return
+        self.fallback_count += len(batch)
+        logger.warning(
+            f"Wrote {len(batch)} admin logs to fallback file {worker_fallback_path}"
+        )
+
+    def claim_fallback_file(self) -> List[str]:
+        """
+        재삽입할 대체 파일 이름을 .{pid}.{임의 값}.replay 로 바꿔 가져옴
+        - 자기 파일과 종료된 워커의 파일(워커별 파일 이전의 fallback_path, .replay 포함)만 대상
+        - 재삽입 중 새로 덧붙는 줄은 원래 이름의 새 파일에 쌓임
+        """
+        worker_id = os.getpid()
+        replay_path_list = []
+        for path in sorted(glob.glob(f"{glob.escape(self.fallback_path)}*")):
+            suffix = path[len(self.fallback_path) :]
+            matched = FALLBACK_SUFFIX_PATTERN.match(suffix)
+            if matched is not None:
+                owner_id = int(matched.group(1))
+                if owner_id == worker_id and matched.group(2):
+                    replay_path_list.append(path)
+                    continue
+                if owner_id != worker_id and is_process_alive(owner_id):
+                    continue
+            elif suffix not in ("", ".replay"):
+                continue
+            replay_path = f"{self.fallback_path}.{worker_id}.{uuid4().hex[:8]}.replay"
+            try:
+                os.rename(path, replay_path)
+            except FileNotFoundError:
+                continue
+            replay_path_list.append(replay_path)
+        return replay_path_list
+
+    @staticmethod
+    def read_fallback_file(replay_path: str) -> Tuple[List[dict], List[str]]:
+        batch = []
+        rejected_line_list = []
+        with open(replay_path, encoding="utf-8", errors="replace") as file:
+            for line in filter(str.strip, file):
+                try:
+                    admin_log = json.loads(line)
+                    batch.append(
+                        {
+                            **admin_log,
+                            "created_at": datetime.fromisoformat(
+                                admin_log["created_at"]
+                            ),
+                            "updated_at": datetime.fromisoformat(
+                                admin_log["updated_at"]
+                            ),
+                        }
+                    )
+                except (ValueError, KeyError, TypeError):
+                    rejected_line_list.append(
+                        line if line.endswith("\n") else line + "\n"
+                    )
+        return batch, rejected_line_list
+
+    async def replay_fallback_file(self) -> None:
+        async with self.flush_lock:
+            try:
+                replay_path_list = await asyncio.to_thread(self.claim_fallback_file)
+            except OSError as e:
+                logger.error(f"Failed to claim admin log fallback file: {e}")
+                return
+            for replay_path in replay_path_list:
+                if not await self.replay_file(replay_path):
+                    return
+
+    async def replay_file(self, replay_path: str) -> bool:
+        try:
+            batch, rejected_line_list = await asyncio.to_thread(
+                self.read_fallback_file, replay_path
+            )
+        except OSError as e:
+            logger.error(f"Failed to read admin log fallback file: {e}")
+            return False
+        replayed_count = 0
+        remaining_batch: List[dict] = []
+        for start in range(0, len(batch), self.batch_size):
+            chunk = batch[start : start + self.batch_size]
+            if await self.insert_batch(chunk):
+                replayed_count += len(chunk)
+                continue
+            # 한 행 때문에 묶음 전체가 실패했을 수 있으므로 행별로 다시 넣어 거부되는 행만 격리
+            for index, admin_log in enumerate(chunk):
+                try:
+                    async with self.session_factory() as session:
+                        await AdminRepository(session).bulk_insert_admin_log_data(
+                            [admin_log]
+                        )
+                        await session.commit()
+                    replayed_count += 1
+                except (IntegrityError, DataError) as e:
+                    logger.error(f"Rejected admin log from fallback file: {e}")
+                    rejected_line_list.append(self.to_line(admin_log))
+                except Exception as e:
+                    # DB 를 쓸 수 없으면 남은 행을 다음에 다시 시도
+                    logger.error(f"Failed to replay admin logs: {e}")
+                    remaining_batch = chunk[index:] + batch[start + self.batch_size :]
+                    break
+            if remaining_batch:
+                break
+
+        try:
+            if rejected_line_list:
+                await self.write_lines(
+                    f"{self.get_worker_fallback_path()}.rejected",
+                    "a",
+                    rejected_line_list,
+                )
+            if remaining_batch:
+                await self.write_lines(
+                    replay_path, "w", [self.to_line(row) for row in remaining_batch]
+                )
+            else:
+                await asyncio.to_thread(os.remove, replay_path)
+        except OSError as e:
+            logger.error(f"Failed to update admin log fallback file: {e}")
+            return False
+        self.replayed_count += replayed_count
+        self.rejected_count += len(rejected_line_list)
+        if replayed_count:
+            logger.info(f"Replayed {replayed_count} admin logs from fallback file")
+        if rejected_line_list:
+            logger.warning(
+                f"Moved {len(rejected_line_list)} admin logs to "
+                f"{self.get_worker_fallback_path()}.rejected"
+            )
+        return not remaining_batch
+
+    def get_stats(self) -> dict:
+        return {
+            "buffered_count": len(self.buffer),
+            "batch_size": self.batch_size,
+            "flush_interval": self.flush_interval,
+            "recorded_count": self.recorded_count,
+            "flushed_count": self.flushed_count,
+            "flush_count": self.flush_count,
+            "failed_flush_count": self.failed_flush_count,
+            "fallback_count": self.fallback_count,
+            "replayed_count": self.replayed_count,
+            "rejected_count": self.rejected_count,
+            "last_flush_ms": self.last_flush_ms,
+        }
+
+
+audit_log_writer = AuditLogWriter(
+    int(settings.audit_log_batch_size),
+    float(settings.audit_log_flush_interval),
+    settings.audit_log_fallback_path,
+)
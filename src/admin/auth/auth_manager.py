@@ -1,3 +1,5 @@
+import hashlib
+import hmac
 import json
 import logging
 from datetime import datetime, timedelta
@@ -14,6 +16,8 @@ from config import settings
 
 logger = logging.getLogger("uvicorn")
 
+REFRESH_TOKEN_DIGEST_PREFIX = "hmac-sha256$"
+
 
 class AuthManager:
     encoding: str = "UTF-8"
@@ -22,6 +26,10 @@ class AuthManager:
     refresh_token_secret_key: str = settings.refresh_token_secret_key
     access_token_exp: int = settings.access_token_exp
     refresh_token_exp: int = settings.refresh_token_exp
+    # 별도 키가 없으면 refresh token 서명 키를 사용
+    refresh_token_digest_key: str = (
+        settings.refresh_token_digest_key or settings.refresh_token_secret_key
+    )
 
     def hash_text(self, plain_text: str) -> str:
         hashed_text: bytes = bcrypt.hashpw(
@@ -34,6 +42,29 @@ class AuthManager:
             plain_text.encode(self.encoding), hashed_text.encode(self.encoding)
         )
 
+    def digest_token(self, token: str) -> str:
+        """
+        refresh token 저장용 다이제스트
+        - 서명된 고엔트로피 JWT 이므로 느린 bcrypt 대신 서버 키 HMAC-SHA256 사용
+        - 이전 bcrypt 해시('$2b$...')와 구분되도록 접두사 부여
+        """
+        digest = hmac.new(
+            self.refresh_token_digest_key.encode(self.encoding),
+            token.encode(self.encoding),
+            hashlib.sha256,
+        ).hexdigest()
+        return f"{REFRESH_TOKEN_DIGEST_PREFIX}{digest}"
+
+    def verify_token_digest(self, token: str, token_digest: str) -> bool:
+        return hmac.compare_digest(
+            self.digest_token(token).encode(self.encoding),
+            token_digest.encode(self.encoding),
+        )
+
+    @staticmethod
+    def is_token_digest(hashed_token: str) -> bool:
+        return hashed_token.startswith(REFRESH_TOKEN_DIGEST_PREFIX)
+
     def create_access_token(
         self,
         admin_id: int,
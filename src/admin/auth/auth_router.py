@@ -8,6 +8,7 @@ from starlette.status import (
     HTTP_401_UNAUTHORIZED,
     HTTP_404_NOT_FOUND,
     HTTP_500_INTERNAL_SERVER_ERROR,
+    HTTP_503_SERVICE_UNAVAILABLE,
 )
 
 from admin.auth.smtp_manager import SmtpManager
@@ -39,6 +40,7 @@ router = APIRouter()
         HTTP_201_CREATED: {"description": "Created new admin account"},
         HTTP_400_BAD_REQUEST: {"description": "Password shortage"},
         HTTP_409_CONFLICT: {"description": "Duplicate value has been requested"},
+        HTTP_503_SERVICE_UNAVAILABLE: {"description": "Bcrypt pool saturated"},
     },
     summary="관리자 회원가입",
 )
@@ -57,6 +59,7 @@ async def admin_signup_handler(
         HTTP_200_OK: {"description": "Login success"},
         HTTP_401_UNAUTHORIZED: {"description": "Wrong password"},
         HTTP_404_NOT_FOUND: {"description": "Email not found"},
+        HTTP_503_SERVICE_UNAVAILABLE: {"description": "Bcrypt pool saturated"},
     },
     summary="관리자 로그인",
 )
@@ -93,6 +96,7 @@ async def admin_logout_handler(
         HTTP_201_CREATED: {"description": "Generated new access token"},
         HTTP_401_UNAUTHORIZED: {"description": "Unauthorized refresh token"},
         HTTP_404_NOT_FOUND: {"description": "Admin not found"},
+        HTTP_503_SERVICE_UNAVAILABLE: {"description": "Bcrypt pool saturated"},
     },
     summary="Access token 재발급",
 )
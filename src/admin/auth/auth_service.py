@@ -13,6 +13,8 @@ from starlette.status import (
     HTTP_400_BAD_REQUEST,
 )
 
+from admin.auth.bcrypt_executor import bcrypt_executor
+from admin.auth.jti_cache import admin_jti_cache
 from repositories.admin_repository import AdminRepository
 from schema.login_response import LoginRes, LogoutRes
 from schema.admin_info_response import (
@@ -53,11 +55,11 @@ async def create_admin(**kwargs) -> AdminInfoResponse:
         new_account_data.nickname,
     )
 
-    admin_repository.check_uniqueness(email, nickname)
+    await admin_repository.check_uniqueness(email, nickname)
 
-    hashed_password: str = auth_manager.hash_text(password)
+    hashed_password: str = await bcrypt_executor.run(auth_manager.hash_text, password)
     new_admin: Admin = Admin.create_admin_object(email, hashed_password, nickname)
-    admin_created: Admin = admin_repository.save_admin_data(new_admin)
+    admin_created: Admin = await admin_repository.save_admin_data(new_admin)
     logger.info(f"New admin account is created: {admin_created}")
 
     return AdminInfoResponse.model_validate(admin_created)
@@ -72,13 +74,15 @@ async def admin_login(**kwargs) -> LoginRes:
         login_data.password,
     )
 
-    admin: Admin | None = admin_repository.get_admin_data(email=email)
+    admin: Admin | None = await admin_repository.get_admin_data(email=email)
     if not admin:
         raise HTTPException(
             status_code=HTTP_404_NOT_FOUND, detail="Login name not found."
         )
 
-    password_verified: bool = auth_manager.verify_text(plain_password, admin.password)
+    password_verified: bool = await bcrypt_executor.run(
+        auth_manager.verify_text, plain_password, admin.password
+    )
     if not password_verified:
         raise HTTPException(status_code=HTTP_401_UNAUTHORIZED, detail="Not Authorized")
 
@@ -90,9 +94,10 @@ async def admin_login(**kwargs) -> LoginRes:
         admin.id, admin.nickname, uuid_jti
     )
 
-    hashed_refresh_token: str = auth_manager.hash_text(refresh_token)
+    hashed_refresh_token: str = auth_manager.digest_token(refresh_token)
     admin.update_token(hashed_refresh_token, uuid_jti)
-    admin_repository.save_admin_data(admin)
+    await admin_repository.save_admin_data(admin)
+    await admin_jti_cache.update(admin.id, uuid_jti)
 
     logger.info(
         f"Admin login - Email: {admin.email}, Nickname: {admin.nickname}, Time: {datetime.now()}"
@@ -101,9 +106,10 @@ async def admin_login(**kwargs) -> LoginRes:
 
 
 async def admin_logout(admin_id: int, admin_repository: AdminRepository) -> LogoutRes:
-    admin: Admin | None = admin_repository.get_admin_data(id=admin_id)
+    admin: Admin | None = await admin_repository.get_admin_data(id=admin_id)
     admin.delete_token_jti_data()
-    admin_repository.save_admin_data(admin)
+    await admin_repository.save_admin_data(admin)
+    await admin_jti_cache.update(admin.id, None)
     logger.info(
         f"Admin logout - Email: {admin.email}, Nickname: {admin.nickname}, Time: {datetime.now()}"
     )
@@ -116,13 +122,23 @@ async def refresh_access_token(**kwargs) -> Tokens:
     auth_manager = kwargs["auth_manager"]
     admin_repository = kwargs["admin_repository"]
 
-    admin: Admin | None = admin_repository.get_admin_data(id=admin_id)
+    admin: Admin | None = await admin_repository.get_admin_data(id=admin_id)
     if not admin:
         raise HTTPException(status_code=HTTP_404_NOT_FOUND, detail="Admin not found.")
 
-    refresh_token_verified: bool = auth_manager.verify_text(
-        refresh_token, admin.hashed_refresh_token
-    )
+    hashed_refresh_token: str | None = admin.hashed_refresh_token
+    if not hashed_refresh_token:
+        refresh_token_verified = False
+    elif auth_manager.is_token_digest(hashed_refresh_token):
+        refresh_token_verified = auth_manager.verify_token_digest(
+            refresh_token, hashed_refresh_token
+        )
+    else:
+        # 이전 bcrypt 해시는 한 번만 검증, 아래에서 새 토큰을 다이제스트로 저장하며 전환
+        logger.info(f"Migrating bcrypt refresh token hash of admin {admin_id}")
+        refresh_token_verified = await bcrypt_executor.run(
+            auth_manager.verify_text, refresh_token, hashed_refresh_token
+        )
     if not refresh_token_verified:
         logger.info("Refresh token verify fail")
         raise HTTPException(
@@ -146,9 +162,10 @@ async def refresh_access_token(**kwargs) -> Tokens:
         admin.id, admin.nickname, uuid_jti
     )
 
-    hashed_refresh_token: str = auth_manager.hash_text(refresh_token)
+    hashed_refresh_token = auth_manager.digest_token(refresh_token)
     admin.update_token(hashed_refresh_token, uuid_jti)
-    admin_repository.save_admin_data(admin)
+    await admin_repository.save_admin_data(admin)
+    await admin_jti_cache.update(admin.id, uuid_jti)
 
     logger.info(
         f"Refreshed tokens - Email: {admin.email}, Nickname: {admin.nickname}, Time: {datetime.now()}"
@@ -162,7 +179,7 @@ async def send_auth_number_email(**kwargs) -> SendAuthNumResponse:
     admin_repository = kwargs["admin_repository"]
     background_tasks = kwargs["background_tasks"]
 
-    search_result = admin_repository.get_admin_data(email=email)
+    search_result = await admin_repository.get_admin_data(email=email)
     if search_result:
         raise HTTPException(
             status_code=HTTP_400_BAD_REQUEST,
@@ -245,7 +262,7 @@ async def check_nickname_uniqueness(**kwargs) -> NicknameUniquenessResponse:
     nickname = kwargs["nickname"]
     admin_repository = kwargs["admin_repository"]
 
-    search_result = admin_repository.get_admin_data(nickname=nickname)
+    search_result = await admin_repository.get_admin_data(nickname=nickname)
     if search_result:
         return NicknameUniquenessResponse(
             is_available=False, detail="Nickname already exists."
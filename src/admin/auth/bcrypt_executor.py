@@ -0,0 +1,110 @@
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from typing import Callable, TypeVar
+
+from fastapi import HTTPException
+from starlette.status import HTTP_503_SERVICE_UNAVAILABLE
+
+from config import settings
+
+logger = logging.getLogger("uvicorn")
+
+T = TypeVar("T")
+
+
+class BcryptExecutor:
+    """
+    bcrypt 해시/검증 전용 스레드 풀
+    - bcrypt 는 연산 중 GIL 을 놓으므로 스레드에서 실행하면 이벤트 루프가 멈추지 않음
+    - 실행 중 + 대기 중 작업이 pool_size + queue_size 를 넘으면 바로 503 응답
+    - 대기 시간(제출 -> 실행 시작), 실행 시간, 사용률 통계 제공
+    """
+
+    def __init__(self, pool_size: int, queue_size: int) -> None:
+        self.pool_size = pool_size
+        self.queue_size = queue_size
+        self.executor = ThreadPoolExecutor(
+            max_workers=pool_size, thread_name_prefix="bcrypt"
+        )
+        # 작업 스레드에서 갱신하는 통계용 잠금
+        self.stats_lock = Lock()
+        self.in_flight_count = 0
+        self.peak_in_flight_count = 0
+        self.active_count = 0
+        self.completed_count = 0
+        self.rejected_count = 0
+        self.total_wait_ms = 0.0
+        self.max_wait_ms = 0.0
+        self.total_run_ms = 0.0
+
+    async def run(self, func: Callable[..., T], *args) -> T:
+        # in_flight_count 는 이벤트 루프에서만 갱신
+        if self.in_flight_count >= self.pool_size + self.queue_size:
+            self.rejected_count += 1
+            logger.warning(
+                f"Bcrypt pool saturated - in_flight: {self.in_flight_count}, "
+                f"rejected: {self.rejected_count}"
+            )
+            raise HTTPException(
+                status_code=HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Authentication server is busy.",
+                headers={"Retry-After": "1"},
+            )
+
+        self.in_flight_count += 1
+        self.peak_in_flight_count = max(self.peak_in_flight_count, self.in_flight_count)
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self.executor, self.measure, time.perf_counter(), func, *args
+            )
+        finally:
+            self.in_flight_count -= 1
+
+    def measure(self, submitted_at: float, func: Callable[..., T], *args) -> T:
+        started_at = time.perf_counter()
+        wait_ms = (started_at - submitted_at) * 1000
+        with self.stats_lock:
+            self.active_count += 1
+            self.total_wait_ms += wait_ms
+            self.max_wait_ms = max(self.max_wait_ms, wait_ms)
+        try:
+            return func(*args)
+        finally:
+            run_ms = (time.perf_counter() - started_at) * 1000
+            with self.stats_lock:
+                self.active_count -= 1
+                self.completed_count += 1
+                self.total_run_ms += run_ms
+
+    def get_stats(self) -> dict:
+        with self.stats_lock:
+            active_count = self.active_count
+            completed_count = self.completed_count
+            total_wait_ms = self.total_wait_ms
+            total_run_ms = self.total_run_ms
+            max_wait_ms = self.max_wait_ms
+        return {
+            "pool_size": self.pool_size,
+            "queue_size": self.queue_size,
+            "in_flight_count": self.in_flight_count,
+            "queued_count": max(self.in_flight_count - active_count, 0),
+            "peak_in_flight_count": self.peak_in_flight_count,
+            "utilization": active_count / self.pool_size,
+            "completed_count": completed_count,
+            "rejected_count": self.rejected_count,
+            "avg_wait_ms": total_wait_ms / completed_count if completed_count else None,
+            "max_wait_ms": max_wait_ms if completed_count else None,
+            "avg_run_ms": total_run_ms / completed_count if completed_count else None,
+        }
+
+    def shutdown(self) -> None:
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+bcrypt_executor = BcryptExecutor(
+    pool_size=int(settings.bcrypt_pool_size),
+    queue_size=int(settings.bcrypt_queue_size),
+)
@@ -0,0 +1,139 @@
+import logging
+import time
+from threading import Lock
+from typing import Dict, Optional, Tuple
+from uuid import uuid4
+
+import redis
+import redis.asyncio
+from redis import RedisError
+
+from config import settings
+from database.connection import get_async_redis_client, get_redis_client
+
+logger = logging.getLogger("uvicorn")
+
+
+class AdminJtiCache:
+    """
+    관리자별 현재 토큰 jti 캐시
+    - 인증 요청마다 Admin 행을 조회하지 않도록 admin_id -> uuid_jti 를 TTL 동안 보관
+      (로그아웃 상태의 None 도 보관해 폐기된 토큰도 조회 없이 거절)
+    - 로그인/로그아웃/재발급으로 jti 가 바뀌면 update() 로 즉시 반영
+    - redis_client 가 있으면 pub/sub 채널로 다른 워커의 항목도 삭제
+      (redis 가 없거나 오류면 다른 워커는 TTL 이내에 갱신)
+    - 구독은 redis_client 의 pubsub 스레드에서, 발행은 이벤트 루프를 막지 않도록
+      publish_client(redis.asyncio) 로 처리
+    """
+
+    channel = "wip:admin:jti_invalidation"
+
+    def __init__(
+        self,
+        ttl: float,
+        redis_client: Optional[redis.Redis] = None,
+        publish_client: Optional[redis.asyncio.Redis] = None,
+    ) -> None:
+        self.ttl = ttl
+        self.redis_client = redis_client
+        self.publish_client = publish_client
+        self.worker_id = uuid4().hex[:12]
+        self.entry_map: Dict[int, Tuple[Optional[str], float]] = {}
+        self.lock = Lock()
+        # 조회 중 jti 가 바뀌었는지 확인하는 세대 번호 (fill 에서 비교)
+        self.generation = 0
+        self.pubsub_thread = None
+        self.hit_count = 0
+        self.miss_count = 0
+        self.invalidation_count = 0
+
+    def get(self, admin_id: int) -> Tuple[bool, Optional[str]]:
+        entry = self.entry_map.get(admin_id)
+        if entry is None or entry[1] < time.monotonic():
+            self.miss_count += 1
+            return False, None
+        self.hit_count += 1
+        return True, entry[0]
+
+    def fill(self, admin_id: int, uuid_jti: Optional[str], generation: int) -> None:
+        # DB 조회 사이에 jti 가 바뀌었으면 조회 결과가 이전 값일 수 있으므로 저장하지 않음
+        with self.lock:
+            if generation == self.generation:
+                self.entry_map[admin_id] = (uuid_jti, time.monotonic() + self.ttl)
+
+    async def update(self, admin_id: int, uuid_jti: Optional[str]) -> None:
+        with self.lock:
+            self.generation += 1
+            self.entry_map[admin_id] = (uuid_jti, time.monotonic() + self.ttl)
+        await self.publish(admin_id)
+
+    def invalidate(self, admin_id: int) -> None:
+        with self.lock:
+            self.generation += 1
+            self.entry_map.pop(admin_id, None)
+            self.invalidation_count += 1
+
+    def clear(self) -> None:
+        with self.lock:
+            self.generation += 1
+            self.entry_map.clear()
+
+    async def publish(self, admin_id: int) -> None:
+        if self.publish_client is None:
+            return
+        try:
+            await self.publish_client.publish(
+                self.channel, f"{self.worker_id}:{admin_id}"
+            )
+        except RedisError as e:
+            logger.error(f"RedisError: {e}")
+
+    def handle_message(self, message: dict) -> None:
+        worker_id, admin_id = message["data"].split(":")
+        if worker_id != self.worker_id:
+            self.invalidate(int(admin_id))
+
+    def handle_error(self, error: Exception, pubsub, thread) -> None:
+        # 끊긴 동안의 무효화 메시지를 놓쳤을 수 있으므로 전체 삭제 후 재구독
+        logger.error(f"Jti invalidation channel error: {error}")
+        self.clear()
+        time.sleep(1)
+
+    def start_listener(self) -> None:
+        if self.redis_client is None or self.pubsub_thread is not None:
+            return
+        try:
+            pubsub = self.redis_client.pubsub(ignore_subscribe_messages=True)
+            pubsub.subscribe(**{self.channel: self.handle_message})
+            self.pubsub_thread = pubsub.run_in_thread(
+                sleep_time=1, daemon=True, exception_handler=self.handle_error
+            )
+        except RedisError as e:
+            logger.error(f"RedisError: {e}")
+
+    def stop_listener(self) -> None:
+        if self.pubsub_thread is None:
+            return
+        self.pubsub_thread.stop()
+        self.pubsub_thread = None
+
+    def get_stats(self) -> dict:
+        return {
+            "size": len(self.entry_map),
+            "ttl": self.ttl,
+            "hit_count": self.hit_count,
+            "miss_count": self.miss_count,
+            "invalidation_count": self.invalidation_count,
+            "listening": self.pubsub_thread is not None,
+        }
+
+
+admin_jti_cache = (
+    AdminJtiCache(
+        float(settings.redis_settings.jti_cache_ttl),
+        redis_client=get_redis_client(settings.redis_settings.redis_cache_db),
+        publish_client=get_async_redis_client(settings.redis_settings.redis_cache_db),
+    )
+    if settings.redis_settings.redis_cache_enabled
+    else AdminJtiCache(float(settings.redis_settings.jti_cache_ttl))
+)
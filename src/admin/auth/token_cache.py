@@ -0,0 +1,76 @@
+import hashlib
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import NamedTuple, Optional
+
+from config import settings
+
+
+class TokenClaims(NamedTuple):
+    admin_id: int
+    uuid_jti: str
+    exp: float
+
+
+class VerifiedTokenCache:
+    """
+    서명 검증을 마친 access token 의 claim 캐시
+    - key: 토큰 원문의 SHA-256 digest (토큰 원문은 보관하지 않음)
+    - 같은 토큰이 다시 오면 서명 검증과 sub JSON 파싱을 건너뜀
+    - 항목은 토큰 자체의 exp 에 만료, 최대 max_size 개 LRU
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self.entry_map: OrderedDict[bytes, TokenClaims] = OrderedDict()
+        self.lock = Lock()
+        self.hit_count = 0
+        self.miss_count = 0
+        self.expired_count = 0
+
+    @staticmethod
+    def make_key(token: str) -> bytes:
+        return hashlib.sha256(token.encode("UTF-8")).digest()
+
+    def get(self, token: str) -> Optional[TokenClaims]:
+        if not self.max_size:
+            return None
+        key = self.make_key(token)
+        with self.lock:
+            claims = self.entry_map.get(key)
+            if claims is None:
+                self.miss_count += 1
+                return None
+            if claims.exp < time.time():
+                del self.entry_map[key]
+                self.expired_count += 1
+                self.miss_count += 1
+                return None
+            self.entry_map.move_to_end(key)
+            self.hit_count += 1
+            return claims
+
+    def set(self, token: str, claims: TokenClaims) -> None:
+        if not self.max_size:
+            return
+        key = self.make_key(token)
+        with self.lock:
+            self.entry_map[key] = claims
+            self.entry_map.move_to_end(key)
+            while len(self.entry_map) > self.max_size:
+                self.entry_map.popitem(last=False)
+
+    def get_stats(self) -> dict:
+        request_count = self.hit_count + self.miss_count
+        return {
+            "size": len(self.entry_map),
+            "max_size": self.max_size,
+            "hit_count": self.hit_count,
+            "miss_count": self.miss_count,
+            "expired_count": self.expired_count,
+            "hit_ratio": self.hit_count / request_count if request_count else None,
+        }
+
+
+verified_token_cache = VerifiedTokenCache(int(settings.verified_token_cache_size))
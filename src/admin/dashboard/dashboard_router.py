@@ -1,6 +1,8 @@
-from typing import List
+from datetime import datetime
+from typing import Optional
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Query
+from fastapi.responses import StreamingResponse
 from starlette.status import (
     HTTP_200_OK,
     HTTP_400_BAD_REQUEST,
@@ -8,12 +10,26 @@ from starlette.status import (
     HTTP_500_INTERNAL_SERVER_ERROR,
 )
 
-from admin.dashboard.dashboard_service import get_admin_log, get_integrity_error_data
+from admin.dashboard.dashboard_service import (
+    get_admin_log,
+    get_admin_log_archive_segment_list,
+    get_archived_admin_log,
+    get_integrity_error_data,
+    get_server_metrics,
+    get_search_analytics,
+)
 from admin.security import get_auth_info_from_token
 from repositories.admin_repository import AdminRepository
 from repositories.area_repository import AreaRepository
 from repositories.politician_info_repository import PoliticianInfoRepository
-from schema.dashboard_response import AdminLogRes, IntegrityErrorRes
+from repositories.search_log_repository import SearchLogRepository
+from schema.dashboard_response import (
+    AdminLogPageRes,
+    AdminLogArchiveSegmentListRes,
+    IntegrityErrorRes,
+    SearchAnalyticsRes,
+    ServerMetricsRes,
+)
 
 router = APIRouter()
 
@@ -28,16 +44,99 @@ router = APIRouter()
         HTTP_500_INTERNAL_SERVER_ERROR: {"description": "Internal server error"},
     },
     summary="관리자 활동 로그 조회",
-    description="최신순으로 목록 응답. 액션 종류: bulk_create(대량 등록), create(등록), update(수정), delete(삭제)",
+    description=(
+        "최신순으로 size 개씩 응답, 다음 페이지는 응답의 next_cursor 를 cursor 로 전달 "
+        "(마지막 페이지면 next_cursor 가 null). "
+        "액션 종류: bulk_create(대량 등록), bulk_upsert(대량 등록/수정), "
+        "create(등록), update(수정), delete(삭제)"
+    ),
 )
 async def admin_action_log_handler(
     admin_id: str = Depends(get_auth_info_from_token),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor"),
+    size: int = Query(default=20, ge=1, le=100),
+    target_admin_id: Optional[int] = Query(None, description="관리자 id 필터"),
+    action: Optional[str] = Query(None, description="액션 종류 필터"),
+    start_date: Optional[datetime] = Query(None, description="이 시각 이후(포함)"),
+    end_date: Optional[datetime] = Query(None, description="이 시각 이전(미포함)"),
     admin_repository: AdminRepository = Depends(),
-    politician_info_repository: PoliticianInfoRepository = Depends(),
-) -> List[AdminLogRes]:
+) -> AdminLogPageRes:
     return await get_admin_log(**locals())
 
 
+@router.get(
+    "/admin-log/archive/segment",
+    status_code=HTTP_200_OK,
+    responses={
+        HTTP_200_OK: {"description": "Archived admin log segment list"},
+        HTTP_401_UNAUTHORIZED: {"description": "Unauthorized"},
+    },
+    summary="보관된 관리자 활동 로그 세그먼트 목록 조회",
+)
+async def admin_log_archive_segment_list_handler(
+    admin_id: str = Depends(get_auth_info_from_token),
+    start_date: Optional[datetime] = Query(None, description="이 시각 이후(포함)"),
+    end_date: Optional[datetime] = Query(None, description="이 시각 이전(미포함)"),
+) -> AdminLogArchiveSegmentListRes:
+    return await get_admin_log_archive_segment_list(**locals())
+
+
+@router.get(
+    "/admin-log/archive",
+    status_code=HTTP_200_OK,
+    response_class=StreamingResponse,
+    responses={
+        HTTP_200_OK: {
+            "description": "Archived admin action log (NDJSON)",
+            "content": {"application/x-ndjson": {}},
+        },
+        HTTP_401_UNAUTHORIZED: {"description": "Unauthorized"},
+    },
+    summary="보관된 관리자 활동 로그 조회",
+    description=(
+        "보관 기간이 지나 테이블에서 옮겨진 로그를 오래된 순 NDJSON 으로 스트리밍 응답 "
+        "(한 줄이 admin-log 의 admin_log_list 항목과 같은 형식). "
+        "기간이 겹치는 세그먼트만 읽으므로 start_date/end_date 를 지정하는 것을 권장"
+    ),
+)
+async def archived_admin_log_handler(
+    admin_id: str = Depends(get_auth_info_from_token),
+    target_admin_id: Optional[int] = Query(None, description="관리자 id 필터"),
+    action: Optional[str] = Query(None, description="액션 종류 필터"),
+    start_date: Optional[datetime] = Query(None, description="이 시각 이후(포함)"),
+    end_date: Optional[datetime] = Query(None, description="이 시각 이전(미포함)"),
+) -> StreamingResponse:
+    return await get_archived_admin_log(**locals())
+
+
+@router.get(
+    "/search-analytics",
+    status_code=HTTP_200_OK,
+    responses={
+        HTTP_200_OK: {"description": "Public search count by category and politician"},
+        HTTP_400_BAD_REQUEST: {"description": "Bad request"},
+        HTTP_401_UNAUTHORIZED: {"description": "Unauthorized"},
+    },
+    summary="공개 검색 통계 조회",
+    description=(
+        "기간 내 검색 분류별 검색 수와 검색 수 상위 의원 목록. "
+        "분류: politician(의원 개별 조회), name/party/region(목록 조건 검색), "
+        "list(조건 없는 목록 조회)"
+    ),
+)
+async def search_analytics_handler(
+    admin_id: str = Depends(get_auth_info_from_token),
+    start_date: Optional[datetime] = Query(
+        None, description="이 시각 이후(포함), 기본값 end_date 7일 전"
+    ),
+    end_date: Optional[datetime] = Query(None, description="이 시각 이전(미포함), 기본값 현재"),
+    assembly_term: Optional[int] = Query(None, description="의원 목록 국회 회기 필터"),
+    size: int = Query(default=20, ge=1, le=100, description="의원 목록 개수"),
+    search_log_repository: SearchLogRepository = Depends(),
+) -> SearchAnalyticsRes:
+    return await get_search_analytics(**locals())
+
+
 @router.get(
     "/integrity-error",
     status_code=HTTP_200_OK,
@@ -55,3 +154,18 @@ async def integrity_error_notification_handler(
     area_repository: AreaRepository = Depends(),
 ) -> IntegrityErrorRes:
     return await get_integrity_error_data(**locals())
+
+
+@router.get(
+    "/metrics",
+    status_code=HTTP_200_OK,
+    responses={
+        HTTP_200_OK: {"description": "Server cache and worker metrics"},
+        HTTP_401_UNAUTHORIZED: {"description": "Unauthorized"},
+    },
+    summary="서버 캐시 통계 조회",
+)
+async def server_metrics_handler(
+    admin_id: str = Depends(get_auth_info_from_token),
+) -> ServerMetricsRes:
+    return await get_server_metrics(**locals())
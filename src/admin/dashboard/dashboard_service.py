@@ -1,54 +1,215 @@
+import asyncio
+import base64
+import binascii
 import logging
-from typing import List
+from datetime import datetime, timedelta
+from typing import Optional, Tuple
 
+from fastapi import HTTPException
+from fastapi.responses import StreamingResponse
+from starlette.status import HTTP_400_BAD_REQUEST
+
+from admin.admin_log_archive import admin_log_archiver
+from admin.audit_log_writer import audit_log_writer
+from admin.auth.bcrypt_executor import bcrypt_executor
+from admin.auth.jti_cache import admin_jti_cache
+from admin.auth.token_cache import verified_token_cache
+from admin.politician.bulk_import_job import bulk_import_job_queue
+from common.autocomplete import politician_autocomplete_index
+from common.ngram_index import politician_search_index
+from public.public_cache import public_politician_list_cache
+from public.public_response_cache import public_response_cache
+from public.public_search_aggregator import public_search_aggregator
+from public.public_trending import politician_trending_tracker
 from schema.dashboard_response import (
     AdminLogRes,
+    AdminLogPageRes,
+    AdminLogArchiveSegmentRes,
+    AdminLogArchiveSegmentListRes,
+    CategorySearchCountResSchema,
+    PoliticianSearchCountResSchema,
+    SearchAnalyticsRes,
     DuplicatedJurisdictionResSchema,
     DuplicatedJurisdictionPoliticianResSchema,
     IntegrityErrorRes,
+    ServerMetricsRes,
+    SnapshotCacheStatsRes,
+    ResponseCacheStatsRes,
+    SearchIndexStatsRes,
+    AutocompleteIndexStatsRes,
+    BcryptPoolStatsRes,
+    JtiCacheStatsRes,
+    VerifiedTokenCacheStatsRes,
+    BulkImportQueueStatsRes,
+    AuditLogWriterStatsRes,
+    AdminLogArchiverStatsRes,
+    SearchAggregatorStatsRes,
+    TrendingTrackerStatsRes,
 )
 
 logger = logging.getLogger("uvicorn")
 
 
-async def get_admin_log(**kwargs) -> List[AdminLogRes]:
+def encode_admin_log_cursor(created_at: datetime, admin_log_id: int) -> str:
+    return (
+        base64.urlsafe_b64encode(f"{created_at.isoformat()}|{admin_log_id}".encode())
+        .decode()
+        .rstrip("=")
+    )
+
+
+def decode_admin_log_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        created_at, admin_log_id = (
+            base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            .decode()
+            .split("|")
+        )
+        return datetime.fromisoformat(created_at), int(admin_log_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(status_code=HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+def to_local_naive_datetime(value: Optional[datetime]) -> Optional[datetime]:
+    # 로그 created_at 은 서버 로컬 시각(naive)으로 저장되므로 시간대가 있는 값은 변환
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone().replace(tzinfo=None)
+
+
+async def get_admin_log(**kwargs) -> AdminLogPageRes:
     admin_repo = kwargs["admin_repository"]
-    politician_info_repo = kwargs["politician_info_repository"]
+    cursor: Optional[str] = kwargs["cursor"]
+    size: int = kwargs["size"]
 
-    admin_log_list = admin_repo.select_admin_log_data()
-    return_res = []
-    for admin_log in admin_log_list:
-        politician_data = politician_info_repo.select_politician_data_by_id(
-            admin_log.politician_id
+    admin_log_list = await admin_repo.select_admin_log_page(
+        size,
+        decode_admin_log_cursor(cursor) if cursor else None,
+        admin_id=kwargs["target_admin_id"],
+        action=kwargs["action"],
+        start_date=to_local_naive_datetime(kwargs["start_date"]),
+        end_date=to_local_naive_datetime(kwargs["end_date"]),
+    )
+    next_cursor = None
+    if len(admin_log_list) > size:
+        admin_log_list = admin_log_list[:size]
+        next_cursor = encode_admin_log_cursor(
+            admin_log_list[-1].created_at, admin_log_list[-1].id
         )
-        data = {
-            "admin_nickname": admin_log.nickname,
-            "action": admin_log.action,
-            "politician_name": politician_data.name,
-            "created_at": admin_log.created_at,
-        }
-        return_res.append(AdminLogRes(**data))
-    return return_res
+    return AdminLogPageRes(
+        admin_log_list=[
+            AdminLogRes(
+                id=admin_log.id,
+                admin_id=admin_log.admin_id,
+                admin_nickname=admin_log.nickname,
+                action=admin_log.action,
+                politician_id=admin_log.politician_id,
+                politician_name=admin_log.politician_name,
+                detail=admin_log.detail,
+                created_at=admin_log.created_at,
+            )
+            for admin_log in admin_log_list
+        ],
+        next_cursor=next_cursor,
+    )
+
+
+async def get_admin_log_archive_segment_list(
+    **kwargs,
+) -> AdminLogArchiveSegmentListRes:
+    segment_list = await asyncio.to_thread(
+        admin_log_archiver.select_segment_list,
+        to_local_naive_datetime(kwargs["start_date"]),
+        to_local_naive_datetime(kwargs["end_date"]),
+    )
+    return AdminLogArchiveSegmentListRes(
+        retention_days=admin_log_archiver.retention_days,
+        segment_list=[AdminLogArchiveSegmentRes(**segment) for segment in segment_list],
+    )
+
+
+async def get_archived_admin_log(**kwargs) -> StreamingResponse:
+    return StreamingResponse(
+        admin_log_archiver.iter_admin_log(
+            start_date=to_local_naive_datetime(kwargs["start_date"]),
+            end_date=to_local_naive_datetime(kwargs["end_date"]),
+            admin_id=kwargs["target_admin_id"],
+            action=kwargs["action"],
+        ),
+        media_type="application/x-ndjson",
+    )
+
+
+async def get_search_analytics(**kwargs) -> SearchAnalyticsRes:
+    """
+    공개 검색 통계 (분류별, 의원별 검색 수)
+    - 기간 기본값은 최근 7일, 집계 구간 시작 시각 기준으로 포함 여부 판단
+    - 아직 삽입되지 않은 워커 메모리의 집계(최대 flush_interval 초)는 포함되지 않음
+    """
+    search_log_repo = kwargs["search_log_repository"]
+    end_date = to_local_naive_datetime(kwargs["end_date"]) or datetime.now()
+    start_date = to_local_naive_datetime(kwargs["start_date"]) or (
+        end_date - timedelta(days=7)
+    )
+    if start_date >= end_date:
+        raise HTTPException(
+            status_code=HTTP_400_BAD_REQUEST,
+            detail="start_date must be earlier than end_date",
+        )
+
+    category_list = await search_log_repo.select_search_count_by_category(
+        start_date, end_date
+    )
+    politician_list = await search_log_repo.select_search_count_by_politician(
+        start_date, end_date, kwargs["size"], kwargs["assembly_term"]
+    )
+    return SearchAnalyticsRes(
+        start_date=start_date,
+        end_date=end_date,
+        total_search_count=sum(category.search_count for category in category_list),
+        category_list=[
+            CategorySearchCountResSchema(
+                search_category=category.search_category,
+                search_count=category.search_count,
+            )
+            for category in category_list
+        ],
+        politician_list=[
+            PoliticianSearchCountResSchema(
+                politician_id=politician.politician_id,
+                name=politician.name,
+                political_party=politician.political_party,
+                search_count=politician.search_count,
+            )
+            for politician in politician_list
+        ],
+    )
 
 
 async def get_integrity_error_data(**kwargs) -> IntegrityErrorRes:
     politician_info_repo = kwargs["politician_info_repository"]
     area_repo = kwargs["area_repository"]
 
-    duplicated_jurisdiction_data_list = area_repo.get_duplicated_jurisdiction()
+    duplicated_jurisdiction_data_list = await area_repo.get_duplicated_jurisdiction()
 
     duplicated_data = []
     for constituency_data in duplicated_jurisdiction_data_list:
         constituency_id = constituency_data[0]
-        constituency_data = area_repo.select_constituency_data_by_id(constituency_id)
+        constituency_data = await area_repo.select_constituency_data_by_id(
+            constituency_id
+        )
         politician_id_list = list(
             map(
                 lambda x: x[0],
-                area_repo.select_politician_id_by_constituency_id(constituency_id),
+                await area_repo.select_politician_id_by_constituency_id(
+                    constituency_id
+                ),
             )
         )
-        politician_data_list = politician_info_repo.select_politician_data_by_id_list(
-            politician_id_list
+        politician_data_list = (
+            await politician_info_repo.select_politician_data_by_id_list(
+                politician_id_list
+            )
         )
         politician_list = [
             DuplicatedJurisdictionPoliticianResSchema(
@@ -64,3 +225,34 @@ async def get_integrity_error_data(**kwargs) -> IntegrityErrorRes:
         }
         duplicated_data.append(DuplicatedJurisdictionResSchema(**data))
     return IntegrityErrorRes(duplicated_jurisdiction=duplicated_data)
+
+
+async def get_server_metrics(**kwargs) -> ServerMetricsRes:
+    return ServerMetricsRes(
+        public_politician_list_cache=SnapshotCacheStatsRes(
+            **public_politician_list_cache.get_stats()
+        ),
+        public_response_cache=ResponseCacheStatsRes(
+            **public_response_cache.get_stats()
+        ),
+        politician_search_index=SearchIndexStatsRes(
+            **politician_search_index.get_stats()
+        ),
+        politician_autocomplete_index=AutocompleteIndexStatsRes(
+            **politician_autocomplete_index.get_stats()
+        ),
+        bcrypt_pool=BcryptPoolStatsRes(**bcrypt_executor.get_stats()),
+        admin_jti_cache=JtiCacheStatsRes(**admin_jti_cache.get_stats()),
+        verified_token_cache=VerifiedTokenCacheStatsRes(
+            **verified_token_cache.get_stats()
+        ),
+        bulk_import_queue=BulkImportQueueStatsRes(**bulk_import_job_queue.get_stats()),
+        audit_log_writer=AuditLogWriterStatsRes(**audit_log_writer.get_stats()),
+        admin_log_archiver=AdminLogArchiverStatsRes(**admin_log_archiver.get_stats()),
+        public_search_aggregator=SearchAggregatorStatsRes(
+            **public_search_aggregator.get_stats()
+        ),
+        politician_trending_tracker=TrendingTrackerStatsRes(
+            **politician_trending_tracker.get_stats()
+        ),
+    )
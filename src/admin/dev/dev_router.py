@@ -28,7 +28,7 @@ async def access_token_check_dev_handler(
 ):
     payload_data = auth_manager.decode_token(access_token=token)
 
-    admin: Admin | None = admin_repository.get_admin_data(id=admin_id)
+    admin: Admin | None = await admin_repository.get_admin_data(id=admin_id)
     if not admin:
         raise HTTPException(
             status_code=HTTP_404_NOT_FOUND, detail="Admin id not found."
@@ -0,0 +1,408 @@
+import asyncio
+import logging
+import os
+import tempfile
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Dict, List, Optional
+from uuid import uuid4
+
+from fastapi import HTTPException
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from starlette.status import (
+    HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+    HTTP_503_SERVICE_UNAVAILABLE,
+)
+
+from admin.politician.politician_import_parser import (
+    get_import_media_type,
+    parse_politician_rows,
+)
+from admin.politician.politician_service import PoliticianService
+from config import settings
+from database.connection import SessionFactory
+from repositories.bulk_import_job_repository import BulkImportJobRepository
+from schema.politician_response import (
+    BulkImportJobRes,
+    ImportBulkPoliticianDataRes,
+    ImportRowErrorResSchema,
+)
+
+logger = logging.getLogger("uvicorn")
+
+FILE_READ_SIZE = 65536
+
+
+def make_bulk_import_job_response(
+    job_id: str,
+    status: str,
+    body_bytes: int,
+    processed_count: int,
+    inserted_count: int,
+    error_count: int,
+    error_list: List[Any],
+    failure_detail: Any,
+    created_at: datetime,
+    started_at: Optional[datetime],
+    finished_at: Optional[datetime],
+) -> BulkImportJobRes:
+    elapsed_seconds = (
+        ((finished_at or datetime.now()) - started_at).total_seconds()
+        if started_at is not None
+        else 0.0
+    )
+    return BulkImportJobRes(
+        job_id=job_id,
+        status=status,
+        body_bytes=body_bytes,
+        processed_count=processed_count,
+        new_politician_data_count=inserted_count,
+        error_count=error_count,
+        errors=error_list,
+        failure_detail=failure_detail,
+        created_at=created_at,
+        started_at=started_at,
+        finished_at=finished_at,
+        elapsed_seconds=round(elapsed_seconds, 3),
+        rows_per_second=round(processed_count / elapsed_seconds, 1)
+        if elapsed_seconds > 0
+        else None,
+    )
+
+
+class BulkImportJob:
+    def __init__(
+        self, admin_id: int, content_type: str, file_path: str, body_bytes: int
+    ) -> None:
+        self.job_id = uuid4().hex
+        self.admin_id = admin_id
+        self.content_type = content_type
+        self.file_path = file_path
+        self.body_bytes = body_bytes
+        self.status = "queued"
+        self.processed_count = 0
+        self.inserted_count = 0
+        self.error_count = 0
+        self.error_list: List[ImportRowErrorResSchema] = []
+        self.failure_detail = None
+        self.created_at = datetime.now()
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+
+    def update_progress(
+        self, processed_count: int, inserted_count: int, error_count: int
+    ) -> None:
+        self.processed_count = processed_count
+        self.inserted_count = inserted_count
+        self.error_count = error_count
+
+    def start(self) -> None:
+        self.status = "running"
+        self.started_at = datetime.now()
+
+    def complete(self, result: ImportBulkPoliticianDataRes) -> None:
+        self.inserted_count = result.new_politician_data_count
+        self.error_count = result.error_count
+        self.error_list = result.errors
+        self.finish("completed")
+
+    def fail(self, failure_detail) -> None:
+        self.failure_detail = failure_detail
+        self.finish("failed")
+
+    def finish(self, status: str) -> None:
+        self.status = status
+        self.finished_at = datetime.now()
+
+    def get_elapsed_seconds(self) -> float:
+        if self.started_at is None:
+            return 0.0
+        return ((self.finished_at or datetime.now()) - self.started_at).total_seconds()
+
+    def to_row(self) -> Dict[str, Any]:
+        return {
+            "status": self.status,
+            "processed_count": self.processed_count,
+            "inserted_count": self.inserted_count,
+            "error_count": self.error_count,
+            "error_list": [error.model_dump() for error in self.error_list],
+            "failure_detail": self.failure_detail,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+    def to_response(self) -> BulkImportJobRes:
+        return make_bulk_import_job_response(
+            job_id=self.job_id,
+            status=self.status,
+            body_bytes=self.body_bytes,
+            processed_count=self.processed_count,
+            inserted_count=self.inserted_count,
+            error_count=self.error_count,
+            error_list=self.error_list,
+            failure_detail=self.failure_detail,
+            created_at=self.created_at,
+            started_at=self.started_at,
+            finished_at=self.finished_at,
+        )
+
+
+class BulkImportJobQueue:
+    """
+    대량 등록 작업 큐 (프로세스 내 asyncio 작업자)
+    - 요청 body(NDJSON/CSV)는 받는 대로 임시 파일에 기록 후 바로 job id 응답,
+      작업자가 파일을 읽으며 import_politician_stream 으로 등록
+    - 대기 작업이 queue_size 를 넘으면 503
+    - 작업 상태는 bulk_import_job 테이블에 기록 (등록/시작/종료 시, 실행 중에는 progress_interval 초마다)
+      하므로 다른 워커 프로세스나 재시작 후에도 조회 가능, 실행 중인 워커에서는 메모리의 최신 진행 상황 응답
+    - 작업은 등록한 관리자만 조회 가능
+    - 정상 종료 시 끝나지 않은 작업은 실패로 기록, 비정상 종료로 job_timeout 초 넘게 진행 상황이
+      기록되지 않은 실행 중 작업은 시작 시 fail_stale_jobs() 로 실패 처리
+    """
+
+    def __init__(
+        self,
+        worker_count: int,
+        queue_size: int,
+        max_body_bytes: int,
+        progress_interval: float = 1.0,
+        job_timeout: float = 600.0,
+        session_factory: async_sessionmaker = SessionFactory,
+    ) -> None:
+        self.worker_count = worker_count
+        self.queue_size = queue_size
+        self.max_body_bytes = max_body_bytes
+        self.progress_interval = progress_interval
+        self.job_timeout = job_timeout
+        self.session_factory = session_factory
+        self.queue: Optional[asyncio.Queue] = None
+        self.worker_task_list: List[asyncio.Task] = []
+        # 이 프로세스에서 대기/실행 중인 작업
+        self.job_map: Dict[str, BulkImportJob] = {}
+        self.submitted_count = 0
+        self.rejected_count = 0
+        self.completed_count = 0
+        self.failed_count = 0
+
+    def start(self) -> None:
+        if self.queue is not None:
+            return
+        self.queue = asyncio.Queue(maxsize=self.queue_size)
+        self.worker_task_list = [
+            asyncio.create_task(self.run_worker()) for _ in range(self.worker_count)
+        ]
+
+    async def stop(self) -> None:
+        for worker_task in self.worker_task_list:
+            worker_task.cancel()
+        await asyncio.gather(*self.worker_task_list, return_exceptions=True)
+        self.worker_task_list = []
+        self.queue = None
+        for job in list(self.job_map.values()):
+            job.fail("Server shut down before the job finished")
+            self.remove_file(job)
+            await self.save_job(job)
+            del self.job_map[job.job_id]
+
+    async def submit(
+        self, admin_id: int, content_type: str, byte_stream: AsyncIterator[bytes]
+    ) -> BulkImportJob:
+        get_import_media_type(content_type)
+        self.start()
+        if self.queue.full():
+            self.reject()
+
+        file_descriptor, file_path = tempfile.mkstemp(prefix="wip_bulk_import_")
+        body_bytes = 0
+        try:
+            with os.fdopen(file_descriptor, "wb") as file:
+                async for chunk in byte_stream:
+                    body_bytes += len(chunk)
+                    if body_bytes > self.max_body_bytes:
+                        raise HTTPException(
+                            status_code=HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                            detail="Request body too large",
+                        )
+                    await asyncio.to_thread(file.write, chunk)
+            job = BulkImportJob(admin_id, content_type, file_path, body_bytes)
+            # 작업자가 시작 상태를 기록하기 전에 행이 있도록 큐에 넣기 전에 삽입
+            async with self.session_factory() as session:
+                await BulkImportJobRepository(session).insert_bulk_import_job(
+                    {
+                        "id": job.job_id,
+                        "admin_id": admin_id,
+                        "body_bytes": body_bytes,
+                        "created_at": job.created_at,
+                        **job.to_row(),
+                    }
+                )
+                await session.commit()
+            try:
+                self.queue.put_nowait(job)
+            except asyncio.QueueFull:
+                job.fail("Bulk import queue is full.")
+                await self.save_job(job)
+                self.reject()
+        except BaseException:
+            os.remove(file_path)
+            raise
+
+        self.job_map[job.job_id] = job
+        self.submitted_count += 1
+        logger.info(
+            f"admin {admin_id} submitted bulk import job {job.job_id} "
+            f"({body_bytes} bytes)"
+        )
+        return job
+
+    def reject(self) -> None:
+        self.rejected_count += 1
+        raise HTTPException(
+            status_code=HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Bulk import queue is full.",
+            headers={"Retry-After": "10"},
+        )
+
+    async def fail_stale_jobs(self) -> None:
+        updated_before = datetime.now() - timedelta(seconds=self.job_timeout)
+        try:
+            async with self.session_factory() as session:
+                stale_job_count = await BulkImportJobRepository(
+                    session
+                ).update_stale_bulk_import_job(
+                    updated_before,
+                    {
+                        "status": "failed",
+                        "failure_detail": "Worker stopped before the job finished",
+                        "finished_at": datetime.now(),
+                    },
+                )
+                await session.commit()
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to fail stale bulk import jobs: {e}")
+            return
+        if stale_job_count:
+            logger.warning(f"Marked {stale_job_count} stale bulk import jobs as failed")
+
+    async def get_job(self, job_id: str, admin_id: int) -> Optional[BulkImportJobRes]:
+        job = self.job_map.get(job_id)
+        if job is not None:
+            return job.to_response() if job.admin_id == admin_id else None
+        async with self.session_factory() as session:
+            job_row = await BulkImportJobRepository(session).select_bulk_import_job(
+                job_id, admin_id
+            )
+        if job_row is None:
+            return None
+        return make_bulk_import_job_response(
+            job_id=job_row.id,
+            status=job_row.status,
+            body_bytes=job_row.body_bytes,
+            processed_count=job_row.processed_count,
+            inserted_count=job_row.inserted_count,
+            error_count=job_row.error_count,
+            error_list=job_row.error_list or [],
+            failure_detail=job_row.failure_detail,
+            created_at=job_row.created_at,
+            started_at=job_row.started_at,
+            finished_at=job_row.finished_at,
+        )
+
+    async def save_job(self, job: BulkImportJob) -> None:
+        try:
+            async with self.session_factory() as session:
+                await BulkImportJobRepository(session).update_bulk_import_job(
+                    job.job_id, job.to_row()
+                )
+                await session.commit()
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to save bulk import job {job.job_id}: {e}")
+
+    async def run_progress_saver(self, job: BulkImportJob) -> None:
+        while True:
+            await asyncio.sleep(self.progress_interval)
+            await self.save_job(job)
+
+    async def run_worker(self) -> None:
+        while True:
+            job = await self.queue.get()
+            try:
+                await self.run_job(job)
+            finally:
+                self.queue.task_done()
+
+    async def run_job(self, job: BulkImportJob) -> None:
+        job.start()
+        await self.save_job(job)
+        progress_saver_task = asyncio.create_task(self.run_progress_saver(job))
+        try:
+            result = await PoliticianService(
+                self.session_factory()
+            ).import_politician_stream(
+                job.admin_id,
+                parse_politician_rows(
+                    job.content_type,
+                    self.read_file(job.file_path),
+                    int(settings.bulk_import_max_line_bytes),
+                ),
+                progress_callback=job.update_progress,
+            )
+            job.complete(result)
+            self.completed_count += 1
+        except HTTPException as e:
+            job.fail(e.detail)
+            self.failed_count += 1
+        except Exception as e:
+            logger.exception(f"Bulk import job {job.job_id} failed: {e}")
+            job.fail(str(e))
+            self.failed_count += 1
+        finally:
+            progress_saver_task.cancel()
+            await asyncio.gather(progress_saver_task, return_exceptions=True)
+            self.remove_file(job)
+        await self.save_job(job)
+        self.job_map.pop(job.job_id, None)
+        logger.info(
+            f"Bulk import job {job.job_id} {job.status} - "
+            f"processed: {job.processed_count}, inserted: {job.inserted_count}, "
+            f"errors: {job.error_count}, elapsed: {job.get_elapsed_seconds():.2f}s"
+        )
+
+    @staticmethod
+    async def read_file(file_path: str) -> AsyncIterator[bytes]:
+        with open(file_path, "rb") as file:
+            while True:
+                chunk = await asyncio.to_thread(file.read, FILE_READ_SIZE)
+                if not chunk:
+                    return
+                yield chunk
+
+    @staticmethod
+    def remove_file(job: BulkImportJob) -> None:
+        try:
+            os.remove(job.file_path)
+        except FileNotFoundError:
+            pass
+
+    def get_stats(self) -> dict:
+        return {
+            "worker_count": self.worker_count,
+            "queue_size": self.queue_size,
+            "queued_count": self.queue.qsize() if self.queue is not None else 0,
+            "running_count": sum(
+                job.status == "running" for job in self.job_map.values()
+            ),
+            "submitted_count": self.submitted_count,
+            "rejected_count": self.rejected_count,
+            "completed_count": self.completed_count,
+            "failed_count": self.failed_count,
+        }
+
+
+bulk_import_job_queue = BulkImportJobQueue(
+    int(settings.bulk_import_worker_count),
+    int(settings.bulk_import_queue_size),
+    int(settings.bulk_import_max_body_bytes),
+    float(settings.bulk_import_progress_interval),
+    float(settings.bulk_import_job_timeout),
+)
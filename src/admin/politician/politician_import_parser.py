@@ -0,0 +1,218 @@
+import csv
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException
+from pydantic import ValidationError
+from starlette.status import HTTP_400_BAD_REQUEST, HTTP_415_UNSUPPORTED_MEDIA_TYPE
+
+from schema.politician_request import (
+    SinglePoliticianRequest,
+    PoliticianReqSchema,
+    PromiseCountDetailReqSchema,
+)
+
+# (줄 번호, 검증된 요청) 또는 (줄 번호, 오류 메시지)
+ParsedRow = Tuple[int, Optional[SinglePoliticianRequest], Optional[str]]
+
+NDJSON_CONTENT_TYPE_SET = {"application/x-ndjson", "application/jsonl"}
+CSV_CONTENT_TYPE_SET = {"text/csv"}
+
+CSV_BASE_INFO_COLUMN_SET = set(PoliticianReqSchema.model_fields)
+CSV_PROMISE_COUNT_DETAIL_COLUMN_SET = set(PromiseCountDetailReqSchema.model_fields)
+CSV_CONSTITUENCY_COLUMN = "constituency"
+CSV_MAIN_COMMITTEE_COLUMN = "main_committee"
+CSV_COMMITTEE_COLUMN = "committee"
+CSV_COLUMN_SET = (
+    CSV_BASE_INFO_COLUMN_SET
+    | CSV_PROMISE_COUNT_DETAIL_COLUMN_SET
+    | {CSV_CONSTITUENCY_COLUMN, CSV_MAIN_COMMITTEE_COLUMN, CSV_COMMITTEE_COLUMN}
+)
+
+
+def format_validation_error(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(map(str, detail['loc'])) or 'body'}: {detail['msg']}"
+        for detail in error.errors(include_url=False)
+    )
+
+
+async def iter_body_lines(
+    byte_stream: AsyncIterator[bytes], max_line_bytes: int
+) -> AsyncIterator[Tuple[int, Optional[str]]]:
+    """
+    요청 body 를 받은 만큼만 줄 단위로 나눠 (줄 번호, 문자열) 반환
+    - 한 줄이 max_line_bytes 를 넘으면 나머지를 버리고 None 반환 (버퍼가 계속 커지지 않도록)
+    - 줄 번호는 1부터 시작, 빈 줄도 번호는 셈
+    """
+    buffer = bytearray()
+    line_number = 0
+    is_discarding = False
+    async for chunk in byte_stream:
+        start = 0
+        while True:
+            end = chunk.find(b"\n", start)
+            if end < 0:
+                if not is_discarding:
+                    buffer.extend(chunk[start:])
+                    if len(buffer) > max_line_bytes:
+                        buffer.clear()
+                        is_discarding = True
+                break
+            line_number += 1
+            if is_discarding:
+                is_discarding = False
+                yield line_number, None
+            else:
+                buffer.extend(chunk[start:end])
+                if len(buffer) > max_line_bytes:
+                    yield line_number, None
+                else:
+                    yield line_number, decode_line(buffer, line_number)
+            buffer.clear()
+            start = end + 1
+    if is_discarding:
+        yield line_number + 1, None
+    elif buffer:
+        yield line_number + 1, decode_line(buffer, line_number + 1)
+
+
+def decode_line(buffer: bytearray, line_number: int) -> str:
+    line = bytes(buffer).decode("utf-8", errors="replace").rstrip("\r")
+    # 엑셀에서 저장한 UTF-8 CSV 의 BOM 제거
+    return line.lstrip("\ufeff") if line_number == 1 else line
+
+
+async def parse_ndjson_rows(
+    line_iterator: AsyncIterator[Tuple[int, Optional[str]]]
+) -> AsyncIterator[ParsedRow]:
+    async for line_number, line in line_iterator:
+        if line is None:
+            yield line_number, None, "Line too long"
+            continue
+        if not line.strip():
+            continue
+        try:
+            yield line_number, SinglePoliticianRequest.model_validate_json(line), None
+        except ValidationError as e:
+            yield line_number, None, format_validation_error(e)
+
+
+def split_csv_cell(value: str) -> List[str]:
+    return [item.strip() for item in value.split(";") if item.strip()]
+
+
+def make_request_data_from_csv_row(row: Dict[str, str]) -> dict:
+    """
+    CSV 한 행을 SinglePoliticianRequest 형식으로 변환
+    - 기본 정보/공약 수 세부 항목은 필드명 그대로의 열, 빈 칸은 값 없음
+    - constituency: "지역/세부 지역구/분구" 를 ';' 로 구분 (예: "서울/종로구/갑")
+    - main_committee, committee: 위원회 이름을 ';' 로 구분
+    """
+    base_info = {}
+    promise_count_detail = {}
+    for column, value in row.items():
+        if not value:
+            continue
+        if column in CSV_BASE_INFO_COLUMN_SET:
+            base_info[column] = value
+        elif column in CSV_PROMISE_COUNT_DETAIL_COLUMN_SET:
+            promise_count_detail[column] = value
+
+    constituency_list = []
+    for constituency in split_csv_cell(row.get(CSV_CONSTITUENCY_COLUMN) or ""):
+        region, district, section = (constituency.split("/") + [None, None])[:3]
+        constituency_list.append(
+            {"region": region, "district": district or None, "section": section or None}
+        )
+
+    committee_list = [
+        {"is_main": True, "name": name}
+        for name in split_csv_cell(row.get(CSV_MAIN_COMMITTEE_COLUMN) or "")
+    ] + [
+        {"is_main": False, "name": name}
+        for name in split_csv_cell(row.get(CSV_COMMITTEE_COLUMN) or "")
+    ]
+    return {
+        "base_info": base_info,
+        "promise_count_detail": promise_count_detail,
+        "constituency": constituency_list,
+        "committee": committee_list,
+    }
+
+
+async def parse_csv_rows(
+    line_iterator: AsyncIterator[Tuple[int, Optional[str]]]
+) -> AsyncIterator[ParsedRow]:
+    """
+    첫 줄은 헤더, 한 행은 한 줄 (따옴표 안의 줄바꿈은 지원하지 않음)
+    """
+    column_list = None
+    async for line_number, line in line_iterator:
+        if line is None:
+            if column_list is None:
+                raise HTTPException(
+                    status_code=HTTP_400_BAD_REQUEST, detail="CSV header too long"
+                )
+            yield line_number, None, "Line too long"
+            continue
+        if not line.strip():
+            continue
+        try:
+            cell_list = next(csv.reader([line], strict=True))
+        except csv.Error as e:
+            if column_list is None:
+                raise HTTPException(
+                    status_code=HTTP_400_BAD_REQUEST, detail=f"CSV header error: {e}"
+                )
+            yield line_number, None, f"CSV error: {e}"
+            continue
+
+        if column_list is None:
+            column_list = [column.strip() for column in cell_list]
+            unknown_column_list = [
+                column for column in column_list if column not in CSV_COLUMN_SET
+            ]
+            if unknown_column_list:
+                raise HTTPException(
+                    status_code=HTTP_400_BAD_REQUEST,
+                    detail={
+                        "message": "Unknown CSV column",
+                        "unknown_column": unknown_column_list,
+                    },
+                )
+            continue
+
+        if len(cell_list) != len(column_list):
+            yield line_number, None, (
+                f"Column count mismatch: expected {len(column_list)}, "
+                f"got {len(cell_list)}"
+            )
+            continue
+        try:
+            yield line_number, SinglePoliticianRequest.model_validate(
+                make_request_data_from_csv_row(
+                    dict(zip(column_list, (cell.strip() for cell in cell_list)))
+                )
+            ), None
+        except ValidationError as e:
+            yield line_number, None, format_validation_error(e)
+
+
+def get_import_media_type(content_type: str) -> str:
+    media_type = content_type.split(";")[0].strip().lower()
+    if media_type not in NDJSON_CONTENT_TYPE_SET | CSV_CONTENT_TYPE_SET:
+        raise HTTPException(
+            status_code=HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail=f"Unsupported content type: {media_type or None}",
+        )
+    return media_type
+
+
+def parse_politician_rows(
+    content_type: str, byte_stream: AsyncIterator[bytes], max_line_bytes: int
+) -> AsyncIterator[ParsedRow]:
+    media_type = get_import_media_type(content_type)
+    line_iterator = iter_body_lines(byte_stream, max_line_bytes)
+    if media_type in NDJSON_CONTENT_TYPE_SET:
+        return parse_ndjson_rows(line_iterator)
+    return parse_csv_rows(line_iterator)
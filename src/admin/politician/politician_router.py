@@ -1,23 +1,40 @@
 import logging
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, Path, Query
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request
 from starlette.status import (
     HTTP_201_CREATED,
     HTTP_400_BAD_REQUEST,
     HTTP_401_UNAUTHORIZED,
     HTTP_200_OK,
+    HTTP_202_ACCEPTED,
+    HTTP_404_NOT_FOUND,
+    HTTP_409_CONFLICT,
+    HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+    HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+    HTTP_503_SERVICE_UNAVAILABLE,
 )
 
+from admin.politician.bulk_import_job import bulk_import_job_queue
+
+from admin.politician.politician_import_parser import parse_politician_rows
+
 from admin.politician.politician_service import PoliticianService
 from admin.security import get_auth_info_from_token
+from config import settings
 from schema.politician_request import (
     SinglePoliticianRequest,
     SinglePoliticianUpdateRequest,
+    SinglePoliticianPatchRequest,
 )
 from schema.politician_response import (
     AddPoliticianDataRes,
     AddBulkPoliticianDataRes,
+    PatchPoliticianDataRes,
+    ImportBulkPoliticianDataRes,
+    UpsertBulkPoliticianDataRes,
+    SubmitBulkImportJobRes,
+    BulkImportJobRes,
     GetSinglePoliticianDataRes,
     GetPoliticianElementOfListRes,
     ConstituencyResSchema,
@@ -65,6 +82,107 @@ async def add_politician_bulk_handler(
     return await politician_service.create_bulk_politician_data(**locals())
 
 
+@router.put(
+    "/bulk",
+    status_code=HTTP_200_OK,
+    responses={
+        HTTP_200_OK: {"description": "Upserted multiple politician data"},
+        HTTP_400_BAD_REQUEST: {"description": "Bad request"},
+        HTTP_401_UNAUTHORIZED: {"description": "Unauthorized"},
+        HTTP_409_CONFLICT: {"description": "Duplicated politician data exists"},
+    },
+    summary="국회의원 데이터 대량 등록/수정(엑셀 재등록용)",
+    description=(
+        "(assembly_term, name, political_party) 가 같은 의원이 있으면 바뀐 필드만 수정, "
+        "없으면 새로 등록. 위원회/지역구는 새로 등록하는 의원에만 반영"
+    ),
+)
+async def upsert_politician_bulk_handler(
+    request: List[SinglePoliticianRequest],
+    admin_id: str = Depends(get_auth_info_from_token),
+    politician_service: PoliticianService = Depends(),
+) -> UpsertBulkPoliticianDataRes:
+    return await politician_service.upsert_bulk_politician_data(**locals())
+
+
+@router.post(
+    "/bulk/stream",
+    status_code=HTTP_201_CREATED,
+    responses={
+        HTTP_201_CREATED: {"description": "Imported politician data with row errors"},
+        HTTP_400_BAD_REQUEST: {"description": "Bad CSV header"},
+        HTTP_401_UNAUTHORIZED: {"description": "Unauthorized"},
+        HTTP_415_UNSUPPORTED_MEDIA_TYPE: {"description": "Unsupported content type"},
+    },
+    summary="국회의원 데이터 대량 추가(NDJSON/CSV 스트리밍)",
+    description=(
+        "Content-Type: application/x-ndjson 이면 한 줄에 SinglePoliticianRequest JSON 하나, "
+        "text/csv 이면 첫 줄 헤더(기본 정보/공약 수 필드명, constituency, main_committee, "
+        "committee). constituency 는 '서울/종로구/갑' 을 ';' 로 구분, 위원회는 이름을 ';' 로 구분. "
+        "오류 행은 줄 번호와 함께 응답하고 나머지 행은 등록"
+    ),
+)
+async def import_politician_stream_handler(
+    request: Request,
+    admin_id: str = Depends(get_auth_info_from_token),
+    politician_service: PoliticianService = Depends(),
+) -> ImportBulkPoliticianDataRes:
+    parsed_row_iterator = parse_politician_rows(
+        request.headers.get("content-type", ""),
+        request.stream(),
+        int(settings.bulk_import_max_line_bytes),
+    )
+    return await politician_service.import_politician_stream(
+        admin_id, parsed_row_iterator
+    )
+
+
+@router.post(
+    "/bulk/jobs",
+    status_code=HTTP_202_ACCEPTED,
+    responses={
+        HTTP_202_ACCEPTED: {"description": "Submitted bulk import job"},
+        HTTP_401_UNAUTHORIZED: {"description": "Unauthorized"},
+        HTTP_413_REQUEST_ENTITY_TOO_LARGE: {"description": "Request body too large"},
+        HTTP_415_UNSUPPORTED_MEDIA_TYPE: {"description": "Unsupported content type"},
+        HTTP_503_SERVICE_UNAVAILABLE: {"description": "Bulk import queue is full"},
+    },
+    summary="국회의원 데이터 대량 추가 작업 등록(NDJSON/CSV)",
+    description=(
+        "/bulk/stream 과 같은 형식의 body 를 받아 작업으로 등록하고 job id 를 바로 응답. "
+        "진행 상황은 GET /bulk/jobs/{job_id} 로 조회"
+    ),
+)
+async def submit_bulk_import_job_handler(
+    request: Request,
+    admin_id: str = Depends(get_auth_info_from_token),
+) -> SubmitBulkImportJobRes:
+    job = await bulk_import_job_queue.submit(
+        int(admin_id), request.headers.get("content-type", ""), request.stream()
+    )
+    return SubmitBulkImportJobRes(job_id=job.job_id, status=job.status)
+
+
+@router.get(
+    "/bulk/jobs/{job_id}",
+    status_code=HTTP_200_OK,
+    responses={
+        HTTP_200_OK: {"description": "Get bulk import job progress"},
+        HTTP_401_UNAUTHORIZED: {"description": "Unauthorized"},
+        HTTP_404_NOT_FOUND: {"description": "Job not found"},
+    },
+    summary="국회의원 데이터 대량 추가 작업 진행 상황 조회",
+)
+async def get_bulk_import_job_handler(
+    admin_id: str = Depends(get_auth_info_from_token),
+    job_id: str = Path(..., description="작업 id"),
+) -> BulkImportJobRes:
+    job = await bulk_import_job_queue.get_job(job_id, int(admin_id))
+    if job is None:
+        raise HTTPException(status_code=HTTP_404_NOT_FOUND, detail="Job not found")
+    return job
+
+
 @router.put(
     "",
     status_code=HTTP_200_OK,
@@ -84,6 +202,30 @@ async def update_single_politician_handler(
     return await politician_service.update_single_politician_data(**locals())
 
 
+@router.patch(
+    "",
+    status_code=HTTP_200_OK,
+    responses={
+        HTTP_200_OK: {"description": "Patched politician data"},
+        HTTP_400_BAD_REQUEST: {"description": "Bad request"},
+        HTTP_401_UNAUTHORIZED: {"description": "Unauthorized"},
+        HTTP_404_NOT_FOUND: {"description": "Politician not found"},
+    },
+    summary="국회의원 데이터 부분 수정",
+    description=(
+        "바뀐 필드만 전달. committee 는 added/updated(id 필수)/deleted(id 목록), "
+        "jurisdiction 은 added(지역구)/deleted(jurisdiction id 목록)로 전달. "
+        "응답의 changed_field_list 는 실제로 값이 바뀐 항목"
+    ),
+)
+async def patch_single_politician_handler(
+    request: SinglePoliticianPatchRequest,
+    admin_id: str = Depends(get_auth_info_from_token),
+    politician_service: PoliticianService = Depends(),
+) -> PatchPoliticianDataRes:
+    return await politician_service.patch_single_politician_data(**locals())
+
+
 @router.get(
     "/single/{assembly_term}/{politician_id}",
     status_code=HTTP_200_OK,
@@ -100,7 +242,7 @@ async def get_single_politician_handler(
     politician_service: PoliticianService = Depends(),
 ) -> GetSinglePoliticianDataRes:
     logger.info(f"admin {admin_id} called get_single_politician_handler")
-    return politician_service.get_politician_by_id(politician_id)
+    return await politician_service.get_politician_by_id(politician_id)
 
 
 @router.get(
@@ -119,7 +261,7 @@ async def get_constituency_handler(
     politician_service: PoliticianService = Depends(),
 ) -> List[ConstituencyResSchema]:
     logger.info(f"admin {admin_id} called get_constituency_handler")
-    return politician_service.get_constituency_data(region)
+    return await politician_service.get_constituency_data(region)
 
 
 @router.get(
@@ -140,7 +282,7 @@ async def get_politician_list_handler(
     politician_service: PoliticianService = Depends(),
 ) -> List[GetPoliticianElementOfListRes]:
     logger.info(f"admin {admin_id} called get_politician_list_handler")
-    return politician_service.get_politician_list(assembly_term, page, size)
+    return await politician_service.get_politician_list(assembly_term, page, size)
 
 
 @router.get(
@@ -164,7 +306,7 @@ async def get_politician_list_by_keyword_handler(
     politician_service: PoliticianService = Depends(),
 ) -> List[GetPoliticianElementOfListRes]:
     logger.info(f"admin {admin_id} called get_politician_list_by_keyword_handler")
-    return politician_service.get_politician_search_data(
+    return await politician_service.get_politician_search_data(
         assembly_term=assembly_term,
         name=name,
         party=party,
@@ -1,21 +1,41 @@
 import logging
-import re
-from itertools import chain
-from typing import List
+from typing import AsyncIterator, Callable, Dict, List, Optional, Tuple
 
 from fastapi import Depends, HTTPException
 from sqlalchemy.exc import DatabaseError
-from sqlalchemy.orm import Session
-from starlette.status import HTTP_500_INTERNAL_SERVER_ERROR
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.status import (
+    HTTP_400_BAD_REQUEST,
+    HTTP_404_NOT_FOUND,
+    HTTP_409_CONFLICT,
+    HTTP_500_INTERNAL_SERVER_ERROR,
+)
 
+from admin.audit_log_writer import audit_log_writer
+from admin.politician.politician_import_parser import ParsedRow
+from common.data_version import politician_data_version
 from common.enums import RegionType
+from common.ngram_index import politician_search_index
+from config import settings
 from database.connection import get_db
+from database.models import Politician, PromiseCountDetail
 from repositories.admin_repository import AdminRepository
 from repositories.area_repository import AreaRepository
-from repositories.politician_info_repository import PoliticianInfoRepository
+from repositories.politician_info_repository import (
+    InsertedPoliticianIdError,
+    PoliticianInfoRepository,
+)
+from schema.politician_request import (
+    SinglePoliticianRequest,
+    SinglePoliticianPatchRequest,
+)
 from schema.politician_response import (
     AddPoliticianDataRes,
     AddBulkPoliticianDataRes,
+    PatchPoliticianDataRes,
+    ImportBulkPoliticianDataRes,
+    ImportRowErrorResSchema,
+    UpsertBulkPoliticianDataRes,
     GetSinglePoliticianDataRes,
     JurisdictionResSchema,
     GetPoliticianElementOfListRes,
@@ -26,43 +46,57 @@ logger = logging.getLogger("uvicorn")
 
 
 class PoliticianService:
-    def __init__(self, session: Session = Depends(get_db)) -> None:
+    def __init__(self, session: AsyncSession = Depends(get_db)) -> None:
         self.session = session
         self.politician_info_repo = PoliticianInfoRepository(session)
         self.area_repo = AreaRepository(session)
         self.admin_repo = AdminRepository(session)
 
+    @staticmethod
+    async def invalidate_public_cache(
+        politician_data_list: List[Tuple[int, dict]]
+    ) -> None:
+        new_data_version = await politician_data_version.bump()
+        politician_search_index.apply_changes(politician_data_list, new_data_version)
+
     async def create_new_politician_data(self, **kwargs) -> AddPoliticianDataRes:
         admin_id = kwargs["admin_id"]
         new_politician_data = kwargs["request"]
 
         try:
-            new_politician_id: int = self.politician_info_repo.insert_politician_data(
-                new_politician_data.base_info
+            new_politician_id: int = (
+                await self.politician_info_repo.insert_politician_data(
+                    new_politician_data.base_info
+                )
             )
-            self.politician_info_repo.insert_promise_count_detail_data(
+            await self.politician_info_repo.insert_promise_count_detail_data(
                 new_politician_id, new_politician_data.promise_count_detail
             )
             if new_politician_data.committee:
-                self.politician_info_repo.insert_committee_data(
+                await self.politician_info_repo.insert_committee_data(
                     new_politician_id, new_politician_data.committee
                 )
-            for constituency_data in new_politician_data.constituency:
-                constituency_id = self.area_repo.get_constituency_id(constituency_data)
-                self.area_repo.insert_jurisdiction_data(
+            constituency_id_list = await self.area_repo.get_constituency_id_list(
+                new_politician_data.constituency
+            )
+            for constituency_id in constituency_id_list:
+                await self.area_repo.insert_jurisdiction_data(
                     new_politician_id, constituency_id
                 )
 
-            self.admin_repo.insert_admin_log_data(admin_id, "create", new_politician_id)
-            self.session.commit()
+            await self.session.commit()
+            audit_log_writer.record(admin_id, "create", new_politician_id)
+            await self.invalidate_public_cache(
+                [(new_politician_id, new_politician_data.base_info.model_dump())]
+            )
         except DatabaseError as e:
-            self.session.rollback()
+            await self.session.rollback()
             logger.exception(str(e))
             raise HTTPException(
                 status_code=HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
             )
         finally:
-            self.session.close()
+            await self.session.close()
 
         logger.info(f"admin {admin_id} inserted politician data: {new_politician_data}")
         return AddPoliticianDataRes(politician_id=new_politician_id)
@@ -72,84 +106,414 @@ class PoliticianService:
         new_politician_data_list = kwargs["request"]
 
         try:
-            parsed_politician_data = [
-                single_politician.base_info.model_dump()
-                for single_politician in new_politician_data_list
-            ]
-            inserted_politician_id_list = (
-                self.politician_info_repo.bulk_insert_politician_data(
-                    parsed_politician_data
+            # 요청 전체의 지역구를 먼저 변환해 없는 지역구를 한 번에 보고
+            bulk_constituency_id_list = (
+                await self.area_repo.get_bulk_constituency_id_list(
+                    [politician.constituency for politician in new_politician_data_list]
                 )
             )
-
-            committee_data_list = list(
-                chain.from_iterable(
-                    [
-                        [
-                            {"politician_id": politician_id, **committee.dict()}
-                            for committee in politician.committee
-                        ]
-                        for politician_id, politician in zip(
-                            inserted_politician_id_list, new_politician_data_list
-                        )
-                    ]
+            # 묶음 단위로 삽입해 한 번에 만드는 행 데이터 크기를 제한 (전체는 한 트랜잭션)
+            chunk_size = int(settings.bulk_insert_chunk_size)
+            inserted_politician_data_list = []
+            for start in range(0, len(new_politician_data_list), chunk_size):
+                inserted_politician_data_list.extend(
+                    await self.insert_politician_chunk(
+                        new_politician_data_list[start : start + chunk_size],
+                        bulk_constituency_id_list[start : start + chunk_size],
+                    )
                 )
-            )
-            self.politician_info_repo.bulk_insert_committee_data(committee_data_list)
 
-            promise_count_detail_data_list = list(
-                chain.from_iterable(
-                    [
-                        [
-                            {
-                                "politician_id": politician_id,
-                                **politician.promise_count_detail.dict(),
-                            }
-                        ]
-                        for politician_id, politician in zip(
-                            inserted_politician_id_list, new_politician_data_list
-                        )
-                    ]
-                )
+            await self.session.commit()
+            audit_log_writer.record(
+                admin_id,
+                "bulk_create",
+                detail={"inserted": len(inserted_politician_data_list)},
             )
-            self.politician_info_repo.bulk_insert_promise_count_detail_data(
-                promise_count_detail_data_list
+            await self.invalidate_public_cache(inserted_politician_data_list)
+        except (DatabaseError, InsertedPoliticianIdError) as e:
+            await self.session.rollback()
+            logger.exception(str(e))
+            raise HTTPException(
+                status_code=HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
             )
+        finally:
+            await self.session.close()
 
-            jurisdiction_data_list = list(
-                chain.from_iterable(
-                    [
-                        [
-                            {
-                                "politician_id": politician_id,
-                                "constituency_id": self.area_repo.get_constituency_id(
-                                    constituency
-                                ),
-                            }
-                            for constituency in politician.constituency
-                        ]
-                        for politician_id, politician in zip(
-                            inserted_politician_id_list, new_politician_data_list
-                        )
-                    ]
+        data_count = len(new_politician_data_list)
+        logger.info(f"admin {admin_id} inserted {data_count} politician data")
+        return AddBulkPoliticianDataRes(new_politician_data_count=data_count)
+
+    @staticmethod
+    def get_politician_key(politician: SinglePoliticianRequest) -> Tuple[int, str, str]:
+        base_info = politician.base_info
+        return base_info.assembly_term, base_info.name, base_info.political_party
+
+    async def upsert_bulk_politician_data(
+        self, **kwargs
+    ) -> UpsertBulkPoliticianDataRes:
+        """
+        (assembly_term, name, political_party) 기준 대량 등록/수정
+        - 같은 키의 의원이 없으면 새로 등록, 있으면 기본 정보/공약 수 세부 정보를 필드별로 비교해
+          바뀐 컬럼만 수정 (요청에 없는 필드는 비교하지 않고 그대로 둠)
+        - 위원회/지역구는 새로 등록하는 의원에만 반영
+        - 같은 데이터를 다시 올리면 쓰기 없이 unchanged 로 집계
+        """
+        admin_id = kwargs["admin_id"]
+        politician_data_list = kwargs["request"]
+
+        politician_index_map: Dict[Tuple[int, str, str], int] = {}
+        duplicate_politician_list = []
+        for politician_index, politician in enumerate(politician_data_list):
+            key = self.get_politician_key(politician)
+            if key in politician_index_map:
+                duplicate_politician_list.append(
+                    {
+                        "politician_index": politician_index,
+                        "assembly_term": key[0],
+                        "name": key[1],
+                        "political_party": key[2],
+                    }
                 )
+            politician_index_map[key] = politician_index
+        if duplicate_politician_list:
+            raise HTTPException(
+                status_code=HTTP_400_BAD_REQUEST,
+                detail={
+                    "message": "Duplicate politician key",
+                    "duplicate_politician": duplicate_politician_list,
+                },
             )
-            self.area_repo.bulk_insert_jurisdiction_data(jurisdiction_data_list)
 
-            self.admin_repo.insert_admin_log_data(admin_id, "bulk_create")
-            self.session.commit()
-        except DatabaseError as e:
-            self.session.rollback()
+        try:
+            bulk_constituency_id_list = (
+                await self.area_repo.get_bulk_constituency_id_list(
+                    [politician.constituency for politician in politician_data_list]
+                )
+            )
+            chunk_size = int(settings.bulk_insert_chunk_size)
+            changed_politician_data_list = []
+            inserted_count = 0
+            unchanged_count = 0
+            for start in range(0, len(politician_data_list), chunk_size):
+                (
+                    inserted_politician_data_list,
+                    updated_politician_data_list,
+                    unchanged_count_of_chunk,
+                ) = await self.upsert_politician_chunk(
+                    politician_data_list[start : start + chunk_size],
+                    bulk_constituency_id_list[start : start + chunk_size],
+                )
+                changed_politician_data_list.extend(inserted_politician_data_list)
+                changed_politician_data_list.extend(updated_politician_data_list)
+                inserted_count += len(inserted_politician_data_list)
+                unchanged_count += unchanged_count_of_chunk
+            updated_count = len(changed_politician_data_list) - inserted_count
+
+            await self.session.commit()
+            audit_log_writer.record(
+                admin_id,
+                "bulk_upsert",
+                detail={
+                    "inserted": inserted_count,
+                    "updated": updated_count,
+                    "unchanged": unchanged_count,
+                },
+            )
+            if changed_politician_data_list:
+                await self.invalidate_public_cache(changed_politician_data_list)
+        except (DatabaseError, InsertedPoliticianIdError) as e:
+            await self.session.rollback()
             logger.exception(str(e))
             raise HTTPException(
                 status_code=HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
             )
         finally:
-            self.session.close()
+            await self.session.close()
 
-        data_count = len(new_politician_data_list)
-        logger.info(f"admin {admin_id} inserted {data_count} politician data")
-        return AddBulkPoliticianDataRes(new_politician_data_count=data_count)
+        logger.info(
+            f"admin {admin_id} upserted politician data - inserted: {inserted_count}, "
+            f"updated: {updated_count}, unchanged: {unchanged_count}"
+        )
+        return UpsertBulkPoliticianDataRes(
+            inserted_politician_data_count=inserted_count,
+            updated_politician_data_count=updated_count,
+            unchanged_politician_data_count=unchanged_count,
+        )
+
+    async def upsert_politician_chunk(
+        self,
+        politician_data_list: List[SinglePoliticianRequest],
+        constituency_id_list_of_chunk: List[List[int]],
+    ) -> Tuple[List[Tuple[int, dict]], List[Tuple[int, dict]], int]:
+        existing_data_map: Dict[
+            Tuple[int, str, str], Tuple[Politician, PromiseCountDetail]
+        ] = {}
+        ambiguous_key_set = set()
+        for (
+            politician_row,
+            promise_count_detail_row,
+        ) in await self.politician_info_repo.select_politician_data_by_key_list(
+            [self.get_politician_key(politician) for politician in politician_data_list]
+        ):
+            key = (
+                politician_row.assembly_term,
+                politician_row.name,
+                politician_row.political_party,
+            )
+            if key in existing_data_map:
+                ambiguous_key_set.add(key)
+            existing_data_map[key] = (politician_row, promise_count_detail_row)
+        if ambiguous_key_set:
+            # 이미 중복 등록된 의원은 어느 행을 수정할지 정할 수 없으므로 전체 요청 거절
+            raise HTTPException(
+                status_code=HTTP_409_CONFLICT,
+                detail={
+                    "message": "Multiple politicians exist with the same key",
+                    "ambiguous_politician": [
+                        {
+                            "assembly_term": key[0],
+                            "name": key[1],
+                            "political_party": key[2],
+                        }
+                        for key in sorted(ambiguous_key_set)
+                    ],
+                },
+            )
+
+        new_politician_data_list = []
+        new_constituency_id_list = []
+        politician_update_list = []
+        promise_count_detail_update_list = []
+        promise_count_detail_insert_list = []
+        updated_politician_data_list = []
+        unchanged_count = 0
+        for politician, constituency_id_list in zip(
+            politician_data_list, constituency_id_list_of_chunk
+        ):
+            key = self.get_politician_key(politician)
+            if key not in existing_data_map:
+                new_politician_data_list.append(politician)
+                new_constituency_id_list.append(constituency_id_list)
+                continue
+
+            politician_row, promise_count_detail_row = existing_data_map[key]
+            changed_base_info = {
+                column: value
+                for column, value in politician.base_info.model_dump(
+                    exclude_unset=True
+                ).items()
+                if getattr(politician_row, column) != value
+            }
+            promise_count_detail = politician.promise_count_detail.model_dump(
+                exclude_unset=True
+            )
+            if changed_base_info:
+                politician_update_list.append(
+                    {"id": politician_row.id, **changed_base_info}
+                )
+            if promise_count_detail_row is None:
+                promise_count_detail_insert_list.append(
+                    {"politician_id": politician_row.id, **promise_count_detail}
+                )
+                changed_promise_count_detail = True
+            else:
+                changed_promise_count_detail = {
+                    column: value
+                    for column, value in promise_count_detail.items()
+                    if getattr(promise_count_detail_row, column) != value
+                }
+                if changed_promise_count_detail:
+                    promise_count_detail_update_list.append(
+                        {
+                            "id": promise_count_detail_row.id,
+                            **changed_promise_count_detail,
+                        }
+                    )
+
+            if changed_base_info or changed_promise_count_detail:
+                updated_politician_data_list.append(
+                    (
+                        politician_row.id,
+                        {
+                            "assembly_term": key[0],
+                            "name": key[1],
+                            "political_party": key[2],
+                        },
+                    )
+                )
+            else:
+                unchanged_count += 1
+
+        inserted_politician_data_list = (
+            await self.insert_politician_chunk(
+                new_politician_data_list, new_constituency_id_list
+            )
+            if new_politician_data_list
+            else []
+        )
+        await self.politician_info_repo.bulk_update_politician_data(
+            politician_update_list
+        )
+        await self.politician_info_repo.bulk_update_promise_count_detail_data(
+            promise_count_detail_update_list
+        )
+        await self.politician_info_repo.bulk_insert_promise_count_detail_data(
+            promise_count_detail_insert_list
+        )
+        return (
+            inserted_politician_data_list,
+            updated_politician_data_list,
+            unchanged_count,
+        )
+
+    async def import_politician_stream(
+        self,
+        admin_id: int,
+        parsed_row_iterator: AsyncIterator[ParsedRow],
+        progress_callback: Optional[Callable[[int, int, int], None]] = None,
+    ) -> ImportBulkPoliticianDataRes:
+        """
+        NDJSON/CSV 스트리밍 대량 등록
+        - body 를 읽는 대로 한 행씩 검증하고, 검증된 행이 묶음 크기만큼 모이면 삽입 후 커밋
+          (요청 전체를 메모리에 올리지 않음, 행 오류 목록도 최대 개수까지만 보관)
+        - 검증/지역구 오류 행은 줄 번호와 함께 응답하고 나머지 행은 등록
+        - DB 오류 시 진행 중인 묶음만 롤백, 이전 묶음은 커밋된 상태로 남음
+        - progress_callback 이 있으면 행마다 (처리 행 수, 등록 수, 오류 수) 전달
+        """
+        chunk_size = int(settings.bulk_insert_chunk_size)
+        max_error_count = int(settings.bulk_import_max_error_count)
+        catalog = await self.area_repo.get_constituency_catalog()
+        processed_count = 0
+        inserted_count = 0
+        error_count = 0
+        error_list = []
+        politician_chunk = []
+        constituency_id_chunk = []
+
+        def add_error(line_number: int, message: str) -> None:
+            nonlocal error_count
+            error_count += 1
+            if len(error_list) < max_error_count:
+                error_list.append(
+                    ImportRowErrorResSchema(line=line_number, message=message)
+                )
+
+        async def flush_chunk() -> None:
+            nonlocal inserted_count
+            if not politician_chunk:
+                return
+            try:
+                inserted_politician_data_list = await self.insert_politician_chunk(
+                    politician_chunk, constituency_id_chunk
+                )
+                await self.session.commit()
+            except (DatabaseError, InsertedPoliticianIdError) as e:
+                await self.session.rollback()
+                logger.exception(str(e))
+                raise HTTPException(
+                    status_code=HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail={
+                        "message": str(e),
+                        "new_politician_data_count": inserted_count,
+                    },
+                )
+            await self.invalidate_public_cache(inserted_politician_data_list)
+            inserted_count += len(politician_chunk)
+            politician_chunk.clear()
+            constituency_id_chunk.clear()
+
+        try:
+            async for line_number, politician, error_message in parsed_row_iterator:
+                processed_count += 1
+                if progress_callback is not None:
+                    progress_callback(processed_count, inserted_count, error_count)
+                if politician is None:
+                    add_error(line_number, error_message)
+                    continue
+                constituency_id_list = [
+                    catalog.get_constituency_id(
+                        data.region, data.district, data.section
+                    )
+                    for data in politician.constituency
+                ]
+                if None in constituency_id_list:
+                    unknown = politician.constituency[constituency_id_list.index(None)]
+                    add_error(
+                        line_number,
+                        f"Constituency info not found: "
+                        f"{unknown.region}/{unknown.district}/{unknown.section}",
+                    )
+                    continue
+                politician_chunk.append(politician)
+                constituency_id_chunk.append(constituency_id_list)
+                if len(politician_chunk) >= chunk_size:
+                    await flush_chunk()
+            await flush_chunk()
+            if progress_callback is not None:
+                progress_callback(processed_count, inserted_count, error_count)
+        finally:
+            await self.session.close()
+            # 중간에 실패해도 이미 커밋된 묶음은 기록
+            if inserted_count:
+                audit_log_writer.record(
+                    admin_id,
+                    "bulk_create",
+                    detail={"inserted": inserted_count, "failed_row": error_count},
+                )
+
+        logger.info(
+            f"admin {admin_id} imported {inserted_count} politician data, "
+            f"{error_count} rows failed"
+        )
+        return ImportBulkPoliticianDataRes(
+            new_politician_data_count=inserted_count,
+            error_count=error_count,
+            errors=error_list,
+        )
+
+    async def insert_politician_chunk(
+        self,
+        politician_data_list: List[SinglePoliticianRequest],
+        constituency_id_list_of_chunk: List[List[int]],
+    ) -> List[Tuple[int, dict]]:
+        parsed_politician_data = [
+            politician.base_info.model_dump() for politician in politician_data_list
+        ]
+        inserted_politician_id_list = (
+            await self.politician_info_repo.bulk_insert_politician_data(
+                parsed_politician_data
+            )
+        )
+        politician_id_pair_list = list(
+            zip(inserted_politician_id_list, politician_data_list)
+        )
+
+        await self.politician_info_repo.bulk_insert_committee_data(
+            [
+                {"politician_id": politician_id, **committee.model_dump()}
+                for politician_id, politician in politician_id_pair_list
+                for committee in politician.committee or []
+            ]
+        )
+        await self.politician_info_repo.bulk_insert_promise_count_detail_data(
+            [
+                {
+                    "politician_id": politician_id,
+                    **politician.promise_count_detail.model_dump(),
+                }
+                for politician_id, politician in politician_id_pair_list
+            ]
+        )
+        await self.area_repo.bulk_insert_jurisdiction_data(
+            [
+                {"politician_id": politician_id, "constituency_id": constituency_id}
+                for politician_id, constituency_id_list in zip(
+                    inserted_politician_id_list, constituency_id_list_of_chunk
+                )
+                for constituency_id in constituency_id_list
+            ]
+        )
+        return list(zip(inserted_politician_id_list, parsed_politician_data))
 
     async def update_single_politician_data(self, **kwargs) -> AddPoliticianDataRes:
         admin_id = kwargs["admin_id"]
@@ -157,16 +521,16 @@ class PoliticianService:
         politician_id = politician_data.politician_id
 
         try:
-            self.politician_info_repo.update_politician_data(
+            await self.politician_info_repo.update_politician_data(
                 politician_id, politician_data.base_info
             )
 
-            self.politician_info_repo.update_promise_count_detail_data(
+            await self.politician_info_repo.update_promise_count_detail_data(
                 politician_id, politician_data.promise_count_detail
             )
 
-            original_committee_data = self.politician_info_repo.select_committee_data(
-                politician_id
+            original_committee_data = (
+                await self.politician_info_repo.select_committee_data(politician_id)
             )
             original_committee_id_list = list(
                 map(lambda x: x[0], original_committee_data)
@@ -178,20 +542,19 @@ class PoliticianService:
                 set(original_committee_id_list).difference(new_committee_id_list)
             )
             for committee_id in deleted_committee_id_list:
-                self.politician_info_repo.delete_committee_data(committee_id)
-            self.politician_info_repo.update_committee_data(
+                await self.politician_info_repo.delete_committee_data(committee_id)
+            await self.politician_info_repo.update_committee_data(
                 politician_id, politician_data.committee
             )
 
             original_jurisdiction_data = (
-                self.area_repo.select_jurisdiction_data_by_politician_id(politician_id)
+                await self.area_repo.select_jurisdiction_data_by_politician_id(
+                    politician_id
+                )
             )
             original_jurisdiction_id_list = list(
                 map(lambda x: x[0], original_jurisdiction_data)
             )
-            original_constituency_id_list = list(
-                map(lambda x: x[5], original_jurisdiction_data)
-            )
             new_jurisdiction_id_list = list(
                 map(lambda x: x.model_dump()["id"], politician_data.jurisdiction)
             )
@@ -199,35 +562,286 @@ class PoliticianService:
                 set(original_jurisdiction_id_list).difference(new_jurisdiction_id_list)
             )
             for jurisdiction_id in deleted_jurisdiction_id_list:
-                self.area_repo.delete_jurisdiction_data(jurisdiction_id)
+                await self.area_repo.delete_jurisdiction_data(jurisdiction_id)
+            original_constituency_id_list = [
+                jurisdiction[4]
+                for jurisdiction in original_jurisdiction_data
+                if jurisdiction[0] not in deleted_jurisdiction_id_list
+            ]
 
-            for constituency_data in politician_data.jurisdiction:
-                constituency_id = self.area_repo.get_constituency_id(constituency_data)
+            constituency_id_list = await self.area_repo.get_constituency_id_list(
+                politician_data.jurisdiction
+            )
+            for constituency_id in constituency_id_list:
                 if constituency_id not in original_constituency_id_list:
-                    self.area_repo.insert_jurisdiction_data(
+                    await self.area_repo.insert_jurisdiction_data(
                         politician_id, constituency_id
                     )
 
-            self.admin_repo.insert_admin_log_data(admin_id, "update", politician_id)
-            self.session.commit()
+            await self.session.commit()
+            audit_log_writer.record(admin_id, "update", politician_id)
+            await self.invalidate_public_cache(
+                [(politician_id, politician_data.base_info.model_dump())]
+            )
         except DatabaseError as e:
-            self.session.rollback()
+            await self.session.rollback()
             logger.exception(str(e))
             raise HTTPException(
                 status_code=HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
             )
         finally:
-            self.session.close()
+            await self.session.close()
 
         logger.info(f"admin {admin_id} updated politician data: {politician_id}")
         return AddPoliticianDataRes(politician_id=politician_id)
 
-    def get_politician_by_id(self, politician_id: int) -> GetSinglePoliticianDataRes:
-        politician_data = self.politician_info_repo.select_total_politician_data_by_id(
-            politician_id
+    @staticmethod
+    def get_changed_column_map(row, data: dict) -> dict:
+        return {
+            column: value
+            for column, value in data.items()
+            if getattr(row, column) != value
+        }
+
+    async def patch_single_politician_data(self, **kwargs) -> PatchPoliticianDataRes:
+        """
+        의원 데이터 부분 수정
+        - 요청에 포함된 필드만 현재 값과 비교해 바뀐 컬럼만 테이블당 한 문장으로 수정
+        - 위원회: added 일괄 삽입, updated 는 바뀐 컬럼만 일괄 수정, deleted 는 한 번에 삭제
+        - 지역구: added 중 이미 있는 지역구는 건너뜀, deleted(jurisdiction id)는 한 번에 삭제
+        - 바뀐 것이 없으면 쓰기 없이 응답
+        """
+        admin_id = kwargs["admin_id"]
+        politician_data: SinglePoliticianPatchRequest = kwargs["request"]
+        politician_id = politician_data.politician_id
+        changed_field_list = []
+        # 감사 로그 detail 용 변경 전후 값
+        changed_value_map = {}
+
+        try:
+            current_data = await self.politician_info_repo.select_politician_with_promise_count_detail(
+                politician_id
+            )
+            if current_data is None:
+                raise HTTPException(
+                    status_code=HTTP_404_NOT_FOUND, detail="Politician not found"
+                )
+            politician_row, promise_count_detail_row = current_data
+            search_document = {
+                "assembly_term": politician_row.assembly_term,
+                "name": politician_row.name,
+                "political_party": politician_row.political_party,
+            }
+
+            if politician_data.base_info is not None:
+                changed_base_info = self.get_changed_column_map(
+                    politician_row,
+                    politician_data.base_info.model_dump(exclude_unset=True),
+                )
+                if changed_base_info:
+                    # UPDATE 후에는 세션의 행 객체도 새 값으로 바뀌므로 이전 값을 먼저 기록
+                    for column, value in changed_base_info.items():
+                        changed_field_list.append(f"base_info.{column}")
+                        changed_value_map[f"base_info.{column}"] = {
+                            "before": getattr(politician_row, column),
+                            "after": value,
+                        }
+                    await self.politician_info_repo.update_politician_columns(
+                        politician_id, changed_base_info
+                    )
+                    search_document.update(
+                        {
+                            column: value
+                            for column, value in changed_base_info.items()
+                            if column in search_document
+                        }
+                    )
+
+            if politician_data.promise_count_detail is not None:
+                promise_count_detail = politician_data.promise_count_detail.model_dump(
+                    exclude_unset=True
+                )
+                if promise_count_detail_row is None:
+                    await self.politician_info_repo.bulk_insert_promise_count_detail_data(
+                        [{"politician_id": politician_id, **promise_count_detail}]
+                    )
+                    changed_field_list.append("promise_count_detail")
+                else:
+                    changed_promise_count_detail = self.get_changed_column_map(
+                        promise_count_detail_row, promise_count_detail
+                    )
+                    if changed_promise_count_detail:
+                        for column, value in changed_promise_count_detail.items():
+                            field = f"promise_count_detail.{column}"
+                            changed_field_list.append(field)
+                            changed_value_map[field] = {
+                                "before": getattr(promise_count_detail_row, column),
+                                "after": value,
+                            }
+                        await self.politician_info_repo.update_promise_count_detail_columns(
+                            politician_id, changed_promise_count_detail
+                        )
+
+            if politician_data.committee is not None:
+                changed_field_list.extend(
+                    await self.patch_committee_data(
+                        politician_id, politician_data.committee
+                    )
+                )
+            if politician_data.jurisdiction is not None:
+                changed_field_list.extend(
+                    await self.patch_jurisdiction_data(
+                        politician_id, politician_data.jurisdiction
+                    )
+                )
+
+            if changed_field_list:
+                await self.session.commit()
+                detail = {
+                    "changed_field_list": changed_field_list,
+                    "changed_value": changed_value_map,
+                }
+                for field in ("committee", "jurisdiction"):
+                    if any(
+                        changed_field.startswith(f"{field}.")
+                        for changed_field in changed_field_list
+                    ):
+                        detail[field] = getattr(politician_data, field).model_dump(
+                            exclude_defaults=True
+                        )
+                audit_log_writer.record(admin_id, "update", politician_id, detail)
+                await self.invalidate_public_cache([(politician_id, search_document)])
+        except DatabaseError as e:
+            await self.session.rollback()
+            logger.exception(str(e))
+            raise HTTPException(
+                status_code=HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)
+            )
+        finally:
+            await self.session.close()
+
+        logger.info(
+            f"admin {admin_id} patched politician data: {politician_id} "
+            f"{changed_field_list}"
+        )
+        return PatchPoliticianDataRes(
+            politician_id=politician_id, changed_field_list=changed_field_list
         )
-        jurisdiction_data = self.area_repo.select_jurisdiction_data_by_politician_id(
-            politician_id
+
+    async def patch_committee_data(
+        self, politician_id: int, committee_diff
+    ) -> List[str]:
+        changed_field_list = []
+        if committee_diff.deleted:
+            delete_result = (
+                await self.politician_info_repo.delete_committee_data_by_id_list(
+                    politician_id, committee_diff.deleted
+                )
+            )
+            if delete_result.rowcount:
+                changed_field_list.append("committee.deleted")
+
+        if committee_diff.updated:
+            current_committee_map = {
+                committee.id: committee
+                for committee in await self.politician_info_repo.select_committee_data_by_id_list(
+                    politician_id,
+                    [committee.id for committee in committee_diff.updated],
+                )
+            }
+            unknown_committee_id_list = [
+                committee.id
+                for committee in committee_diff.updated
+                if committee.id not in current_committee_map
+            ]
+            if unknown_committee_id_list:
+                raise HTTPException(
+                    status_code=HTTP_400_BAD_REQUEST,
+                    detail={
+                        "message": "Committee not found",
+                        "unknown_committee_id": unknown_committee_id_list,
+                    },
+                )
+            committee_update_list = []
+            for committee in committee_diff.updated:
+                changed_committee = self.get_changed_column_map(
+                    current_committee_map[committee.id],
+                    committee.model_dump(exclude_unset=True, exclude={"id"}),
+                )
+                if changed_committee:
+                    committee_update_list.append(
+                        {"id": committee.id, **changed_committee}
+                    )
+            if committee_update_list:
+                await self.politician_info_repo.bulk_update_committee_data(
+                    committee_update_list
+                )
+                changed_field_list.append("committee.updated")
+
+        if committee_diff.added:
+            await self.politician_info_repo.bulk_insert_committee_data(
+                [
+                    {"politician_id": politician_id, **committee.model_dump()}
+                    for committee in committee_diff.added
+                ]
+            )
+            changed_field_list.append("committee.added")
+        return changed_field_list
+
+    async def patch_jurisdiction_data(
+        self, politician_id: int, jurisdiction_diff
+    ) -> List[str]:
+        changed_field_list = []
+        if jurisdiction_diff.deleted:
+            delete_result = await self.area_repo.delete_jurisdiction_data_by_id_list(
+                politician_id, jurisdiction_diff.deleted
+            )
+            if delete_result.rowcount:
+                changed_field_list.append("jurisdiction.deleted")
+
+        if jurisdiction_diff.added:
+            constituency_id_list = await self.area_repo.get_constituency_id_list(
+                jurisdiction_diff.added
+            )
+            current_constituency_id_set = set(
+                await self.area_repo.select_constituency_id_list_by_politician_id(
+                    politician_id
+                )
+            )
+            new_constituency_id_list = [
+                constituency_id
+                for constituency_id in dict.fromkeys(constituency_id_list)
+                if constituency_id not in current_constituency_id_set
+            ]
+            if new_constituency_id_list:
+                await self.area_repo.bulk_insert_jurisdiction_data(
+                    [
+                        {
+                            "politician_id": politician_id,
+                            "constituency_id": constituency_id,
+                        }
+                        for constituency_id in new_constituency_id_list
+                    ]
+                )
+                changed_field_list.append("jurisdiction.added")
+        return changed_field_list
+
+    async def get_politician_by_id(
+        self, politician_id: int
+    ) -> GetSinglePoliticianDataRes:
+        politician_data = (
+            await self.politician_info_repo.select_total_politician_data_by_id(
+                politician_id
+            )
+        )
+        if politician_data is None:
+            raise HTTPException(
+                status_code=HTTP_404_NOT_FOUND, detail="Politician not found"
+            )
+        jurisdiction_data = (
+            await self.area_repo.select_jurisdiction_data_by_politician_id(
+                politician_id
+            )
         )
         jurisdiction_list = [
             JurisdictionResSchema(
@@ -240,9 +854,9 @@ class PoliticianService:
         return_res.constituency = jurisdiction_list
         return return_res
 
-    def get_constituency_data(self, region: str) -> List[ConstituencyResSchema]:
+    async def get_constituency_data(self, region: str) -> List[ConstituencyResSchema]:
         region_name = RegionType[region.upper()].value[1]
-        constituency_obj_list = self.area_repo.select_constituency_data_by_region(
+        constituency_obj_list = await self.area_repo.select_constituency_data_by_region(
             region_name
         )
         constituency_list = [
@@ -251,32 +865,20 @@ class PoliticianService:
         ]
         return constituency_list
 
-    def get_politician_list(
+    async def get_politician_list(
         self, assembly_term: int, page: int, size: int
     ) -> List[GetPoliticianElementOfListRes]:
         offset = page * size
-        politician_list = self.politician_info_repo.get_politician_list_data_for_admin(
-            assembly_term, offset, size
-        )
-        return_res = []
-        for politician in politician_list:
-            jurisdiction_data = (
-                self.area_repo.select_jurisdiction_data_by_politician_id(
-                    politician[0].id
-                )
+        politician_list = (
+            await self.politician_info_repo.get_politician_list_data_for_admin(
+                assembly_term, offset, size
             )
-            jurisdiction_list = [
-                JurisdictionResSchema(
-                    id=data[0], region=data[1], district=data[2], section=data[3]
-                )
-                for data in jurisdiction_data
-            ]
-            politician_res = GetPoliticianElementOfListRes.model_validate(politician[0])
-            politician_res.constituency = jurisdiction_list
-            return_res.append(politician_res)
-        return return_res
+        )
+        return await self.get_politician_list_res(
+            [politician[0] for politician in politician_list]
+        )
 
-    def get_politician_search_data(
+    async def get_politician_search_data(
         self,
         assembly_term: int,
         page: int,
@@ -288,7 +890,7 @@ class PoliticianService:
         offset = page * size
         if name or party:
             politician_list = (
-                self.politician_info_repo.get_politician_search_data_for_admin(
+                await self.politician_info_repo.get_politician_search_data_for_admin(
                     offset=offset,
                     size=size,
                     assembly_term=assembly_term,
@@ -296,101 +898,62 @@ class PoliticianService:
                     party=party,
                 )
             )
-            return_res = []
-            for politician in politician_list:
-                jurisdiction_data = (
-                    self.area_repo.select_jurisdiction_data_by_politician_id(
-                        politician[0].id
-                    )
-                )
-                jurisdiction_list = [
-                    JurisdictionResSchema(
-                        id=data[0], region=data[1], district=data[2], section=data[3]
-                    )
-                    for data in jurisdiction_data
-                ]
-                politician_res = GetPoliticianElementOfListRes.model_validate(
-                    politician[0]
-                )
-                politician_res.constituency = jurisdiction_list
-                return_res.append(politician_res)
-            return return_res
+            return await self.get_politician_list_res(
+                [politician[0] for politician in politician_list]
+            )
         else:
-            area_text = jurisdiction.replace(" ", "")
-            abbreviated_area_text = re.sub(r"(특별|광역)시", "", area_text)
-            region_searched_keyword_replacements = {
-                "서울시": "서울",
-                "부산시": "부산",
-                "인천시": "인천",
-                "대구시": "대구",
-                "광주시": "광주",
-                "대전시": "대전",
-                "울산시": "울산",
-                "경기도": "경기",
-                "세종시": "세종",
-                "제주도": "제주",
-            }
-            for key, value in region_searched_keyword_replacements.items():
-                abbreviated_area_text = abbreviated_area_text.replace(key, value)
-
-            region_data = self.area_repo.get_region_data_by_random_text(
-                abbreviated_area_text
+            constituency_catalog = await self.area_repo.get_constituency_catalog()
+            constituency_id_list = (
+                constituency_catalog.matcher.get_constituency_id_list(jurisdiction)
             )
+            logger.info(
+                f"Jurisdiction searched: {jurisdiction}, "
+                f"constituency count: {len(constituency_id_list)}"
+            )
+            if not constituency_id_list:
+                return []
 
-            if not region_data:
-                logger.info(f"Only constituency searched: {abbreviated_area_text}")
-                jurisdiction_politician_id_list = (
-                    self.area_repo.select_jurisdiction_data_by_random_text(
-                        abbreviated_area_text, offset, size
-                    )
-                )
-            else:
-                region_id, region_name = region_data
-                area_text_without_region = abbreviated_area_text.replace(
-                    region_name, ""
-                )
-                if not area_text_without_region:
-                    logger.info(f"Only region searched: {abbreviated_area_text}")
-                    jurisdiction_politician_id_list = (
-                        self.area_repo.select_jurisdiction_data_by_region_id_and_text(
-                            offset, size, region_id
-                        )
-                    )
-                else:
-                    logger.info(
-                        f"Both region and constituency searched: {abbreviated_area_text}"
-                    )
-                    jurisdiction_politician_id_list = (
-                        self.area_repo.select_jurisdiction_data_by_region_id_and_text(
-                            offset,
-                            size,
-                            region_id,
-                            area_text_without_region,
-                        )
-                    )
-
-            return_res = []
-            for politician in jurisdiction_politician_id_list:
-                politician_id = politician[0]
-                politician_data = (
-                    self.politician_info_repo.select_total_politician_data_by_id(
-                        politician_id
-                    )
+            jurisdiction_politician_id_list = (
+                await self.area_repo.select_politician_id_list_by_constituency_id_list(
+                    assembly_term, constituency_id_list, offset, size
                 )
-                jurisdiction_data = (
-                    self.area_repo.select_jurisdiction_data_by_politician_id(
-                        politician_id
-                    )
+            )
+            politician_id_list = [
+                politician[0] for politician in jurisdiction_politician_id_list
+            ]
+            politician_data_list = (
+                await self.politician_info_repo.select_politician_data_by_id_list(
+                    politician_id_list
                 )
-                jurisdiction_list = [
-                    JurisdictionResSchema(
-                        id=data[0], region=data[1], district=data[2], section=data[3]
-                    )
-                    for data in jurisdiction_data
+            )
+            politician_data_map = {
+                politician[0].id: politician[0] for politician in politician_data_list
+            }
+            return await self.get_politician_list_res(
+                [
+                    politician_data_map[politician_id]
+                    for politician_id in politician_id_list
+                    if politician_id in politician_data_map
                 ]
-                politician_res = GetPoliticianElementOfListRes.model_validate(
-                    politician_data
+            )
+
+    async def get_politician_list_res(
+        self, politician_list: List[Politician]
+    ) -> List[GetPoliticianElementOfListRes]:
+        jurisdiction_data_map = (
+            await self.area_repo.select_jurisdiction_data_by_politician_id_list(
+                [politician.id for politician in politician_list]
+            )
+        )
+        return_res = []
+        for politician in politician_list:
+            jurisdiction_list = [
+                JurisdictionResSchema(
+                    id=data[0], region=data[1], district=data[2], section=data[3]
                 )
-                politician_res.constituency = jurisdiction_list
-                return_res.append(politician_res)
-            return return_res
+                for data in jurisdiction_data_map.get(politician.id, [])
+            ]
+            politician_res = GetPoliticianElementOfListRes.model_validate(politician)
+            politician_res.constituency = jurisdiction_list
+            return_res.append(politician_res)
+        return return_res
@@ -7,13 +7,15 @@ from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jose import jwt, ExpiredSignatureError
 from starlette.status import HTTP_401_UNAUTHORIZED
 
+from admin.auth.jti_cache import admin_jti_cache
+from admin.auth.token_cache import verified_token_cache, TokenClaims
 from config import settings
 from repositories.admin_repository import AdminRepository
 
 logger = logging.getLogger("uvicorn")
 
 
-def get_auth_info_from_token(
+async def get_auth_info_from_token(
     authorization: HTTPAuthorizationCredentials
     | None = Depends(HTTPBearer(auto_error=False)),
     admin_repository: AdminRepository = Depends(),
@@ -27,29 +29,35 @@ def get_auth_info_from_token(
     access_token = authorization.credentials
 
     try:
-        payload: dict = jwt.decode(
-            access_token,
-            settings.access_token_secret_key,
-            algorithms=[settings.jwt_algorithm],
-        )
-        exp = payload["exp"]
-        if exp < datetime.now().timestamp():
-            raise HTTPException(
-                status_code=HTTP_401_UNAUTHORIZED,
-                detail="Expired token.",
+        # 이미 검증한 토큰이면 서명 검증과 claim 파싱 생략 (exp 이후에는 캐시에서 제외)
+        token_claims = verified_token_cache.get(access_token)
+        if token_claims is None:
+            payload: dict = jwt.decode(
+                access_token,
+                settings.access_token_secret_key,
+                algorithms=[settings.jwt_algorithm],
             )
+            exp = payload["exp"]
+            if exp < datetime.now().timestamp():
+                raise HTTPException(
+                    status_code=HTTP_401_UNAUTHORIZED,
+                    detail="Expired token.",
+                )
 
-        sub = json.loads(payload["sub"])
-        sub_data = {
-            "admin_id": sub[0],
-            "nickname": sub[1],
-            "uuid_jti": payload["jti"],
-        }
+            sub = json.loads(payload["sub"])
+            token_claims = TokenClaims(
+                admin_id=sub[0], uuid_jti=payload["jti"], exp=exp
+            )
+            verified_token_cache.set(access_token, token_claims)
 
-        admin_id = sub_data["admin_id"]
-        uuid_jti = sub_data["uuid_jti"]
-        current_auth_validation = admin_repository.check_jti_data(admin_id, uuid_jti)
-        if not current_auth_validation:
+        admin_id = token_claims.admin_id
+        uuid_jti = token_claims.uuid_jti
+        is_cached, current_jti = admin_jti_cache.get(admin_id)
+        if not is_cached:
+            generation = admin_jti_cache.generation
+            current_jti = await admin_repository.select_admin_jti(admin_id)
+            admin_jti_cache.fill(admin_id, current_jti, generation)
+        if current_jti is None or current_jti != uuid_jti:
             logger.info(f"Abnormal access with admin {admin_id}")
             raise HTTPException(
                 status_code=HTTP_401_UNAUTHORIZED,
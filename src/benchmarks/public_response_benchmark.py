@@ -0,0 +1,111 @@
+"""
+공개 국회의원 목록 응답 마이크로 벤치마크
+- current: ORM 객체 -> Pydantic 모델 생성 -> FastAPI 응답 검증/인코딩
+- bytes cache: 인코딩된 JSON bytes를 프로세스 내 캐시에서 바로 응답
+
+실행: cd src && python -m benchmarks.public_response_benchmark
+"""
+import asyncio
+import time
+from typing import List
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from pydantic import TypeAdapter
+
+from database.models import Politician
+from public.public_response_cache import PublicResponseCache
+from schema.politician_response import JurisdictionResSchema
+from schema.public_response import PublicPoliticianListElementResSchema
+
+PAGE_SIZE = 50
+REPEAT = 2000
+
+
+def make_politician_list(size: int) -> List[Politician]:
+    return [
+        Politician(
+            id=politician_id,
+            assembly_term=21,
+            name=f"의원{politician_id}",
+            political_party="정당",
+            elected_count=1,
+            total_promise_count=100,
+            completed_promise_count=politician_id % 100,
+            promise_execution_rate=politician_id % 100,
+        )
+        for politician_id in range(1, size + 1)
+    ]
+
+
+def build_response_models(
+    politician_list: List[Politician],
+) -> List[PublicPoliticianListElementResSchema]:
+    return_res = []
+    for politician in politician_list:
+        politician_res = PublicPoliticianListElementResSchema.model_validate(politician)
+        politician_res.constituency = [
+            JurisdictionResSchema(
+                id=politician.id, region="서울", district="종로구", section=None
+            )
+        ]
+        return_res.append(politician_res)
+    return return_res
+
+
+async def run_current_path(politician_list: List[Politician], response_field) -> bytes:
+    content = await serialize_response(
+        field=response_field,
+        response_content=build_response_models(politician_list),
+        is_coroutine=True,
+    )
+    return JSONResponse(content).body
+
+
+async def run_bytes_cache_path(
+    politician_list: List[Politician],
+    response_cache: PublicResponseCache,
+    type_adapter: TypeAdapter,
+) -> bytes:
+    response = await response_cache.get_response(
+        key=response_cache.make_key("politician", "benchmark"),
+        builder=lambda: build_response_models(politician_list),
+        type_adapter=type_adapter,
+        etag='"benchmark"',
+    )
+    return response.body
+
+
+async def measure(name: str, func, *args) -> float:
+    await func(*args)
+    start_time = time.perf_counter()
+    for _ in range(REPEAT):
+        await func(*args)
+    elapsed_us = (time.perf_counter() - start_time) / REPEAT * 1_000_000
+    print(f"{name:<14} {elapsed_us:>10.1f} us/request")
+    return elapsed_us
+
+
+async def main():
+    politician_list = make_politician_list(PAGE_SIZE)
+    response_type = List[PublicPoliticianListElementResSchema]
+    response_field = create_response_field(name="benchmark", type_=response_type)
+    response_cache = PublicResponseCache(None, ttl=0, local_max_size=16)
+
+    print(f"page size: {PAGE_SIZE}, repeat: {REPEAT}")
+    current_us = await measure(
+        "current", run_current_path, politician_list, response_field
+    )
+    cached_us = await measure(
+        "bytes cache",
+        run_bytes_cache_path,
+        politician_list,
+        response_cache,
+        TypeAdapter(response_type),
+    )
+    print(f"speedup        {current_us / cached_us:>10.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
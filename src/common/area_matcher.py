@@ -0,0 +1,181 @@
+from collections import deque
+from typing import Dict, List, Tuple, Set, NamedTuple
+
+from common.enums import RegionType
+
+REGION_ALIAS_MAP = {
+    RegionType.SEOUL: ("서울시", "서울특별시"),
+    RegionType.BUSAN: ("부산시", "부산광역시"),
+    RegionType.INCHEON: ("인천시", "인천광역시"),
+    RegionType.DAEGU: ("대구시", "대구광역시"),
+    RegionType.GWANGJU: ("광주시", "광주광역시"),
+    RegionType.DAEJEON: ("대전시", "대전광역시"),
+    RegionType.ULSAN: ("울산시", "울산광역시"),
+    RegionType.GYEONGGI: ("경기도",),
+    RegionType.SEJONG: ("세종시", "세종특별자치시"),
+    RegionType.GANGWON: ("강원도", "강원특별자치도"),
+    RegionType.CHUNGBUK: ("충청북도",),
+    RegionType.CHUNGNAM: ("충청남도",),
+    RegionType.JEONBUK: ("전라북도", "전북특별자치도"),
+    RegionType.JEONNAM: ("전라남도",),
+    RegionType.GYEONGBUK: ("경상북도",),
+    RegionType.GYEONGNAM: ("경상남도",),
+    RegionType.JEJU: ("제주도", "제주특별자치도"),
+}
+DISTRICT_SUFFIX_LIST = ("특례시", "시", "군", "구")
+
+
+def normalize_area_text(text: str) -> str:
+    return "".join(text.split())
+
+
+def get_district_alias_list(district: str) -> List[str]:
+    """
+    세부 지역구 별칭
+    - 공백 제거 원문('성남시분당구'), 공백 기준 각 부분('성남시', '분당구')
+    - 시/군/구 접미사를 뗀 이름('강남구' -> '강남'), 두 글자 이상일 때만
+    """
+    alias_set = {normalize_area_text(district)}
+    for part in district.split():
+        alias_set.add(part)
+        for suffix in DISTRICT_SUFFIX_LIST:
+            if part.endswith(suffix) and len(part) - len(suffix) >= 2:
+                alias_set.add(part[: -len(suffix)])
+                break
+    return list(alias_set)
+
+
+class PatternPayload(NamedTuple):
+    region_id_set: frozenset
+    constituency_id_set: frozenset
+
+
+class AhoCorasickAutomaton:
+    def __init__(self, pattern_map: Dict[str, PatternPayload]) -> None:
+        self.goto_list: List[Dict[str, int]] = [{}]
+        self.fail_list: List[int] = [0]
+        # 노드별로 끝나는 패턴들(실패 링크를 따라 도달하는 패턴 포함)의 (길이, 데이터)
+        self.output_list: List[List[Tuple[int, PatternPayload]]] = [[]]
+
+        for pattern, payload in pattern_map.items():
+            node = 0
+            for char in pattern:
+                next_node = self.goto_list[node].get(char)
+                if next_node is None:
+                    next_node = len(self.goto_list)
+                    self.goto_list[node][char] = next_node
+                    self.goto_list.append({})
+                    self.fail_list.append(0)
+                    self.output_list.append([])
+                node = next_node
+            self.output_list[node].append((len(pattern), payload))
+
+        queue = deque(self.goto_list[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, next_node in self.goto_list[node].items():
+                queue.append(next_node)
+                fail_node = self.fail_list[node]
+                while fail_node and char not in self.goto_list[fail_node]:
+                    fail_node = self.fail_list[fail_node]
+                fail_target = self.goto_list[fail_node].get(char, 0)
+                self.fail_list[next_node] = (
+                    fail_target if fail_target != next_node else 0
+                )
+                self.output_list[next_node] = (
+                    self.output_list[next_node]
+                    + self.output_list[self.fail_list[next_node]]
+                )
+
+    def find_all(self, text: str) -> List[Tuple[int, int, PatternPayload]]:
+        match_list = []
+        node = 0
+        for index, char in enumerate(text):
+            while node and char not in self.goto_list[node]:
+                node = self.fail_list[node]
+            node = self.goto_list[node].get(char, 0)
+            for length, payload in self.output_list[node]:
+                match_list.append((index + 1 - length, index + 1, payload))
+        return match_list
+
+
+class ConstituencyMatcher:
+    """
+    지역구 자유 입력 -> constituency id 집합 변환기
+    - RegionType 별칭과 Constituency 세부 지역구/분구 이름으로 Aho-Corasick 오토마톤을 한 번 구성
+    - 입력을 한 번 훑어 겹치지 않는 가장 긴 일치들만 사용
+    - 대분류 지역과 세부 지역구가 함께 있으면 해당 지역의 지역구로 좁힘
+      (예: '광주 북구' -> 광주 북구, '경기 광주시' -> 경기 광주시, '광주시' -> 광주 전체)
+    """
+
+    def __init__(self, constituency_data_list: List[Tuple[int, int, str, str]]) -> None:
+        self.region_constituency_id_map: Dict[int, Set[int]] = {
+            region.value[0]: set() for region in RegionType
+        }
+        self.constituency_region_id_map: Dict[int, int] = {}
+
+        region_pattern_map: Dict[str, Set[int]] = {}
+        for region in RegionType:
+            for alias in (region.value[1],) + REGION_ALIAS_MAP.get(region, ()):
+                region_pattern_map.setdefault(alias, set()).add(region.value[0])
+
+        district_pattern_map: Dict[str, Set[int]] = {}
+        for constituency_id, region_id, district, section in constituency_data_list:
+            self.region_constituency_id_map.setdefault(region_id, set()).add(
+                constituency_id
+            )
+            self.constituency_region_id_map[constituency_id] = region_id
+            if not district:
+                continue
+            for alias in get_district_alias_list(district):
+                district_pattern_map.setdefault(alias, set()).add(constituency_id)
+            if section:
+                district_pattern_map.setdefault(
+                    normalize_area_text(district) + section, set()
+                ).add(constituency_id)
+
+        pattern_map = {
+            pattern: PatternPayload(
+                frozenset(region_pattern_map.get(pattern, ())),
+                frozenset(district_pattern_map.get(pattern, ())),
+            )
+            for pattern in region_pattern_map.keys() | district_pattern_map.keys()
+        }
+        self.automaton = AhoCorasickAutomaton(pattern_map)
+        self.pattern_count = len(pattern_map)
+
+    def get_constituency_id_list(self, text: str) -> List[int]:
+        match_list = self.automaton.find_all(normalize_area_text(text))
+        # 시작 위치 순, 같은 위치에서는 긴 패턴 우선으로 겹치지 않게 선택
+        match_list.sort(key=lambda match: (match[0], match[0] - match[1]))
+
+        region_id_set = set()
+        constituency_id_set = set()
+        ambiguous_constituency_id_set = set()
+        last_end = 0
+        for start, end, payload in match_list:
+            if start < last_end:
+                continue
+            last_end = end
+            region_id_set.update(payload.region_id_set)
+            if payload.region_id_set:
+                # '광주시'처럼 대분류 지역 별칭이면서 세부 지역구 이름인 경우
+                ambiguous_constituency_id_set.update(payload.constituency_id_set)
+            else:
+                constituency_id_set.update(payload.constituency_id_set)
+
+        if not region_id_set:
+            return sorted(constituency_id_set)
+
+        region_constituency_id_list = sorted(
+            constituency_id
+            for constituency_id in constituency_id_set | ambiguous_constituency_id_set
+            if self.constituency_region_id_map[constituency_id] in region_id_set
+        )
+        if region_constituency_id_list or constituency_id_set:
+            return region_constituency_id_list
+        return sorted(
+            constituency_id
+            for region_id in region_id_set
+            for constituency_id in self.region_constituency_id_map.get(region_id, ())
+        )
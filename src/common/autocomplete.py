@@ -0,0 +1,199 @@
+import asyncio
+import heapq
+import logging
+import time
+from typing import Dict, List, Optional, Callable, Tuple, NamedTuple, Awaitable
+
+logger = logging.getLogger("uvicorn")
+
+HANGUL_SYLLABLE_START = 0xAC00
+HANGUL_SYLLABLE_END = 0xD7A3
+JUNGSEONG_COUNT = 21
+JONGSEONG_COUNT = 28
+CHOSEONG_LIST = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+
+SUGGESTION_CATEGORY_RANK = {"name": 0, "party": 1, "district": 2}
+MAX_SUGGESTION_SIZE = 20
+
+
+def is_hangul_syllable(char: str) -> bool:
+    return HANGUL_SYLLABLE_START <= ord(char) <= HANGUL_SYLLABLE_END
+
+
+def get_choseong(char: str) -> str:
+    if not is_hangul_syllable(char):
+        return char
+    syllable_index = ord(char) - HANGUL_SYLLABLE_START
+    return CHOSEONG_LIST[syllable_index // (JUNGSEONG_COUNT * JONGSEONG_COUNT)]
+
+
+def get_choseong_text(text: str) -> str:
+    return "".join(get_choseong(char) for char in text)
+
+
+def is_char_matched(query_char: str, key_char: str, is_last: bool) -> bool:
+    """
+    검색어 한 글자와 색인 한 글자 비교
+    - 초성(ㄱ~ㅎ)은 같은 초성의 음절과 일치
+    - 마지막 글자가 받침 없는 음절이면 입력 중인 글자로 보고 받침 유무와 관계없이 일치 (예: '기' -> '길')
+    """
+    if query_char == key_char:
+        return True
+    if query_char in CHOSEONG_LIST:
+        return get_choseong(key_char) == query_char
+    if is_last and is_hangul_syllable(query_char) and is_hangul_syllable(key_char):
+        query_index = ord(query_char) - HANGUL_SYLLABLE_START
+        key_index = ord(key_char) - HANGUL_SYLLABLE_START
+        return (
+            query_index % JONGSEONG_COUNT == 0
+            and query_index // JONGSEONG_COUNT == key_index // JONGSEONG_COUNT
+        )
+    return False
+
+
+class Suggestion(NamedTuple):
+    rank: int
+    text: str
+    category: str
+    politician_id: Optional[int]
+
+
+class TrieNode:
+    __slots__ = ("children", "suggestion_list")
+
+    def __init__(self) -> None:
+        self.children: Dict[str, "TrieNode"] = {}
+        # 이 노드를 접두사로 가지는 후보 중 순위 상위 MAX_SUGGESTION_SIZE개
+        self.suggestion_list: List[Suggestion] = []
+
+
+class SuggestionTrie:
+    def __init__(self, data_version: int) -> None:
+        self.data_version = data_version
+        self.root = TrieNode()
+        self.suggestion_count = 0
+
+    def insert(self, key: str, suggestion: Suggestion) -> None:
+        # 순위 오름차순으로 삽입되므로 노드별 목록은 앞에서부터 채우면 정렬 상태 유지
+        node = self.root
+        for char in key:
+            node = node.children.setdefault(char, TrieNode())
+            if len(node.suggestion_list) < MAX_SUGGESTION_SIZE:
+                node.suggestion_list.append(suggestion)
+        self.suggestion_count += 1
+
+    def find_node_list(self, keyword: str) -> List[TrieNode]:
+        node_list = [self.root]
+        for index, query_char in enumerate(keyword):
+            is_last = index == len(keyword) - 1
+            node_list = [
+                child
+                for node in node_list
+                for key_char, child in node.children.items()
+                if is_char_matched(query_char, key_char, is_last)
+            ]
+            if not node_list:
+                break
+        return node_list
+
+    def search(self, keyword: str, size: int) -> List[Suggestion]:
+        node_list = self.find_node_list(keyword)
+        suggestion_list = []
+        for suggestion in heapq.merge(*(node.suggestion_list for node in node_list)):
+            if suggestion_list and suggestion_list[-1] == suggestion:
+                continue
+            suggestion_list.append(suggestion)
+            if len(suggestion_list) >= size:
+                break
+        return suggestion_list
+
+
+class PoliticianAutocompleteIndex:
+    """
+    국회의원 자동완성 접두사 트라이
+    - 회기별로 의원 이름, 정당, 지역구(Constituency.district)를 색인
+    - 초성 입력('ㅇㅈㅁ'), 초성/음절 혼합 입력, 입력 중인 마지막 음절('기' -> '길')을 지원
+    - 노드마다 상위 후보를 미리 정렬해 두어 조회 시 접두사 노드만 따라가면 됨
+    - 데이터 버전이 바뀌면(관리자 쓰기, 다른 워커의 쓰기 포함) 다음 조회 시 재구성
+    """
+
+    def __init__(self) -> None:
+        self.trie_map: Dict[int, SuggestionTrie] = {}
+        self.lock = asyncio.Lock()
+        self.rebuild_count = 0
+        self.last_rebuild_ms: Optional[float] = None
+
+    async def search(
+        self,
+        assembly_term: int,
+        keyword: str,
+        size: int,
+        data_version: int,
+        loader: Callable[
+            [int], Awaitable[Tuple[List[Tuple[int, str, str]], List[str]]]
+        ],
+    ) -> List[Suggestion]:
+        keyword = keyword.strip().lower()
+        size = min(size, MAX_SUGGESTION_SIZE)
+        trie = self.trie_map.get(assembly_term)
+        if trie is None or trie.data_version != data_version:
+            async with self.lock:
+                trie = self.trie_map.get(assembly_term)
+                if trie is None or trie.data_version != data_version:
+                    politician_data_list, district_list = await loader(assembly_term)
+                    trie = self.rebuild(
+                        assembly_term, data_version, politician_data_list, district_list
+                    )
+        if not keyword:
+            return []
+        return trie.search(keyword, size)
+
+    def rebuild(
+        self,
+        assembly_term: int,
+        data_version: int,
+        politician_data_list: List[Tuple[int, str, str]],
+        district_list: List[str],
+    ) -> SuggestionTrie:
+        start_time = time.perf_counter()
+
+        suggestion_list = [
+            Suggestion(SUGGESTION_CATEGORY_RANK["name"], name, "name", politician_id)
+            for politician_id, name, _ in politician_data_list
+        ]
+        suggestion_list.extend(
+            Suggestion(SUGGESTION_CATEGORY_RANK["party"], party, "party", None)
+            for party in {party for _, _, party in politician_data_list if party}
+        )
+        suggestion_list.extend(
+            Suggestion(SUGGESTION_CATEGORY_RANK["district"], district, "district", None)
+            for district in set(district_list)
+            if district
+        )
+        suggestion_list.sort()
+
+        trie = SuggestionTrie(data_version)
+        for suggestion in suggestion_list:
+            trie.insert(suggestion.text.lower(), suggestion)
+        self.trie_map[assembly_term] = trie
+
+        self.rebuild_count += 1
+        self.last_rebuild_ms = (time.perf_counter() - start_time) * 1000
+        logger.info(
+            f"Rebuilt politician autocomplete trie - assembly_term: {assembly_term}, "
+            f"size: {trie.suggestion_count}, elapsed: {self.last_rebuild_ms:.2f}ms"
+        )
+        return trie
+
+    def get_stats(self) -> dict:
+        return {
+            "indexed_assembly_terms": sorted(self.trie_map.keys()),
+            "suggestion_count": sum(
+                trie.suggestion_count for trie in self.trie_map.values()
+            ),
+            "rebuild_count": self.rebuild_count,
+            "last_rebuild_ms": self.last_rebuild_ms,
+        }
+
+
+politician_autocomplete_index = PoliticianAutocompleteIndex()
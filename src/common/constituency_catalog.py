@@ -0,0 +1,126 @@
+import asyncio
+import logging
+import time
+from typing import Dict, List, Optional, Callable, Tuple, Set, Awaitable
+
+from fastapi import HTTPException
+from starlette.status import HTTP_400_BAD_REQUEST
+
+from common.area_matcher import ConstituencyMatcher
+from common.enums import RegionType
+
+logger = logging.getLogger("uvicorn")
+
+ConstituencyKey = Tuple[str, Optional[str], Optional[str]]
+
+
+class ConstituencyCatalog:
+    """
+    지역구 카탈로그
+    - region/constituency 는 마이그레이션(0007, twenty_first.py)으로만 들어가는 정적 데이터이므로
+      프로세스당 한 번만 읽어 메모리에 유지
+    - (대분류 지역, 세부 지역구, 분구) -> constituency id, 역방향(id -> 지역구, 지역 id -> id 목록) 제공
+    - 관리자 지역구 검색용 ConstituencyMatcher 도 같은 데이터로 구성
+    """
+
+    def __init__(self) -> None:
+        self.lock = asyncio.Lock()
+        self.is_loaded = False
+        self.constituency_id_map: Dict[ConstituencyKey, int] = {}
+        self.constituency_key_map: Dict[int, ConstituencyKey] = {}
+        self.region_constituency_id_map: Dict[int, Set[int]] = {}
+        self.constituency_data_list: List[Tuple[int, int, str, str]] = []
+        self.matcher: Optional[ConstituencyMatcher] = None
+        self.load_ms: Optional[float] = None
+
+    async def load(
+        self, loader: Callable[[], Awaitable[List[Tuple[int, int, str, str]]]]
+    ) -> "ConstituencyCatalog":
+        if self.is_loaded:
+            return self
+        async with self.lock:
+            if self.is_loaded:
+                return self
+            start_time = time.perf_counter()
+            region_name_map = {
+                region.value[0]: region.value[1] for region in RegionType
+            }
+            constituency_data_list = [tuple(data) for data in await loader()]
+            for constituency_id, region_id, district, section in constituency_data_list:
+                key = (region_name_map.get(region_id), district, section)
+                self.constituency_id_map[key] = constituency_id
+                self.constituency_key_map[constituency_id] = key
+                self.region_constituency_id_map.setdefault(region_id, set()).add(
+                    constituency_id
+                )
+            self.constituency_data_list = constituency_data_list
+            self.matcher = ConstituencyMatcher(constituency_data_list)
+            self.is_loaded = True
+            self.load_ms = (time.perf_counter() - start_time) * 1000
+            logger.info(
+                f"Loaded constituency catalog - size: {len(constituency_data_list)}, "
+                f"patterns: {self.matcher.pattern_count}, elapsed: {self.load_ms:.2f}ms"
+            )
+        return self
+
+    def get_constituency_id(
+        self, region: str, district: Optional[str], section: Optional[str]
+    ) -> Optional[int]:
+        return self.constituency_id_map.get((region, district, section))
+
+    def get_constituency_key(self, constituency_id: int) -> Optional[ConstituencyKey]:
+        return self.constituency_key_map.get(constituency_id)
+
+    def get_region_constituency_key_list(self, region_id: int) -> List[ConstituencyKey]:
+        return [
+            self.constituency_key_map[constituency_id]
+            for constituency_id in sorted(
+                self.region_constituency_id_map.get(region_id, ())
+            )
+        ]
+
+    def resolve_constituency_id_list(self, constituency_data_list: list) -> List[int]:
+        return self.resolve_bulk_constituency_id_list([constituency_data_list])[0]
+
+    def resolve_bulk_constituency_id_list(
+        self, bulk_constituency_data_list: List[list]
+    ) -> List[List[int]]:
+        """
+        의원별 지역구 요청 데이터(region/district/section) 목록을 id 목록으로 변환
+        - 없는 지역구가 있으면 전부 모아 한 번에 400 응답
+        """
+        bulk_constituency_id_list = []
+        unknown_constituency_list = []
+        for politician_index, constituency_data_list in enumerate(
+            bulk_constituency_data_list
+        ):
+            constituency_id_list = []
+            for constituency_index, data in enumerate(constituency_data_list):
+                constituency_id = self.get_constituency_id(
+                    data.region, data.district, data.section
+                )
+                if constituency_id is None:
+                    unknown_constituency_list.append(
+                        {
+                            "politician_index": politician_index,
+                            "constituency_index": constituency_index,
+                            "region": data.region,
+                            "district": data.district,
+                            "section": data.section,
+                        }
+                    )
+                constituency_id_list.append(constituency_id)
+            bulk_constituency_id_list.append(constituency_id_list)
+
+        if unknown_constituency_list:
+            raise HTTPException(
+                status_code=HTTP_400_BAD_REQUEST,
+                detail={
+                    "message": "Constituency info not found",
+                    "unknown_constituency": unknown_constituency_list,
+                },
+            )
+        return bulk_constituency_id_list
+
+
+constituency_catalog = ConstituencyCatalog()
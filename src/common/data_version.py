@@ -0,0 +1,152 @@
+import asyncio
+import logging
+import time
+from typing import Optional
+from uuid import uuid4
+
+import redis.asyncio
+from redis import RedisError
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from config import settings
+from database.connection import SessionFactory, get_async_redis_client
+from repositories.data_version_repository import DataVersionRepository
+
+logger = logging.getLogger("uvicorn")
+
+
+class DataVersion:
+    """
+    공개 데이터 버전 카운터
+    - 관리자 쓰기 작업이 commit 된 뒤 bump() 호출
+    - 캐시는 생성 시점의 버전과 현재 버전이 다르면 폐기
+    - tag는 프로세스별 epoch를 포함하므로 워커 간 버전 번호가 겹쳐도 충돌하지 않음
+    - redis_client가 있으면 redis에, 없으면 session_factory 로 public_data_version 테이블에
+      버전을 저장해 모든 워커가 같은 버전을 공유 (저장소 오류 시 프로세스 내 카운터로 동작)
+    - get()/get_tag() 는 요청마다 redis 를 조회하지 않고 refresh_interval 초마다 갱신한 값을 사용
+      (다른 워커의 bump() 는 최대 refresh_interval 초 뒤 반영, 자기 워커의 bump() 는 즉시 반영)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        redis_client: Optional[redis.asyncio.Redis] = None,
+        refresh_interval: float = 1.0,
+        session_factory: Optional[async_sessionmaker] = None,
+    ) -> None:
+        self.name = name
+        self.epoch = uuid4().hex[:12]
+        self.version = 0
+        self.shared_version: Optional[int] = None
+        self.redis_client = redis_client
+        self.redis_key = f"wip:data_version:{name}"
+        self.session_factory = session_factory
+        self.refresh_interval = refresh_interval
+        self.refresher_task: Optional[asyncio.Task] = None
+
+    def is_shared(self) -> bool:
+        return self.redis_client is not None or self.session_factory is not None
+
+    def get_initial_version(self) -> int:
+        # 저장된 버전이 유실돼도 이전 버전과 겹치지 않도록 현재 시각(ms)으로 초기화
+        return int(time.time() * 1000)
+
+    async def read_shared_version(self) -> int:
+        if self.redis_client is not None:
+            shared_version = await self.redis_client.get(self.redis_key)
+            if shared_version is None:
+                await self.redis_client.set(
+                    self.redis_key, self.get_initial_version(), nx=True
+                )
+                shared_version = await self.redis_client.get(self.redis_key)
+            return int(shared_version)
+
+        async with self.session_factory() as session:
+            data_version_repo = DataVersionRepository(session)
+            shared_version = await data_version_repo.select_data_version(self.name)
+            if shared_version is None:
+                try:
+                    await data_version_repo.insert_data_version(
+                        self.name, self.get_initial_version()
+                    )
+                    await session.commit()
+                except IntegrityError:
+                    # 다른 워커가 먼저 행을 만든 경우
+                    await session.rollback()
+                shared_version = await data_version_repo.select_data_version(self.name)
+            return shared_version
+
+    async def incr_shared_version(self) -> int:
+        await self.read_shared_version()
+        if self.redis_client is not None:
+            return await self.redis_client.incr(self.redis_key)
+
+        async with self.session_factory() as session:
+            data_version_repo = DataVersionRepository(session)
+            await data_version_repo.increment_data_version(self.name)
+            await session.commit()
+            return await data_version_repo.select_data_version(self.name)
+
+    async def refresh(self) -> None:
+        if not self.is_shared():
+            return
+        try:
+            self.shared_version = await self.read_shared_version()
+        except (RedisError, SQLAlchemyError) as e:
+            logger.error(f"Failed to read shared data version: {e}")
+            self.shared_version = None
+
+    def start(self) -> None:
+        if not self.is_shared() or self.refresher_task is not None:
+            return
+        self.refresher_task = asyncio.create_task(self.run_refresher())
+
+    async def stop(self) -> None:
+        if self.refresher_task is None:
+            return
+        self.refresher_task.cancel()
+        await asyncio.gather(self.refresher_task, return_exceptions=True)
+        self.refresher_task = None
+
+    async def run_refresher(self) -> None:
+        while True:
+            await self.refresh()
+            await asyncio.sleep(self.refresh_interval)
+
+    def get(self) -> int:
+        if self.shared_version is not None:
+            return self.shared_version
+        return self.version
+
+    def get_tag(self) -> str:
+        if self.shared_version is not None:
+            return f"shared-{self.shared_version}"
+        return f"{self.epoch}-{self.version}"
+
+    async def bump(self) -> int:
+        self.version += 1
+        if self.is_shared():
+            try:
+                self.shared_version = await self.incr_shared_version()
+            except (RedisError, SQLAlchemyError) as e:
+                logger.error(f"Failed to bump shared data version: {e}")
+                self.shared_version = None
+        logger.info(f"Public data version bumped to {self.get()}")
+        return self.get()
+
+
+# redis 캐시를 쓰지 않는 배포에서도 워커 간 스냅샷/ETag 가 어긋나지 않도록 DB 에 버전을 공유
+politician_data_version = (
+    DataVersion(
+        "politician",
+        redis_client=get_async_redis_client(settings.redis_settings.redis_cache_db),
+        refresh_interval=float(settings.data_version_refresh_interval),
+    )
+    if settings.redis_settings.redis_cache_enabled
+    else DataVersion(
+        "politician",
+        refresh_interval=float(settings.data_version_refresh_interval),
+        session_factory=SessionFactory,
+    )
+)
@@ -1,6 +1,21 @@
 from enum import Enum
 
 
+class SearchCategory(Enum):
+    """
+    공개 API 검색 분류 (검색 통계 집계용)
+    - POLITICIAN: 의원 개별 조회
+    - NAME / PARTY / REGION: 의원 목록 이름/정당/지역 검색
+    - LIST: 조건 없는 의원 목록 조회
+    """
+
+    POLITICIAN = "politician"
+    NAME = "name"
+    PARTY = "party"
+    REGION = "region"
+    LIST = "list"
+
+
 class RegionType(Enum):
     """
     대분류 지역구 종류
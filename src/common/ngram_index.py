@@ -0,0 +1,161 @@
+import asyncio
+import logging
+import time
+from typing import Dict, Set, List, Optional, Callable, Tuple, Awaitable
+
+logger = logging.getLogger("uvicorn")
+
+
+def make_ngram_set(text: str) -> Set[str]:
+    text = text.lower()
+    ngram_set = set(text)
+    ngram_set.update(text[i : i + 2] for i in range(len(text) - 1))
+    return ngram_set
+
+
+def make_query_ngram_set(keyword: str) -> Set[str]:
+    if len(keyword) == 1:
+        return {keyword}
+    return {keyword[i : i + 2] for i in range(len(keyword) - 1)}
+
+
+class AssemblyTermIndex:
+    def __init__(self, data_version: int) -> None:
+        self.data_version = data_version
+        self.documents: Dict[int, Dict[str, str]] = {}
+        self.postings: Dict[str, Dict[str, Set[int]]] = {
+            field: {} for field in PoliticianNgramIndex.search_fields
+        }
+
+    def add(self, politician_id: int, document: Dict[str, str]) -> None:
+        self.remove(politician_id)
+        self.documents[politician_id] = {
+            field: (document[field] or "").lower()
+            for field in PoliticianNgramIndex.search_fields
+        }
+        for field in PoliticianNgramIndex.search_fields:
+            for ngram in make_ngram_set(self.documents[politician_id][field]):
+                self.postings[field].setdefault(ngram, set()).add(politician_id)
+
+    def remove(self, politician_id: int) -> None:
+        document = self.documents.pop(politician_id, None)
+        if document is None:
+            return
+        for field in PoliticianNgramIndex.search_fields:
+            for ngram in make_ngram_set(document[field]):
+                posting = self.postings[field].get(ngram)
+                if posting is None:
+                    continue
+                posting.discard(politician_id)
+                if not posting:
+                    del self.postings[field][ngram]
+
+    def search(self, field: str, keyword: str) -> List[int]:
+        keyword = keyword.lower()
+        if not keyword:
+            return sorted(self.documents.keys())
+
+        posting_list = []
+        for ngram in make_query_ngram_set(keyword):
+            posting = self.postings[field].get(ngram)
+            if not posting:
+                return []
+            posting_list.append(posting)
+        posting_list.sort(key=len)
+        candidate_id_set = set.intersection(*posting_list)
+
+        return sorted(
+            politician_id
+            for politician_id in candidate_id_set
+            if keyword in self.documents[politician_id][field]
+        )
+
+
+class PoliticianNgramIndex:
+    """
+    국회의원 이름/정당 n-gram 역색인
+    - 회기별로 unigram, bigram -> 의원 id 집합 유지
+    - 검색어 bigram posting의 교집합으로 후보를 좁힌 뒤 원문 포함 여부로 확정
+      (LIKE '%keyword%' 와 같은 결과)
+    - 관리자 쓰기 후 변경된 의원만 갱신, 다른 워커의 쓰기로 버전이 바뀌면 해당 회기 재구성
+    """
+
+    search_fields = ("name", "political_party")
+
+    def __init__(self) -> None:
+        self.term_index_map: Dict[int, AssemblyTermIndex] = {}
+        self.lock = asyncio.Lock()
+        self.rebuild_count = 0
+        self.incremental_update_count = 0
+        self.last_rebuild_ms: Optional[float] = None
+
+    async def search(
+        self,
+        assembly_term: int,
+        field: str,
+        keyword: str,
+        data_version: int,
+        loader: Callable[[int], Awaitable[List[Tuple[int, str, str]]]],
+    ) -> List[int]:
+        term_index = self.term_index_map.get(assembly_term)
+        if term_index is None or term_index.data_version != data_version:
+            async with self.lock:
+                term_index = self.term_index_map.get(assembly_term)
+                if term_index is None or term_index.data_version != data_version:
+                    term_index = self.rebuild(
+                        assembly_term, data_version, await loader(assembly_term)
+                    )
+        return term_index.search(field, keyword)
+
+    def rebuild(
+        self,
+        assembly_term: int,
+        data_version: int,
+        politician_data_list: List[Tuple[int, str, str]],
+    ) -> AssemblyTermIndex:
+        start_time = time.perf_counter()
+        term_index = AssemblyTermIndex(data_version)
+        for politician_id, name, political_party in politician_data_list:
+            term_index.add(
+                politician_id, {"name": name, "political_party": political_party}
+            )
+        self.term_index_map[assembly_term] = term_index
+
+        self.rebuild_count += 1
+        self.last_rebuild_ms = (time.perf_counter() - start_time) * 1000
+        logger.info(
+            f"Rebuilt politician search index - assembly_term: {assembly_term}, "
+            f"size: {len(term_index.documents)}, elapsed: {self.last_rebuild_ms:.2f}ms"
+        )
+        return term_index
+
+    def apply_changes(
+        self, politician_data_list: List[Tuple[int, dict]], new_data_version: int
+    ) -> None:
+        # await 없이 한 번에 반영되므로 이벤트 루프 안에서 별도 잠금 불필요
+        for assembly_term, term_index in list(self.term_index_map.items()):
+            # 직전 버전에서 최신 상태였던 색인만 변경분을 반영, 나머지는 다음 검색 시 재구성
+            if term_index.data_version != new_data_version - 1:
+                del self.term_index_map[assembly_term]
+                continue
+            for politician_id, document in politician_data_list:
+                if document["assembly_term"] == assembly_term:
+                    term_index.add(politician_id, document)
+                else:
+                    term_index.remove(politician_id)
+            term_index.data_version = new_data_version
+        self.incremental_update_count += 1
+
+    def get_stats(self) -> dict:
+        return {
+            "indexed_assembly_terms": sorted(self.term_index_map.keys()),
+            "document_count": sum(
+                len(term_index.documents) for term_index in self.term_index_map.values()
+            ),
+            "rebuild_count": self.rebuild_count,
+            "incremental_update_count": self.incremental_update_count,
+            "last_rebuild_ms": self.last_rebuild_ms,
+        }
+
+
+politician_search_index = PoliticianNgramIndex()
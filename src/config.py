@@ -12,12 +12,21 @@ class MysqlSettings(BaseSettings):
     db_port: int = os.getenv("DB_PORT")
     database_name: str = os.getenv("DB_NAME")
     echo: bool = os.getenv("DB_ECHO")
+    async_db_protocol: str = os.getenv("ASYNC_DB_PROTOCOL", "mysql+aiomysql")
+    pool_size: int = os.getenv("DB_POOL_SIZE", 10)
+    max_overflow: int = os.getenv("DB_MAX_OVERFLOW", 20)
+    pool_recycle: int = os.getenv("DB_POOL_RECYCLE", 3600)
 
 
 class RedisSettings(BaseSettings):
     redis_host: str = Field(default="localhost", env="REDIS_HOST")
     redis_port: int = Field(default=6379, env="REDIS_PORT")
     auth_num_db: int = Field(default=0, env="AUTH_NUM_DB")
+    redis_cache_enabled: bool = Field(default=False, env="REDIS_CACHE_ENABLED")
+    redis_cache_db: int = Field(default=1, env="REDIS_CACHE_DB")
+    response_cache_ttl: int = Field(default=300, env="RESPONSE_CACHE_TTL")
+    constituency_cache_ttl: int = Field(default=86400, env="CONSTITUENCY_CACHE_TTL")
+    jti_cache_ttl: int = Field(default=30, env="JTI_CACHE_TTL")
 
 
 class Settings(BaseSettings):
@@ -26,14 +35,63 @@ class Settings(BaseSettings):
     port: int = os.getenv("PORT")
     mysql_settings: MysqlSettings = MysqlSettings()
     mysql_dsn: MySQLDsn = f"{mysql_settings.db_protocol}://{mysql_settings.db_user}:{mysql_settings.db_password}@{mysql_settings.db_host}:{mysql_settings.db_port}/{mysql_settings.database_name}"
+    mysql_async_dsn: MySQLDsn = f"{mysql_settings.async_db_protocol}://{mysql_settings.db_user}:{mysql_settings.db_password}@{mysql_settings.db_host}:{mysql_settings.db_port}/{mysql_settings.database_name}"
     jwt_algorithm: str = os.getenv("JWT_ALGORITHM")
     access_token_secret_key: str = os.getenv("ACCESS_TOKEN_SECRET_KEY")
     access_token_exp: int = os.getenv("ACCESS_TOKEN_EXP")
     refresh_token_secret_key: str = os.getenv("REFRESH_TOKEN_SECRET_KEY")
     refresh_token_exp: int = os.getenv("REFRESH_TOKEN_EXP")
+    refresh_token_digest_key: str = os.getenv("REFRESH_TOKEN_DIGEST_KEY")
     sender_gmail: EmailStr = os.getenv("SENDER_GMAIL")
     gmail_password: str = os.getenv("GMAIL_PASSWORD")
     redis_settings: RedisSettings = RedisSettings()
+    public_list_cache_enabled: bool = os.getenv("PUBLIC_LIST_CACHE_ENABLED", True)
+    data_version_refresh_interval: float = os.getenv(
+        "DATA_VERSION_REFRESH_INTERVAL", 1.0
+    )
+    public_response_bytes_cache_size: int = os.getenv(
+        "PUBLIC_RESPONSE_BYTES_CACHE_SIZE", 0
+    )
+    bcrypt_pool_size: int = os.getenv("BCRYPT_POOL_SIZE", 2)
+    bcrypt_queue_size: int = os.getenv("BCRYPT_QUEUE_SIZE", 16)
+    verified_token_cache_size: int = os.getenv("VERIFIED_TOKEN_CACHE_SIZE", 1024)
+    bulk_insert_chunk_size: int = os.getenv("BULK_INSERT_CHUNK_SIZE", 500)
+    bulk_import_max_line_bytes: int = os.getenv("BULK_IMPORT_MAX_LINE_BYTES", 1048576)
+    bulk_import_max_error_count: int = os.getenv("BULK_IMPORT_MAX_ERROR_COUNT", 1000)
+    bulk_import_worker_count: int = os.getenv("BULK_IMPORT_WORKER_COUNT", 1)
+    bulk_import_queue_size: int = os.getenv("BULK_IMPORT_QUEUE_SIZE", 8)
+    bulk_import_max_body_bytes: int = os.getenv("BULK_IMPORT_MAX_BODY_BYTES", 104857600)
+    bulk_import_progress_interval: float = os.getenv(
+        "BULK_IMPORT_PROGRESS_INTERVAL", 1.0
+    )
+    bulk_import_job_timeout: float = os.getenv("BULK_IMPORT_JOB_TIMEOUT", 600.0)
+    audit_log_batch_size: int = os.getenv("AUDIT_LOG_BATCH_SIZE", 100)
+    audit_log_flush_interval: float = os.getenv("AUDIT_LOG_FLUSH_INTERVAL", 1.0)
+    audit_log_fallback_path: str = os.getenv(
+        "AUDIT_LOG_FALLBACK_PATH", "admin_log_fallback.jsonl"
+    )
+    # 0 이면 보관 이전 작업을 실행하지 않음
+    admin_log_retention_days: int = os.getenv("ADMIN_LOG_RETENTION_DAYS", 0)
+    admin_log_archive_dir: str = os.getenv("ADMIN_LOG_ARCHIVE_DIR", "admin_log_archive")
+    admin_log_archive_interval: float = os.getenv("ADMIN_LOG_ARCHIVE_INTERVAL", 3600)
+    admin_log_archive_batch_size: int = os.getenv("ADMIN_LOG_ARCHIVE_BATCH_SIZE", 1000)
+    public_search_log_bucket_seconds: int = os.getenv(
+        "PUBLIC_SEARCH_LOG_BUCKET_SECONDS", 300
+    )
+    public_search_log_flush_interval: float = os.getenv(
+        "PUBLIC_SEARCH_LOG_FLUSH_INTERVAL", 10.0
+    )
+    public_search_log_max_key_count: int = os.getenv(
+        "PUBLIC_SEARCH_LOG_MAX_KEY_COUNT", 10000
+    )
+    trending_capacity: int = os.getenv("TRENDING_CAPACITY", 500)
+    trending_refresh_interval: float = os.getenv("TRENDING_REFRESH_INTERVAL", 5.0)
+    trending_checkpoint_path: str = os.getenv(
+        "TRENDING_CHECKPOINT_PATH", "politician_trending_checkpoint.json"
+    )
+    trending_checkpoint_interval: float = os.getenv(
+        "TRENDING_CHECKPOINT_INTERVAL", 60.0
+    )
 
     model_config = SettingsConfigDict(validate_default=False)
 
@@ -1,15 +1,54 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+import redis
+import redis.asyncio
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 
 from config import settings
 
-engine = create_engine(url=str(settings.mysql_dsn), echo=settings.mysql_settings.echo)
-SessionFactory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+mysql_config = settings.mysql_settings
+engine = create_async_engine(
+    url=str(settings.mysql_async_dsn),
+    echo=mysql_config.echo,
+    pool_size=int(mysql_config.pool_size),
+    max_overflow=int(mysql_config.max_overflow),
+    pool_recycle=int(mysql_config.pool_recycle),
+    pool_pre_ping=True,
+)
+SessionFactory = async_sessionmaker(
+    bind=engine, autoflush=False, expire_on_commit=False
+)
 
 
-def get_db():
-    session = SessionFactory()
+async def get_db():
+    session: AsyncSession = SessionFactory()
     try:
         yield session
     finally:
-        session.close()
+        await session.close()
+
+
+def get_redis_client(db: int, decode_responses: bool = True) -> redis.Redis:
+    redis_config = settings.redis_settings
+    return redis.Redis(
+        host=redis_config.redis_host,
+        port=redis_config.redis_port,
+        db=db,
+        encoding="UTF-8",
+        decode_responses=decode_responses,
+        socket_connect_timeout=1,
+        socket_timeout=1,
+    )
+
+
+def get_async_redis_client(
+    db: int, decode_responses: bool = True
+) -> redis.asyncio.Redis:
+    redis_config = settings.redis_settings
+    return redis.asyncio.Redis(
+        host=redis_config.redis_host,
+        port=redis_config.redis_port,
+        db=db,
+        encoding="UTF-8",
+        decode_responses=decode_responses,
+        socket_connect_timeout=1,
+        socket_timeout=1,
+    )
@@ -10,6 +10,8 @@ from sqlalchemy import (
     ForeignKey,
     Boolean,
     BigInteger,
+    Computed,
+    Index,
 )
 from sqlalchemy.orm import declarative_base, relationship, Mapped, mapped_column
 
@@ -57,6 +59,14 @@ class Admin(Base, DateTimeMixin):
 
 class Politician(Base, DateTimeMixin):
     __tablename__ = "politician"
+    __table_args__ = (
+        Index(
+            "ix_politician_assembly_term_promise_execution_rate_id",
+            "assembly_term",
+            "promise_execution_rate",
+            "id",
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     assembly_term: Mapped[int] = mapped_column(
@@ -103,6 +113,17 @@ class Politician(Base, DateTimeMixin):
     total_executed_funds: Mapped[int] = mapped_column(
         BigInteger, nullable=True, comment="집행 재정 총액"
     )
+    promise_execution_rate: Mapped[int] = mapped_column(
+        Integer,
+        Computed(
+            "CASE WHEN total_promise_count > 0 THEN "
+            "CAST(completed_promise_count * 100 / total_promise_count AS SIGNED INTEGER) "
+            "END",
+            persisted=True,
+        ),
+        nullable=True,
+        comment="공약 이행률",
+    )
     notes: Mapped[json] = mapped_column(JSON, nullable=True)
 
     promise_count_detail: Mapped["PromiseCountDetail"] = relationship(
@@ -253,6 +274,10 @@ class Jurisdiction(Base, DateTimeMixin):
 
 class AdminLog(Base, DateTimeMixin):
     __tablename__ = "admin_log"
+    __table_args__ = (
+        Index("ix_admin_log_created_at_id", "created_at", "id"),
+        Index("ix_admin_log_admin_id_created_at_id", "admin_id", "created_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     admin_id: Mapped[int] = mapped_column(
@@ -273,6 +298,14 @@ class AdminLog(Base, DateTimeMixin):
 
 class PublicSearchLog(Base, DateTimeMixin):
     __tablename__ = "public_search_log"
+    __table_args__ = (
+        Index(
+            "ix_public_search_log_bucket_at_category",
+            "bucket_at",
+            "search_category",
+            "politician_id",
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     search_category: Mapped[str] = mapped_column(
@@ -281,5 +314,52 @@ class PublicSearchLog(Base, DateTimeMixin):
     politician_id: Mapped[int] = mapped_column(
         ForeignKey("politician.id"), nullable=True, comment="의원 id"
     )
+    bucket_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, comment="집계 구간 시작 시각"
+    )
+    search_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=1, comment="구간 내 검색 수"
+    )
 
     politician: Mapped["Politician"] = relationship(back_populates="public_search_log")
+
+
+class PublicDataVersion(Base, DateTimeMixin):
+    __tablename__ = "public_data_version"
+
+    name: Mapped[str] = mapped_column(String(50), primary_key=True, comment="데이터 이름")
+    version: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, comment="공개 데이터 버전"
+    )
+
+
+class BulkImportJob(Base, DateTimeMixin):
+    __tablename__ = "bulk_import_job"
+
+    id: Mapped[str] = mapped_column(String(32), primary_key=True, comment="작업 id")
+    admin_id: Mapped[int] = mapped_column(
+        ForeignKey("admin.id"), nullable=False, comment="관리자 id"
+    )
+    status: Mapped[str] = mapped_column(String(20), nullable=False, comment="작업 상태")
+    body_bytes: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, comment="요청 body 크기"
+    )
+    processed_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, comment="처리한 행 수"
+    )
+    inserted_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, comment="등록한 의원 수"
+    )
+    error_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, comment="오류 행 수"
+    )
+    error_list: Mapped[json] = mapped_column(JSON, nullable=True, comment="행 오류 목록")
+    failure_detail: Mapped[json] = mapped_column(
+        JSON, nullable=True, comment="작업 실패 사유"
+    )
+    started_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=True, comment="작업 시작 시각"
+    )
+    finished_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=True, comment="작업 종료 시각"
+    )
@@ -6,12 +6,21 @@ from fastapi.middleware.cors import CORSMiddleware
 from starlette.status import HTTP_200_OK
 
 from config import settings
+from common.data_version import politician_data_version
+from database.connection import engine
+from admin.admin_log_archive import admin_log_archiver
+from admin.audit_log_writer import audit_log_writer
 from admin.auth.auth_router import router as AdminAuthApiRouter
+from admin.auth.bcrypt_executor import bcrypt_executor
+from admin.auth.jti_cache import admin_jti_cache
+from admin.politician.bulk_import_job import bulk_import_job_queue
 from admin.dev.dev_router import router as AdminDevApiRouter
 from admin.politician.politician_router import router as AdminPoliticianApiRouter
 from admin.dashboard.dashboard_router import router as AdminDashboardApiRouter
 
 from public.public_router import router as PublicApiRouter
+from public.public_search_aggregator import public_search_aggregator
+from public.public_trending import politician_trending_tracker
 
 uvicorn_logger = logging.getLogger("uvicorn")
 uvicorn_logger.setLevel(logging.INFO)
@@ -50,6 +59,88 @@ def custom_openapi():
 app.openapi = custom_openapi
 
 
+@app.on_event("startup")
+def start_jti_invalidation_listener() -> None:
+    admin_jti_cache.start_listener()
+
+
+@app.on_event("shutdown")
+def stop_jti_invalidation_listener() -> None:
+    admin_jti_cache.stop_listener()
+
+
+@app.on_event("startup")
+async def start_data_version_refresher() -> None:
+    politician_data_version.start()
+
+
+@app.on_event("shutdown")
+async def stop_data_version_refresher() -> None:
+    await politician_data_version.stop()
+
+
+@app.on_event("startup")
+async def start_bulk_import_workers() -> None:
+    bulk_import_job_queue.start()
+    await bulk_import_job_queue.fail_stale_jobs()
+
+
+@app.on_event("shutdown")
+async def stop_bulk_import_workers() -> None:
+    await bulk_import_job_queue.stop()
+
+
+@app.on_event("startup")
+async def start_audit_log_writer() -> None:
+    audit_log_writer.start()
+
+
+@app.on_event("shutdown")
+async def stop_audit_log_writer() -> None:
+    # 대량 등록 작업이 남긴 로그까지 DB 연결을 닫기 전에 삽입
+    await audit_log_writer.stop()
+
+
+@app.on_event("startup")
+async def start_admin_log_archiver() -> None:
+    admin_log_archiver.start()
+
+
+@app.on_event("shutdown")
+async def stop_admin_log_archiver() -> None:
+    await admin_log_archiver.stop()
+
+
+@app.on_event("startup")
+async def start_public_search_aggregator() -> None:
+    public_search_aggregator.start()
+
+
+@app.on_event("shutdown")
+async def stop_public_search_aggregator() -> None:
+    await public_search_aggregator.stop()
+
+
+@app.on_event("startup")
+async def start_politician_trending_checkpoint() -> None:
+    politician_trending_tracker.start()
+
+
+@app.on_event("shutdown")
+async def stop_politician_trending_checkpoint() -> None:
+    await politician_trending_tracker.stop()
+
+
+@app.on_event("shutdown")
+async def dispose_database_engine() -> None:
+    await engine.dispose()
+
+
+@app.on_event("shutdown")
+def shutdown_bcrypt_executor() -> None:
+    bcrypt_executor.shutdown()
+
+
 @app.get("/", status_code=HTTP_200_OK, summary="Health Check")
 def health_check_handler() -> str:
     return "For the better world by WIP"
@@ -0,0 +1,100 @@
+import asyncio
+import logging
+import time
+from typing import List, Dict, Optional, Callable, Awaitable
+
+from common.data_version import politician_data_version
+from schema.public_response import PublicPoliticianListElementResSchema
+
+logger = logging.getLogger("uvicorn")
+
+
+class PoliticianListSnapshot:
+    def __init__(
+        self,
+        data_version: int,
+        politician_list: List[PublicPoliticianListElementResSchema],
+    ) -> None:
+        self.data_version = data_version
+        self.politician_map = {
+            politician.id: politician for politician in politician_list
+        }
+        # 공약 이행률 오름차순(NULL 우선), id 오름차순 - DB 정렬 순서와 동일
+        self.asc_politician_list = sorted(
+            politician_list,
+            key=lambda x: (
+                x.promise_execution_rate is not None,
+                x.promise_execution_rate or 0,
+                x.id,
+            ),
+        )
+        self.desc_politician_list = self.asc_politician_list[::-1]
+
+    def get_sorted_list(
+        self, sort_type: str
+    ) -> List[PublicPoliticianListElementResSchema]:
+        if sort_type == "desc":
+            return self.desc_politician_list
+        return self.asc_politician_list
+
+
+class PublicPoliticianListCache:
+    def __init__(self) -> None:
+        self.snapshot_map: Dict[int, PoliticianListSnapshot] = {}
+        self.lock = asyncio.Lock()
+        self.hit_count = 0
+        self.miss_count = 0
+        self.rebuild_count = 0
+        self.last_rebuild_ms: Optional[float] = None
+        self.total_rebuild_ms = 0.0
+
+    async def get_snapshot(
+        self,
+        assembly_term: int,
+        loader: Callable[[int], Awaitable[List[PublicPoliticianListElementResSchema]]],
+    ) -> PoliticianListSnapshot:
+        current_version = politician_data_version.get()
+        snapshot = self.snapshot_map.get(assembly_term)
+        if snapshot and snapshot.data_version == current_version:
+            self.hit_count += 1
+            return snapshot
+
+        async with self.lock:
+            snapshot = self.snapshot_map.get(assembly_term)
+            if snapshot and snapshot.data_version == current_version:
+                self.hit_count += 1
+                return snapshot
+
+            self.miss_count += 1
+            start_time = time.perf_counter()
+            snapshot = PoliticianListSnapshot(
+                current_version, await loader(assembly_term)
+            )
+            rebuild_ms = (time.perf_counter() - start_time) * 1000
+
+            self.snapshot_map[assembly_term] = snapshot
+            self.rebuild_count += 1
+            self.last_rebuild_ms = rebuild_ms
+            self.total_rebuild_ms += rebuild_ms
+            logger.info(
+                f"Rebuilt public politician list snapshot - assembly_term: {assembly_term}, "
+                f"version: {current_version}, size: {len(snapshot.asc_politician_list)}, "
+                f"elapsed: {rebuild_ms:.2f}ms"
+            )
+            return snapshot
+
+    def get_stats(self) -> dict:
+        return {
+            "hit_count": self.hit_count,
+            "miss_count": self.miss_count,
+            "rebuild_count": self.rebuild_count,
+            "last_rebuild_ms": self.last_rebuild_ms,
+            "avg_rebuild_ms": self.total_rebuild_ms / self.rebuild_count
+            if self.rebuild_count
+            else None,
+            "data_version": politician_data_version.get(),
+            "cached_assembly_terms": sorted(self.snapshot_map.keys()),
+        }
+
+
+public_politician_list_cache = PublicPoliticianListCache()
@@ -0,0 +1,78 @@
+import hashlib
+import json
+from typing import Optional, Dict
+
+from fastapi import HTTPException, Header, Path, Request, Response, Depends
+from starlette.status import HTTP_304_NOT_MODIFIED
+
+from common.data_version import politician_data_version
+from common.enums import RegionType
+from public.public_service import get_public_constituency_data
+from repositories.area_repository import AreaRepository
+
+
+def make_etag(*parts) -> str:
+    digest = hashlib.sha256(":".join(map(str, parts)).encode("UTF-8")).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def is_etag_matched(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    for requested_tag in if_none_match.split(","):
+        requested_tag = requested_tag.strip()
+        if requested_tag == "*":
+            return True
+        if requested_tag.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+def check_etag(etag: str, if_none_match: Optional[str], response: Response) -> str:
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if is_etag_matched(if_none_match, etag):
+        raise HTTPException(status_code=HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return etag
+
+
+def check_politician_data_etag(
+    request: Request,
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+) -> str:
+    etag = make_etag(
+        politician_data_version.get_tag(),
+        request.url.path,
+        request.url.query,
+    )
+    return check_etag(etag, if_none_match, response)
+
+
+# 지역구 데이터는 정적이므로 지역별 ETag 를 프로세스당 한 번만 계산
+constituency_etag_map: Dict[str, str] = {}
+
+
+async def get_constituency_etag(region: str, area_repository: AreaRepository) -> str:
+    etag = constituency_etag_map.get(region)
+    if etag is None:
+        constituency_list = await get_public_constituency_data(region, area_repository)
+        content = json.dumps(
+            [constituency.model_dump() for constituency in constituency_list],
+            ensure_ascii=False,
+        )
+        etag = make_etag("constituency", RegionType[region].value[1], content)
+        constituency_etag_map[region] = etag
+    return etag
+
+
+async def check_constituency_etag(
+    response: Response,
+    region: str = Path(..., description="대분류 지역구(영문 소문자)"),
+    if_none_match: Optional[str] = Header(None),
+    area_repository: AreaRepository = Depends(),
+) -> str:
+    if region.upper() not in RegionType.__members__:
+        return ""
+    etag = await get_constituency_etag(region.upper(), area_repository)
+    return check_etag(etag, if_none_match, response)
@@ -0,0 +1,140 @@
+import inspect
+import logging
+from collections import OrderedDict
+from threading import Lock
+from typing import Optional, Callable, Any
+
+import redis.asyncio
+from fastapi import Response
+from pydantic import TypeAdapter
+from redis import RedisError
+
+from config import settings
+from database.connection import get_async_redis_client
+
+logger = logging.getLogger("uvicorn")
+
+
+class PublicResponseCache:
+    """
+    워커 간 공유되는 공개 API 응답 캐시
+    - key: wip:public:response:{종류}:{버전 tag}:{경로}:{쿼리}
+    - 관리자 쓰기로 데이터 버전이 바뀌면 이전 key는 조회되지 않고 TTL로 만료 (별도 삭제 없음)
+    - redis 오류 시 캐시 없이 응답 생성
+    - local_max_size > 0 이면 인코딩된 JSON bytes를 프로세스 내 LRU에 보관해
+      redis 왕복 없이 바로 응답 (key에 데이터 버전이 포함되므로 별도 만료 불필요)
+    """
+
+    namespace = "wip:public:response"
+
+    def __init__(
+        self,
+        redis_client: Optional[redis.asyncio.Redis],
+        ttl: int,
+        local_max_size: int = 0,
+    ) -> None:
+        self.redis_client = redis_client
+        self.ttl = ttl
+        self.local_cache: OrderedDict[str, bytes] = OrderedDict()
+        self.local_max_size = local_max_size
+        self.local_lock = Lock()
+        self.local_hit_count = 0
+        self.hit_count = 0
+        self.miss_count = 0
+        self.error_count = 0
+
+    def get_local(self, key: str) -> Optional[bytes]:
+        if not self.local_max_size:
+            return None
+        with self.local_lock:
+            payload = self.local_cache.get(key)
+            if payload is not None:
+                self.local_cache.move_to_end(key)
+            return payload
+
+    def set_local(self, key: str, payload: bytes) -> None:
+        if not self.local_max_size:
+            return
+        with self.local_lock:
+            self.local_cache[key] = payload
+            self.local_cache.move_to_end(key)
+            while len(self.local_cache) > self.local_max_size:
+                self.local_cache.popitem(last=False)
+
+    def make_key(self, *parts) -> str:
+        return ":".join([self.namespace, *map(str, parts)])
+
+    async def get(self, key: str) -> Optional[bytes]:
+        if self.redis_client is None:
+            return None
+        try:
+            return await self.redis_client.get(key)
+        except RedisError as e:
+            self.error_count += 1
+            logger.error(f"RedisError: {e}")
+            return None
+
+    async def set(self, key: str, payload: bytes, ttl: Optional[int] = None) -> None:
+        if self.redis_client is None:
+            return
+        try:
+            await self.redis_client.set(key, payload, ex=ttl or self.ttl)
+        except RedisError as e:
+            self.error_count += 1
+            logger.error(f"RedisError: {e}")
+
+    async def get_response(
+        self,
+        key: str,
+        builder: Callable[[], Any],
+        type_adapter: TypeAdapter,
+        etag: Optional[str] = None,
+        ttl: Optional[int] = None,
+    ) -> Response:
+        headers = {"ETag": etag, "Cache-Control": "no-cache"} if etag else None
+
+        payload = self.get_local(key)
+        if payload is not None:
+            self.local_hit_count += 1
+            return Response(
+                content=payload, media_type="application/json", headers=headers
+            )
+
+        payload = await self.get(key)
+        if payload is not None:
+            self.hit_count += 1
+            self.set_local(key, payload)
+            return Response(
+                content=payload, media_type="application/json", headers=headers
+            )
+
+        self.miss_count += 1
+        result = builder()
+        if inspect.isawaitable(result):
+            result = await result
+        payload = type_adapter.dump_json(result)
+        self.set_local(key, payload)
+        await self.set(key, payload, ttl)
+        return Response(content=payload, media_type="application/json", headers=headers)
+
+    def get_stats(self) -> dict:
+        return {
+            "enabled": self.redis_client is not None,
+            "local_enabled": bool(self.local_max_size),
+            "local_size": len(self.local_cache),
+            "local_hit_count": self.local_hit_count,
+            "hit_count": self.hit_count,
+            "miss_count": self.miss_count,
+            "error_count": self.error_count,
+        }
+
+
+public_response_cache = PublicResponseCache(
+    get_async_redis_client(
+        settings.redis_settings.redis_cache_db, decode_responses=False
+    )
+    if settings.redis_settings.redis_cache_enabled
+    else None,
+    settings.redis_settings.response_cache_ttl,
+    settings.public_response_bytes_cache_size,
+)
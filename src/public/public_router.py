@@ -2,13 +2,22 @@ import logging
 from typing import List, Optional
 
 from fastapi import APIRouter, Path, Depends, Query
-from starlette.status import HTTP_200_OK, HTTP_400_BAD_REQUEST
+from pydantic import TypeAdapter
+from starlette.status import HTTP_200_OK, HTTP_400_BAD_REQUEST, HTTP_304_NOT_MODIFIED
 
 from admin.politician.politician_service import PoliticianService
+from common.enums import SearchCategory
+from config import settings
+from public.public_etag import check_politician_data_etag, check_constituency_etag
+from public.public_response_cache import public_response_cache
+from public.public_search_aggregator import public_search_aggregator
+from public.public_trending import politician_trending_tracker
 from public.public_service import (
     get_public_constituency_data,
     get_public_politician_list,
     get_public_politician_list_by_keyword,
+    get_public_autocomplete_data,
+    get_public_trending_politician_data,
 )
 from repositories.area_repository import AreaRepository
 from repositories.politician_info_repository import PoliticianInfoRepository
@@ -19,10 +28,16 @@ from schema.politician_response import (
 from schema.public_response import (
     PublicConstituencyResSchema,
     PublicPoliticianListElementResSchema,
+    PublicAutocompleteResSchema,
+    PublicTrendingRes,
 )
 
 router = APIRouter()
 
+constituency_list_adapter = TypeAdapter(List[PublicConstituencyResSchema])
+single_politician_adapter = TypeAdapter(GetSinglePoliticianDataRes)
+politician_list_adapter = TypeAdapter(List[PublicPoliticianListElementResSchema])
+
 logger = logging.getLogger("uvicorn")
 
 
@@ -31,15 +46,23 @@ logger = logging.getLogger("uvicorn")
     status_code=HTTP_200_OK,
     responses={
         HTTP_200_OK: {"description": "Get region data"},
+        HTTP_304_NOT_MODIFIED: {"description": "Not modified since If-None-Match"},
         HTTP_400_BAD_REQUEST: {"description": "Bad request"},
     },
     summary="지역구 데이터 조회",
 )
-def get_constituency_public_handler(
+async def get_constituency_public_handler(
     region: str = Path(..., description="대분류 지역구(영문 소문자)"),
+    etag: str = Depends(check_constituency_etag),
     area_repository: AreaRepository = Depends(),
 ) -> List[PublicConstituencyResSchema]:
-    return get_public_constituency_data(region, area_repository)
+    return await public_response_cache.get_response(
+        key=public_response_cache.make_key("constituency", region),
+        builder=lambda: get_public_constituency_data(region, area_repository),
+        type_adapter=constituency_list_adapter,
+        etag=etag,
+        ttl=settings.redis_settings.constituency_cache_ttl,
+    )
 
 
 @router.get(
@@ -47,15 +70,26 @@ def get_constituency_public_handler(
     status_code=HTTP_200_OK,
     responses={
         HTTP_200_OK: {"description": "Get single politician data"},
+        HTTP_304_NOT_MODIFIED: {"description": "Not modified since If-None-Match"},
         HTTP_400_BAD_REQUEST: {"description": "Bad request"},
     },
     summary="국회의원 데이터 개별 조회",
 )
 async def get_single_politician_public_handler(
     politician_id: int = Path(..., description="의원 id"),
+    etag: str = Depends(check_politician_data_etag),
     politician_service: PoliticianService = Depends(),
 ) -> GetSinglePoliticianDataRes:
-    return politician_service.get_politician_by_id(politician_id)
+    response = await public_response_cache.get_response(
+        key=public_response_cache.make_key("politician", etag),
+        builder=lambda: politician_service.get_politician_by_id(politician_id),
+        type_adapter=single_politician_adapter,
+        etag=etag,
+    )
+    # 없는 의원 id 는 조회에서 404 로 끝나므로 응답이 만들어진 뒤에만 집계
+    public_search_aggregator.record(SearchCategory.POLITICIAN, politician_id)
+    politician_trending_tracker.record(politician_id)
+    return response
 
 
 @router.get(
@@ -63,11 +97,13 @@ async def get_single_politician_public_handler(
     status_code=HTTP_200_OK,
     responses={
         HTTP_200_OK: {"description": "Get politician search data"},
+        HTTP_304_NOT_MODIFIED: {"description": "Not modified since If-None-Match"},
         HTTP_400_BAD_REQUEST: {"description": "Bad request"},
     },
     summary="국회의원 데이터 조건별 검색 조회",
 )
 async def get_politician_list_by_keyword_public_handler(
+    etag: str = Depends(check_politician_data_etag),
     assembly_term: int = Path(..., description="국회 회기"),
     name: Optional[str] = Query(None, description="의원 이름"),
     party: Optional[str] = Query(None, description="소속 정당"),
@@ -78,4 +114,68 @@ async def get_politician_list_by_keyword_public_handler(
     politician_info_repository: PoliticianInfoRepository = Depends(),
     area_repository: AreaRepository = Depends(),
 ) -> List[PublicPoliticianListElementResSchema]:
-    return await get_public_politician_list_by_keyword(**locals())
+    kwargs = locals()
+    # 다음 페이지 조회는 같은 검색으로 보고 첫 페이지만 집계 (조건이 2개 이상이면 400 응답)
+    search_category_list = [
+        search_category
+        for search_category, value in (
+            (SearchCategory.NAME, name),
+            (SearchCategory.PARTY, party),
+            (SearchCategory.REGION, region),
+        )
+        if value is not None
+    ] or [SearchCategory.LIST]
+    if page == 0 and len(search_category_list) == 1:
+        public_search_aggregator.record(search_category_list[0])
+    return await public_response_cache.get_response(
+        key=public_response_cache.make_key("politician", etag),
+        builder=lambda: get_public_politician_list_by_keyword(**kwargs),
+        type_adapter=politician_list_adapter,
+        etag=etag,
+    )
+
+
+@router.get(
+    "/politician/autocomplete",
+    status_code=HTTP_200_OK,
+    responses={
+        HTTP_200_OK: {"description": "Get autocomplete suggestions"},
+        HTTP_400_BAD_REQUEST: {"description": "Bad request"},
+    },
+    summary="국회의원 이름/정당/지역구 자동완성",
+)
+async def get_politician_autocomplete_public_handler(
+    assembly_term: int = Query(..., description="국회 회기"),
+    keyword: str = Query(..., min_length=1, description="검색어(초성 입력 가능)"),
+    size: int = Query(default=10, ge=1, le=20),
+    politician_info_repository: PoliticianInfoRepository = Depends(),
+    area_repository: AreaRepository = Depends(),
+) -> List[PublicAutocompleteResSchema]:
+    return await get_public_autocomplete_data(
+        assembly_term, keyword, size, politician_info_repository, area_repository
+    )
+
+
+@router.get(
+    "/politician/trending/{assembly_term}",
+    status_code=HTTP_200_OK,
+    responses={
+        HTTP_200_OK: {"description": "Get most viewed politicians"},
+        HTTP_400_BAD_REQUEST: {"description": "Bad request"},
+    },
+    summary="최근 1시간/1일 조회 수 상위 국회의원",
+    description=(
+        "의원 개별 조회 수 기준 순위 (hour: 최근 55~60분, day: 최근 23~24시간). "
+        "서버 워커별 근사 집계이며 순위는 몇 초 간격으로 갱신"
+    ),
+)
+async def get_politician_trending_public_handler(
+    assembly_term: int = Path(..., description="국회 회기"),
+    window: str = Query("hour", pattern="^(hour|day)$", description="집계 기간"),
+    size: int = Query(default=10, ge=1, le=50),
+    politician_info_repository: PoliticianInfoRepository = Depends(),
+    area_repository: AreaRepository = Depends(),
+) -> PublicTrendingRes:
+    return await get_public_trending_politician_data(
+        assembly_term, window, size, politician_info_repository, area_repository
+    )
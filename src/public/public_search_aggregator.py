@@ -0,0 +1,176 @@
+import asyncio
+import logging
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Optional, Tuple
+
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from common.enums import SearchCategory
+from config import settings
+from database.connection import SessionFactory
+from repositories.search_log_repository import SearchLogRepository
+
+logger = logging.getLogger("uvicorn")
+
+# (구간 시작 unix 시각, 검색 분류, 의원 id)
+SearchCountKey = Tuple[int, str, Optional[int]]
+
+
+class PublicSearchAggregator:
+    """
+    공개 API 검색 횟수 집계
+    - record() 는 (구간, 분류, 의원 id) 별 메모리 카운터만 올리므로 검색 요청에 DB 쓰기가 없음
+    - flush_interval 초마다 또는 키가 max_key_count 개를 넘으면 구간별 합계를 한 번의 executemany 로 삽입
+    - 워커마다 같은 구간의 행을 따로 쓰므로 조회는 항상 search_count 합계로 계산
+    - 삽입 전에 없는 의원 id 의 카운트를 버려 키 하나 때문에 전체 삽입이 외래 키 오류로 실패하지 않도록 함
+    - 삽입 실패 시 카운트를 다시 합쳐 다음 주기에 재시도 (키 수가 max_key_count 의 두 배를 넘으면 버림)
+    """
+
+    def __init__(
+        self,
+        bucket_seconds: int,
+        flush_interval: float,
+        max_key_count: int,
+        session_factory: async_sessionmaker = SessionFactory,
+    ) -> None:
+        self.bucket_seconds = bucket_seconds
+        self.flush_interval = flush_interval
+        self.max_key_count = max_key_count
+        self.session_factory = session_factory
+        self.counter: "Counter[SearchCountKey]" = Counter()
+        self.flush_lock = asyncio.Lock()
+        self.flush_event: Optional[asyncio.Event] = None
+        self.flusher_task: Optional[asyncio.Task] = None
+        self.recorded_count = 0
+        self.flushed_count = 0
+        self.flushed_row_count = 0
+        self.failed_flush_count = 0
+        self.dropped_count = 0
+        self.last_flush_ms: Optional[float] = None
+
+    def record(
+        self, search_category: SearchCategory, politician_id: Optional[int] = None
+    ) -> None:
+        bucket = int(time.time()) // self.bucket_seconds * self.bucket_seconds
+        self.counter[(bucket, search_category.value, politician_id)] += 1
+        self.recorded_count += 1
+        if len(self.counter) >= self.max_key_count and self.flush_event is not None:
+            self.flush_event.set()
+
+    def start(self) -> None:
+        if self.flusher_task is not None:
+            return
+        self.flush_event = asyncio.Event()
+        self.flusher_task = asyncio.create_task(self.run_flusher())
+
+    async def stop(self) -> None:
+        if self.flusher_task is not None:
+            self.flusher_task.cancel()
+            await asyncio.gather(self.flusher_task, return_exceptions=True)
+            self.flusher_task = None
+            self.flush_event = None
+        await self.flush()
+
+    async def run_flusher(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(
+                    self.flush_event.wait(), timeout=self.flush_interval
+                )
+            except asyncio.TimeoutError:
+                pass
+            self.flush_event.clear()
+            await self.flush()
+
+    async def flush(self) -> None:
+        async with self.flush_lock:
+            if not self.counter:
+                return
+            # 삽입을 기다리는 동안 들어온 검색은 새 카운터에 쌓이도록 교체
+            counter, self.counter = self.counter, Counter()
+            start_time = time.perf_counter()
+            try:
+                async with self.session_factory() as session:
+                    search_log_repo = SearchLogRepository(session)
+                    counter = await self.drop_unknown_politician(
+                        counter, search_log_repo
+                    )
+                    data = [
+                        {
+                            "bucket_at": datetime.fromtimestamp(bucket),
+                            "search_category": search_category,
+                            "politician_id": politician_id,
+                            "search_count": search_count,
+                        }
+                        for (bucket, search_category, politician_id), search_count in (
+                            counter.items()
+                        )
+                    ]
+                    await search_log_repo.bulk_insert_search_count_data(data)
+                    await session.commit()
+            except Exception as e:
+                self.failed_flush_count += 1
+                logger.error(f"Failed to flush {len(counter)} search count rows: {e}")
+                self.restore(counter)
+                return
+            self.flushed_count += sum(counter.values())
+            self.flushed_row_count += len(counter)
+            self.last_flush_ms = (time.perf_counter() - start_time) * 1000
+
+    async def drop_unknown_politician(
+        self, counter: "Counter[SearchCountKey]", search_log_repo: SearchLogRepository
+    ) -> "Counter[SearchCountKey]":
+        politician_id_set = {
+            politician_id
+            for _, _, politician_id in counter
+            if politician_id is not None
+        }
+        if not politician_id_set:
+            return counter
+        unknown_politician_id_set = politician_id_set - set(
+            await search_log_repo.select_existing_politician_id_list(
+                list(politician_id_set)
+            )
+        )
+        if not unknown_politician_id_set:
+            return counter
+        known_counter: "Counter[SearchCountKey]" = Counter()
+        for key, search_count in counter.items():
+            if key[2] in unknown_politician_id_set:
+                self.dropped_count += search_count
+            else:
+                known_counter[key] = search_count
+        logger.warning(
+            f"Dropped search counts of unknown politician id: "
+            f"{sorted(unknown_politician_id_set)}"
+        )
+        return known_counter
+
+    def restore(self, counter: "Counter[SearchCountKey]") -> None:
+        if len(self.counter) + len(counter) > self.max_key_count * 2:
+            self.dropped_count += sum(counter.values())
+            logger.warning(f"Dropped {sum(counter.values())} search counts")
+            return
+        self.counter.update(counter)
+
+    def get_stats(self) -> dict:
+        return {
+            "key_count": len(self.counter),
+            "bucket_seconds": self.bucket_seconds,
+            "flush_interval": self.flush_interval,
+            "recorded_count": self.recorded_count,
+            "flushed_count": self.flushed_count,
+            "flushed_row_count": self.flushed_row_count,
+            "failed_flush_count": self.failed_flush_count,
+            "dropped_count": self.dropped_count,
+            "last_flush_ms": self.last_flush_ms,
+        }
+
+
+public_search_aggregator = PublicSearchAggregator(
+    int(settings.public_search_log_bucket_seconds),
+    float(settings.public_search_log_flush_interval),
+    int(settings.public_search_log_max_key_count),
+)
@@ -1,15 +1,18 @@
 import logging
-from functools import lru_cache
 from typing import List
 
 from fastapi import HTTPException
-from sqlalchemy import select
 from starlette.status import HTTP_400_BAD_REQUEST
 
+from common.autocomplete import politician_autocomplete_index
+from common.data_version import politician_data_version
 from common.enums import RegionType
-from database.connection import engine
-from database.models import Region, Constituency
+from config import settings
+from database.models import Politician
+from public.public_cache import public_politician_list_cache
+from public.public_trending import politician_trending_tracker
 from repositories.area_repository import AreaRepository
+from repositories.politician_info_repository import PoliticianInfoRepository
 from schema.politician_response import (
     JurisdictionResSchema,
     GetPoliticianElementOfListRes,
@@ -17,62 +20,129 @@ from schema.politician_response import (
 from schema.public_response import (
     PublicConstituencyResSchema,
     PublicPoliticianListElementResSchema,
+    PublicAutocompleteResSchema,
+    PublicTrendingPoliticianResSchema,
+    PublicTrendingRes,
 )
 
 logger = logging.getLogger("uvicorn")
 
 
-@lru_cache()
-def get_constituency_data_from_db(region_name: str):
-    region_id = next(
-        (region.value[0] for region in RegionType if region.value[1] == region_name),
-        None,
-    )
+async def get_public_constituency_data(
+    region: str, area_repository: AreaRepository
+) -> List[PublicConstituencyResSchema]:
+    region_id, region_name = RegionType[region.upper()].value
+    # 지역구는 정적 데이터이므로 프로세스당 한 번 읽은 카탈로그에서 응답
+    catalog = await area_repository.get_constituency_catalog()
+    return [
+        PublicConstituencyResSchema(
+            region=region_name, district=district, section=section
+        )
+        for _, district, section in catalog.get_region_constituency_key_list(region_id)
+    ]
 
-    with engine.connect() as connection:
-        query = (
-            select(
-                Region.region,
-                Constituency.district,
-                Constituency.section,
-            )
-            .select_from(Constituency)
-            .filter_by(region_id=region_id)
-            .join(
-                Region,
-                Region.id == Constituency.region_id,
-            )
+
+PUBLIC_REGION_QUERY_MAP = {
+    "seoul": "서울",
+    "busan": "부산",
+    "incheon": "인천",
+    "daegu": "대구",
+    "gwangju": "광주",
+    "daejeon": "대전",
+    "ulsan": "울산",
+    "gyeonggi": "경기",
+    "sejong": "세종",
+    "jeju": "제주",
+}
+
+
+def get_region_name_from_query(region: str) -> str:
+    if region not in PUBLIC_REGION_QUERY_MAP.keys():
+        raise HTTPException(
+            status_code=HTTP_400_BAD_REQUEST, detail="Invalid region query string"
         )
-        constituency_obj_list = connection.execute(query).all()
-        constituency_list = [
-            PublicConstituencyResSchema(
-                region=data[0], district=data[1], section=data[2]
+    return PUBLIC_REGION_QUERY_MAP[region]
+
+
+async def get_public_politician_list_res(
+    politician_list: List[Politician], area_repo: AreaRepository
+) -> List[PublicPoliticianListElementResSchema]:
+    jurisdiction_data_map = (
+        await area_repo.select_jurisdiction_data_by_politician_id_list(
+            [politician.id for politician in politician_list]
+        )
+    )
+    return_res = []
+    for politician in politician_list:
+        jurisdiction_list = [
+            JurisdictionResSchema(
+                id=data[0], region=data[1], district=data[2], section=data[3]
             )
-            for data in constituency_obj_list
+            for data in jurisdiction_data_map.get(politician.id, [])
         ]
-        return constituency_list
+        politician_res = PublicPoliticianListElementResSchema.model_validate(politician)
+        politician_res.constituency = jurisdiction_list
+        return_res.append(politician_res)
+    return return_res
 
 
-def get_public_constituency_data(
-    region: str, area_repository: AreaRepository
-) -> List[PublicConstituencyResSchema]:
-    region_name = RegionType[region.upper()].value[1]
+async def load_public_politician_snapshot_data(
+    assembly_term: int,
+    politician_info_repo: PoliticianInfoRepository,
+    area_repo: AreaRepository,
+) -> List[PublicPoliticianListElementResSchema]:
+    politician_list = (
+        await politician_info_repo.select_politician_data_by_assembly_term(
+            assembly_term
+        )
+    )
+    return await get_public_politician_list_res(
+        [politician[0] for politician in politician_list], area_repo
+    )
 
-    cached_data = get_constituency_data_from_db(region_name)
-    logger.info(
-        f"public constituency_data {get_constituency_data_from_db.cache_info()}"
+
+async def get_public_politician_list_from_snapshot(
+    assembly_term: int,
+    sort_type: str,
+    offset: int,
+    size: int,
+    politician_info_repo: PoliticianInfoRepository,
+    area_repo: AreaRepository,
+    name: str = None,
+    party: str = None,
+    region: str = None,
+) -> List[PublicPoliticianListElementResSchema]:
+    snapshot = await public_politician_list_cache.get_snapshot(
+        assembly_term,
+        lambda term: load_public_politician_snapshot_data(
+            term, politician_info_repo, area_repo
+        ),
     )
-    if cached_data is not None:
-        return cached_data
-    logger.info(f"public constituency_data cache none")
-
-    updated_data = area_repository.select_constituency_data_by_region(region_name)
-    constituency_list = [
-        PublicConstituencyResSchema(region=data[0], district=data[1], section=data[2])
-        for data in updated_data
-    ]
+    politician_list = snapshot.get_sorted_list(sort_type)
+
+    if name or party:
+        politician_id_set = set(
+            await politician_info_repo.search_politician_id_list_by_keyword(
+                assembly_term, name, party
+            )
+        )
+        politician_list = [
+            politician
+            for politician in politician_list
+            if politician.id in politician_id_set
+        ]
+    elif region:
+        region_name = get_region_name_from_query(region)
+        politician_list = [
+            politician
+            for politician in politician_list
+            if any(
+                constituency.region == region_name
+                for constituency in politician.constituency or []
+            )
+        ]
 
-    return constituency_list
+    return politician_list[offset : offset + size]
 
 
 async def get_public_politician_list(**kwargs):
@@ -84,49 +154,18 @@ async def get_public_politician_list(**kwargs):
     area_repo = kwargs["area_repo"]
 
     offset = page * size
-    politician_list = politician_info_repo.get_politician_list_data_for_admin(
-        assembly_term, offset, size
+    politician_list = await politician_info_repo.get_politician_list_data_for_admin(
+        assembly_term, offset, size, sort_type
     )
-    return_res = []
-    for politician in politician_list:
-        jurisdiction_data = area_repo.select_jurisdiction_data_by_politician_id(
-            politician[0].id
-        )
-        jurisdiction_list = [
-            JurisdictionResSchema(
-                id=data[0], region=data[1], district=data[2], section=data[3]
-            )
-            for data in jurisdiction_data
-        ]
-        politician_res = PublicPoliticianListElementResSchema.model_validate(
-            politician[0]
-        )
-
-        completed_promise_count = politician[0].completed_promise_count
-        total_promise_count = politician[0].completed_promise_count
-
-        if total_promise_count:
-            politician_res.promise_execution_rate = (
-                completed_promise_count / total_promise_count
-            ) * 100
-        politician_res.constituency = jurisdiction_list
-        return_res.append(politician_res)
-
-    is_reverse = True if sort_type == "desc" else False
-    sorted_res = sorted(
-        return_res,
-        key=lambda x: x.promise_execution_rate
-        if x.promise_execution_rate is not None
-        else float("-inf"),
-        reverse=is_reverse,
+    return await get_public_politician_list_res(
+        [politician[0] for politician in politician_list], area_repo
     )
-    return sorted_res
 
 
 async def get_public_politician_list_by_keyword(
     **kwargs,
 ) -> List[PublicPoliticianListElementResSchema]:
-    assembly_term = (kwargs["assembly_term"],)
+    assembly_term = kwargs["assembly_term"]
     name = kwargs["name"]
     party = kwargs["party"]
     region = kwargs["region"]
@@ -138,111 +177,117 @@ async def get_public_politician_list_by_keyword(
     area_repo = kwargs["area_repository"]
 
     filter_none_count = [name, party, region].count(None)
-    print(filter_none_count)
 
     if filter_none_count < 2:
         raise HTTPException(
             status_code=HTTP_400_BAD_REQUEST,
             detail="Only 0 or 1 filter condition is required",
         )
-    if filter_none_count == 3:
-        return await get_public_politician_list(**locals())
-
-    return_res = []
-    if name or party:
-        politician_list = politician_info_repo.get_politician_search_data_for_admin(
+    if settings.public_list_cache_enabled:
+        return await get_public_politician_list_from_snapshot(
+            assembly_term=assembly_term,
+            sort_type=sort_type,
             offset=offset,
             size=size,
-            assembly_term=assembly_term,
+            politician_info_repo=politician_info_repo,
+            area_repo=area_repo,
             name=name,
             party=party,
+            region=region,
         )
+    if filter_none_count == 3:
+        return await get_public_politician_list(**locals())
 
-        for politician in politician_list:
-            jurisdiction_data = area_repo.select_jurisdiction_data_by_politician_id(
-                politician[0].id
-            )
-            jurisdiction_list = [
-                JurisdictionResSchema(
-                    id=data[0], region=data[1], district=data[2], section=data[3]
-                )
-                for data in jurisdiction_data
-            ]
-            politician_res = PublicPoliticianListElementResSchema.model_validate(
-                politician[0]
+    if name or party:
+        politician_list = (
+            await politician_info_repo.get_politician_search_data_for_admin(
+                offset=offset,
+                size=size,
+                assembly_term=assembly_term,
+                name=name,
+                party=party,
+                sort_type=sort_type,
             )
-
-            completed_promise_count = politician[0].completed_promise_count
-            total_promise_count = politician[0].completed_promise_count
-
-            if total_promise_count:
-                politician_res.promise_execution_rate = (
-                    completed_promise_count / total_promise_count
-                ) * 100
-            politician_res.constituency = jurisdiction_list
-            return_res.append(politician_res)
+        )
+        return_res = await get_public_politician_list_res(
+            [politician[0] for politician in politician_list], area_repo
+        )
     else:
-        region_searched_keyword_replacements = {
-            "seoul": "서울",
-            "busan": "부산",
-            "incheon": "인천",
-            "daegu": "대구",
-            "gwangju": "광주",
-            "daejeon": "대전",
-            "ulsan": "울산",
-            "gyeonggi": "경기",
-            "sejong": "세종",
-            "jeju": "제주",
-        }
-
-        if region not in region_searched_keyword_replacements.keys():
-            raise HTTPException(
-                status_code=HTTP_400_BAD_REQUEST, detail="Invalid region query string"
+        area = get_region_name_from_query(region)
+        region_data = await area_repo.get_region_data_by_random_text(area)
+
+        politician_list = (
+            await politician_info_repo.get_politician_list_data_by_region_id(
+                assembly_term, region_data[0], offset, size, sort_type
             )
+        )
+        return_res = await get_public_politician_list_res(
+            [politician[0] for politician in politician_list], area_repo
+        )
 
-        area = region_searched_keyword_replacements[region]
-        region_data = area_repo.get_region_data_by_random_text(area)
+    return return_res
+
+
+async def get_public_autocomplete_data(
+    assembly_term: int,
+    keyword: str,
+    size: int,
+    politician_info_repo: PoliticianInfoRepository,
+    area_repo: AreaRepository,
+) -> List[PublicAutocompleteResSchema]:
+    async def load_autocomplete_data(term: int):
+        return (
+            await politician_info_repo.select_politician_search_text_by_assembly_term(
+                term
+            ),
+            await area_repo.select_constituency_district_list(),
+        )
 
-        jurisdiction_politician_id_list = (
-            area_repo.select_jurisdiction_data_by_region_id_and_text(
-                offset, size, region_data[0]
-            )
+    suggestion_list = await politician_autocomplete_index.search(
+        assembly_term,
+        keyword,
+        size,
+        politician_data_version.get(),
+        load_autocomplete_data,
+    )
+    return [
+        PublicAutocompleteResSchema(
+            text=suggestion.text,
+            category=suggestion.category,
+            politician_id=suggestion.politician_id,
         )
+        for suggestion in suggestion_list
+    ]
 
-        for politician in jurisdiction_politician_id_list:
-            politician_id = politician[0]
-            politician_data = politician_info_repo.select_total_politician_data_by_id(
-                politician_id
-            )
-            jurisdiction_data = area_repo.select_jurisdiction_data_by_politician_id(
-                politician_id
-            )
-            jurisdiction_list = [
-                JurisdictionResSchema(
-                    id=data[0], region=data[1], district=data[2], section=data[3]
-                )
-                for data in jurisdiction_data
-            ]
-            politician_res = PublicPoliticianListElementResSchema.model_validate(
-                politician_data
-            )
 
-            completed_promise_count = politician_data.completed_promise_count
-            total_promise_count = politician_data.completed_promise_count
-
-            if total_promise_count:
-                politician_res.promise_execution_rate = (
-                    completed_promise_count / total_promise_count
-                ) * 100
-            politician_res.constituency = jurisdiction_list
-            return_res.append(politician_res)
-
-    is_reverse = True if sort_type == "desc" else False
-    sorted_res = sorted(
-        return_res,
-        key=lambda x: x.promise_execution_rate
-        if x.promise_execution_rate is not None
-        else float("-inf"),
-        reverse=is_reverse,
+async def get_public_trending_politician_data(
+    assembly_term: int,
+    window: str,
+    size: int,
+    politician_info_repo: PoliticianInfoRepository,
+    area_repo: AreaRepository,
+) -> PublicTrendingRes:
+    """
+    창(hour/day) 내 조회 수 상위 의원
+    - 순위는 메모리 카운터에서, 의원 정보는 회기별 목록 스냅샷에서 조회 (DB 조회는 스냅샷 재생성 시에만)
+    - 순위는 전체 회기 기준이므로 다른 회기 의원은 건너뜀
+    """
+    snapshot = await public_politician_list_cache.get_snapshot(
+        assembly_term,
+        lambda term: load_public_politician_snapshot_data(
+            term, politician_info_repo, area_repo
+        ),
     )
-    return sorted_res
+    politician_list = []
+    for politician_id, search_count in politician_trending_tracker.get_ranking(window):
+        politician = snapshot.politician_map.get(politician_id)
+        if politician is None:
+            continue
+        politician_list.append(
+            PublicTrendingPoliticianResSchema(
+                **politician.model_dump(), search_count=search_count
+            )
+        )
+        if len(politician_list) >= size:
+            break
+    return PublicTrendingRes(window=window, politician_list=politician_list)
@@ -0,0 +1,293 @@
+import asyncio
+import glob
+import heapq
+import json
+import logging
+import os
+import re
+import time
+from typing import Dict, List, Optional, Tuple
+from uuid import uuid4
+
+from common.process import is_process_alive
+from config import settings
+
+logger = logging.getLogger("uvicorn")
+
+# 창 이름: (구간 길이 초, 구간 수)
+TRENDING_WINDOW_MAP = {"hour": (300, 12), "day": (3600, 24)}
+
+# 체크포인트 파일 이름의 접미사: .{기록한 워커 pid} 또는 .{가져간 워커 pid}.{임의 값}.claimed
+CHECKPOINT_SUFFIX_PATTERN = re.compile(r"^\.(\d+)(\.[0-9a-f]+\.claimed)?$")
+
+
+class SpaceSavingCounter:
+    """
+    Space-Saving 상위 항목 요약 (최대 capacity 개 항목만 보관)
+    - 가득 찬 상태에서 새 항목이 들어오면 최소 카운트 항목을 빼고 그 카운트를 이어받음
+      (카운트는 과대 추정, 오차는 최대 최소 카운트만큼)
+    - 최소 항목은 지연 삭제 힙으로 찾음: 갱신마다 (카운트, 항목) 을 추가하고 꺼낼 때 현재 값과 다르면 버림
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        self.count_map: Dict[int, int] = {}
+        self.heap: List[Tuple[int, int]] = []
+
+    def add(self, item: int, count: int = 1) -> None:
+        if item in self.count_map:
+            self.count_map[item] += count
+        elif len(self.count_map) < self.capacity:
+            self.count_map[item] = count
+        else:
+            min_count, min_item = self.pop_min()
+            del self.count_map[min_item]
+            self.count_map[item] = min_count + count
+        heapq.heappush(self.heap, (self.count_map[item], item))
+        if len(self.heap) > self.capacity * 4:
+            self.heap = [(count, item) for item, count in self.count_map.items()]
+            heapq.heapify(self.heap)
+
+    def pop_min(self) -> Tuple[int, int]:
+        while True:
+            count, item = heapq.heappop(self.heap)
+            if self.count_map.get(item) == count:
+                return count, item
+
+    def to_list(self) -> List[List[int]]:
+        return [[item, count] for item, count in self.count_map.items()]
+
+
+class SlidingWindowCounter:
+    """
+    slice_seconds 길이 구간별 SpaceSavingCounter, 최근 slice_count 개 구간 합계를 창으로 사용
+    (현재 구간은 진행 중이므로 창 길이는 (slice_count - 1) ~ slice_count 구간)
+    """
+
+    def __init__(self, slice_seconds: int, slice_count: int, capacity: int) -> None:
+        self.slice_seconds = slice_seconds
+        self.slice_count = slice_count
+        self.capacity = capacity
+        self.slice_map: Dict[int, SpaceSavingCounter] = {}
+
+    def get_slice_key(self, now: float) -> int:
+        return int(now) // self.slice_seconds
+
+    def add(self, item: int, now: float, count: int = 1) -> None:
+        slice_key = self.get_slice_key(now)
+        counter = self.slice_map.get(slice_key)
+        if counter is None:
+            counter = self.slice_map[slice_key] = SpaceSavingCounter(self.capacity)
+            self.expire(slice_key)
+        counter.add(item, count)
+
+    def expire(self, current_slice_key: int) -> None:
+        for slice_key in list(self.slice_map):
+            if slice_key <= current_slice_key - self.slice_count:
+                del self.slice_map[slice_key]
+
+    def get_ranking(self, now: float) -> List[Tuple[int, int]]:
+        oldest_slice_key = self.get_slice_key(now) - self.slice_count
+        count_map: Dict[int, int] = {}
+        for slice_key, counter in self.slice_map.items():
+            if slice_key <= oldest_slice_key:
+                continue
+            for item, count in counter.count_map.items():
+                count_map[item] = count_map.get(item, 0) + count
+        return heapq.nlargest(
+            self.capacity, count_map.items(), key=lambda entry: (entry[1], -entry[0])
+        )
+
+
+class PoliticianTrendingTracker:
+    """
+    공개 API 의원 조회 수 실시간 순위 (창별 SlidingWindowCounter)
+    - record() 는 창마다 카운터 하나만 올리고, 순위는 refresh_interval 초 동안 캐시해 조회는 메모리에서 응답
+    - checkpoint_interval 초마다/종료 시 구간 카운터를 워커별 파일 checkpoint_path.{pid} 에 기록
+    - 시작 시 종료된 워커의 파일만 가져와 지나지 않은 구간을 합친 뒤 자기 파일에 기록하고 삭제
+      (파일마다 한 워커만 가져가므로 재시작 후에도 카운트가 워커 수만큼 중복되지 않음)
+    - 워커별로 따로 집계하므로 각 워커는 자기가 받은 요청 기준 순위를 응답
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        refresh_interval: float,
+        checkpoint_path: str,
+        checkpoint_interval: float,
+    ) -> None:
+        self.refresh_interval = refresh_interval
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_interval = checkpoint_interval
+        self.worker_id = os.getpid()
+        self.window_counter_map = {
+            window: SlidingWindowCounter(slice_seconds, slice_count, capacity)
+            for window, (slice_seconds, slice_count) in TRENDING_WINDOW_MAP.items()
+        }
+        self.ranking_cache_map: Dict[str, Tuple[float, List[Tuple[int, int]]]] = {}
+        self.checkpoint_task: Optional[asyncio.Task] = None
+        self.recorded_count = 0
+        self.checkpoint_count = 0
+        self.last_checkpoint_ms: Optional[float] = None
+
+    def record(self, politician_id: int) -> None:
+        now = time.time()
+        for window_counter in self.window_counter_map.values():
+            window_counter.add(politician_id, now)
+        self.recorded_count += 1
+
+    def get_ranking(self, window: str) -> List[Tuple[int, int]]:
+        now = time.time()
+        cached = self.ranking_cache_map.get(window)
+        if cached is not None and now - cached[0] < self.refresh_interval:
+            return cached[1]
+        ranking = self.window_counter_map[window].get_ranking(now)
+        self.ranking_cache_map[window] = (now, ranking)
+        return ranking
+
+    def start(self) -> None:
+        if self.checkpoint_task is not None:
+            return
+        self.checkpoint_task = asyncio.create_task(self.run_checkpointer())
+
+    async def stop(self) -> None:
+        if self.checkpoint_task is None:
+            return
+        self.checkpoint_task.cancel()
+        await asyncio.gather(self.checkpoint_task, return_exceptions=True)
+        self.checkpoint_task = None
+        await self.checkpoint()
+
+    async def run_checkpointer(self) -> None:
+        await self.restore_checkpoint()
+        while True:
+            await asyncio.sleep(self.checkpoint_interval)
+            await self.checkpoint()
+
+    async def restore_checkpoint(self) -> None:
+        try:
+            claimed_path_list = await asyncio.to_thread(self.claim_orphan_checkpoint)
+        except OSError as e:
+            logger.error(f"Failed to claim trending checkpoint: {e}")
+            return
+        for claimed_path in claimed_path_list:
+            try:
+                # 파일은 스레드에서 읽고, 카운터 병합은 record() 와 같은 이벤트 루프에서 실행
+                checkpoint_data = await asyncio.to_thread(
+                    self.read_checkpoint, claimed_path
+                )
+                self.load_checkpoint(checkpoint_data)
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                logger.error(f"Failed to load trending checkpoint {claimed_path}: {e}")
+        # 합친 카운트가 자기 파일에 기록된 뒤에만 가져온 파일을 삭제
+        if claimed_path_list and await self.checkpoint():
+            for claimed_path in claimed_path_list:
+                try:
+                    os.remove(claimed_path)
+                except OSError as e:
+                    logger.error(f"Failed to remove trending checkpoint: {e}")
+
+    def make_checkpoint_data(self) -> dict:
+        return {
+            window: {
+                str(slice_key): counter.to_list()
+                for slice_key, counter in window_counter.slice_map.items()
+            }
+            for window, window_counter in self.window_counter_map.items()
+        }
+
+    async def checkpoint(self) -> bool:
+        # 직렬화할 데이터는 이벤트 루프에서 만들어 기록 중 카운터가 바뀌지 않도록 함
+        checkpoint_data = self.make_checkpoint_data()
+        start_time = time.perf_counter()
+        try:
+            await asyncio.to_thread(self.write_checkpoint, checkpoint_data)
+        except OSError as e:
+            logger.error(f"Failed to write trending checkpoint: {e}")
+            return False
+        self.checkpoint_count += 1
+        self.last_checkpoint_ms = (time.perf_counter() - start_time) * 1000
+        return True
+
+    def get_worker_checkpoint_path(self) -> str:
+        return f"{self.checkpoint_path}.{self.worker_id}"
+
+    def write_checkpoint(self, checkpoint_data: dict) -> None:
+        worker_checkpoint_path = self.get_worker_checkpoint_path()
+        temp_path = f"{worker_checkpoint_path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(checkpoint_data, file)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, worker_checkpoint_path)
+
+    def claim_orphan_checkpoint(self) -> List[str]:
+        """
+        종료된 워커의 체크포인트 파일 이름을 바꿔 가져옴
+        - rename 은 원자적이므로 여러 워커가 동시에 시작해도 파일마다 한 워커만 가져감
+        - 실행 중인 다른 워커의 파일은 그 워커가 계속 갱신하므로 가져가지 않음
+        - 워커별 파일 이전의 단일 파일(checkpoint_path)도 주인 없는 파일로 가져감
+        """
+        claimed_path_list = []
+        for path in glob.glob(f"{glob.escape(self.checkpoint_path)}*"):
+            suffix = path[len(self.checkpoint_path) :]
+            if suffix:
+                matched = CHECKPOINT_SUFFIX_PATTERN.match(suffix)
+                if matched is None:
+                    continue
+                owner_id = int(matched.group(1))
+                if owner_id == self.worker_id or is_process_alive(owner_id):
+                    continue
+            claimed_path = (
+                f"{self.checkpoint_path}.{self.worker_id}.{uuid4().hex[:8]}.claimed"
+            )
+            try:
+                os.rename(path, claimed_path)
+            except FileNotFoundError:
+                continue
+            claimed_path_list.append(claimed_path)
+        return claimed_path_list
+
+    def read_checkpoint(self, path: str) -> dict:
+        with open(path, encoding="utf-8") as file:
+            return json.load(file)
+
+    def load_checkpoint(self, checkpoint_data: dict) -> None:
+        current_time = time.time()
+        for window, slice_data in checkpoint_data.items():
+            window_counter = self.window_counter_map.get(window)
+            if window_counter is None:
+                continue
+            oldest_slice_key = (
+                window_counter.get_slice_key(current_time) - window_counter.slice_count
+            )
+            for slice_key, item_list in slice_data.items():
+                if int(slice_key) <= oldest_slice_key:
+                    continue
+                slice_time = int(slice_key) * window_counter.slice_seconds
+                for item, count in item_list:
+                    window_counter.add(item, slice_time, count)
+        self.ranking_cache_map.clear()
+        logger.info("Loaded trending checkpoint")
+
+    def get_stats(self) -> dict:
+        return {
+            "recorded_count": self.recorded_count,
+            "checkpoint_count": self.checkpoint_count,
+            "last_checkpoint_ms": self.last_checkpoint_ms,
+            "tracked_count": {
+                window: sum(
+                    len(counter.count_map)
+                    for counter in window_counter.slice_map.values()
+                )
+                for window, window_counter in self.window_counter_map.items()
+            },
+        }
+
+
+politician_trending_tracker = PoliticianTrendingTracker(
+    int(settings.trending_capacity),
+    float(settings.trending_refresh_interval),
+    settings.trending_checkpoint_path,
+    float(settings.trending_checkpoint_interval),
+)
@@ -1,13 +1,14 @@
 import logging
-from typing import Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 
 from fastapi import Depends, HTTPException
-from sqlalchemy import select, or_, insert
-from sqlalchemy.orm import Session
+from sqlalchemy import select, or_, and_, insert, delete
+from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.status import HTTP_409_CONFLICT
 
 from database.connection import get_db
-from database.models import Admin, AdminLog
+from database.models import Admin, AdminLog, Politician
 
 logger = logging.getLogger("uvicorn")
 
@@ -16,14 +17,14 @@ class AdminRepository:
     admin_model = Admin
     admin_log_model = AdminLog
 
-    def __init__(self, session: Session = Depends(get_db)) -> None:
+    def __init__(self, session: AsyncSession = Depends(get_db)) -> None:
         self.session = session
 
-    def check_uniqueness(self, email: str, nickname: str) -> bool | None:
+    async def check_uniqueness(self, email: str, nickname: str) -> bool | None:
         select_query = select(self.admin_model).where(
             or_(self.admin_model.email == email, self.admin_model.nickname == nickname)
         )
-        search_result = self.session.scalar(select_query)
+        search_result = await self.session.scalar(select_query)
         if search_result is None:
             return
         elif search_result.email == email:
@@ -39,45 +40,104 @@ class AdminRepository:
                 detail="Nickname should be unique.",
             )
 
-    def save_admin_data(self, admin: Admin) -> Admin:
+    async def save_admin_data(self, admin: Admin) -> Admin:
         self.session.add(admin)
-        self.session.commit()
-        self.session.refresh(admin)
+        await self.session.commit()
+        await self.session.refresh(admin)
         return admin
 
-    def get_admin_data(self, **kwargs) -> Admin | None:
+    async def get_admin_data(self, **kwargs) -> Admin | None:
         field = list(kwargs.keys())[0]
         value = list(kwargs.values())[0]
         select_query = select(self.admin_model).where(getattr(Admin, field) == value)
-        search_result = self.session.scalar(select_query)
+        search_result = await self.session.scalar(select_query)
         return search_result
 
-    def check_jti_data(self, admin_id: int, uuid_jti: str) -> bool:
-        admin_data = self.get_admin_data(id=admin_id)
-        return True if admin_data.uuid_jti == uuid_jti else False
+    async def select_admin_jti(self, admin_id: int) -> Optional[str]:
+        select_query = select(self.admin_model.uuid_jti).where(
+            self.admin_model.id == admin_id
+        )
+        return await self.session.scalar(select_query)
+
+    async def bulk_insert_admin_log_data(self, data: List[dict]) -> None:
+        if not data:
+            return
+        await self.session.execute(insert(self.admin_log_model), data)
 
-    def insert_admin_log_data(
+    async def select_admin_log_before(
         self,
-        admin_id: int,
-        action: str,
-        politician_id: Optional[int] = None,
-        detail: Optional[dict] = None,
+        cutoff: datetime,
+        size: int,
+        after: Optional[Tuple[datetime, int]] = None,
     ):
-        data = {
-            "admin_id": admin_id,
-            "politician_id": politician_id,
-            "action": action,
-            "detail": detail,
-        }
-        query = insert(self.admin_log_model).values(data)
-        self.session.execute(query)
+        """
+        보관 기간이 지난 로그를 (created_at, id) 오름차순 keyset 으로 size 행씩 조회 (보관 이전용)
+        - after: 이전 묶음 마지막 행의 (created_at, id)
+        - 관리자 닉네임/의원 이름도 보관 시점 값으로 함께 저장하도록 조회
+        """
+        select_query = (
+            select(
+                self.admin_log_model.id,
+                self.admin_log_model.admin_id,
+                self.admin_model.nickname,
+                self.admin_log_model.action,
+                self.admin_log_model.politician_id,
+                Politician.name.label("politician_name"),
+                self.admin_log_model.detail,
+                self.admin_log_model.created_at,
+            )
+            .select_from(self.admin_log_model)
+            .join(
+                self.admin_model,
+                self.admin_model.id == self.admin_log_model.admin_id,
+            )
+            .outerjoin(Politician, Politician.id == self.admin_log_model.politician_id)
+            .where(self.admin_log_model.created_at < cutoff)
+        )
+        if after is not None:
+            after_created_at, after_id = after
+            select_query = select_query.where(
+                or_(
+                    self.admin_log_model.created_at > after_created_at,
+                    and_(
+                        self.admin_log_model.created_at == after_created_at,
+                        self.admin_log_model.id > after_id,
+                    ),
+                )
+            )
+        select_query = select_query.order_by(
+            self.admin_log_model.created_at, self.admin_log_model.id
+        ).limit(size)
+        select_result = (await self.session.execute(select_query)).all()
+        return select_result
 
-    def select_admin_log_data(self):
+    async def delete_admin_log_by_id_list(self, id_list: List[int]):
+        query = delete(self.admin_log_model).where(self.admin_log_model.id.in_(id_list))
+        return await self.session.execute(query)
+
+    async def select_admin_log_page(
+        self,
+        size: int,
+        cursor: Optional[Tuple[datetime, int]] = None,
+        admin_id: Optional[int] = None,
+        action: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ):
+        """
+        (created_at, id) 내림차순 keyset 페이지 조회, 다음 페이지 확인용으로 size + 1 행 반환
+        - cursor: 이전 페이지 마지막 행의 (created_at, id)
+        - 의원 이름은 같은 쿼리에서 left join (대량 등록 등 의원 없는 로그는 None)
+        """
         select_query = (
             select(
+                self.admin_log_model.id,
+                self.admin_log_model.admin_id,
                 self.admin_model.nickname,
                 self.admin_log_model.action,
                 self.admin_log_model.politician_id,
+                Politician.name.label("politician_name"),
+                self.admin_log_model.detail,
                 self.admin_log_model.created_at,
             )
             .select_from(self.admin_log_model)
@@ -85,7 +145,33 @@ class AdminRepository:
                 self.admin_model,
                 self.admin_model.id == self.admin_log_model.admin_id,
             )
-            .order_by(self.admin_log_model.created_at.desc())
+            .outerjoin(Politician, Politician.id == self.admin_log_model.politician_id)
         )
-        select_result = self.session.execute(select_query).all()
+        if cursor is not None:
+            cursor_created_at, cursor_id = cursor
+            select_query = select_query.where(
+                or_(
+                    self.admin_log_model.created_at < cursor_created_at,
+                    and_(
+                        self.admin_log_model.created_at == cursor_created_at,
+                        self.admin_log_model.id < cursor_id,
+                    ),
+                )
+            )
+        if admin_id is not None:
+            select_query = select_query.where(self.admin_log_model.admin_id == admin_id)
+        if action is not None:
+            select_query = select_query.where(self.admin_log_model.action == action)
+        if start_date is not None:
+            select_query = select_query.where(
+                self.admin_log_model.created_at >= start_date
+            )
+        if end_date is not None:
+            select_query = select_query.where(
+                self.admin_log_model.created_at < end_date
+            )
+        select_query = select_query.order_by(
+            self.admin_log_model.created_at.desc(), self.admin_log_model.id.desc()
+        ).limit(size + 1)
+        select_result = (await self.session.execute(select_query)).all()
         return select_result
@@ -1,14 +1,15 @@
-from typing import List, Union
+from collections import defaultdict
+from typing import List, Union, Dict
 
-from fastapi import Depends, HTTPException
-from sqlalchemy import select, insert, func, delete
-from sqlalchemy.orm import Session
-from starlette.status import HTTP_400_BAD_REQUEST
+from fastapi import Depends
+from sqlalchemy import select, insert, func, delete, Row, CursorResult
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from schema.politician_request import ConstituencyReqSchema, JurisdictionUpdateReqSchema
+from common.constituency_catalog import ConstituencyCatalog, constituency_catalog
 from common.enums import RegionType
 from database.connection import get_db
-from database.models import Region, Constituency, Jurisdiction
+from database.models import Region, Constituency, Jurisdiction, Politician
 
 
 class AreaRepository:
@@ -16,7 +17,7 @@ class AreaRepository:
     constituency_model = Constituency
     jurisdiction_model = Jurisdiction
 
-    def __init__(self, session: Session = Depends(get_db)) -> None:
+    def __init__(self, session: AsyncSession = Depends(get_db)) -> None:
         self.session = session
 
     @staticmethod
@@ -38,46 +39,39 @@ class AreaRepository:
         )
         return region_data if region_data else None
 
-    def get_constituency_id(
+    async def get_constituency_catalog(self) -> ConstituencyCatalog:
+        return await constituency_catalog.load(self.select_all_constituency_data)
+
+    async def get_constituency_id(
         self, data: Union[ConstituencyReqSchema or JurisdictionUpdateReqSchema]
     ) -> int:
-        region_name = data.region
-        district_name = data.district
-        section_name = data.section
+        return (await self.get_constituency_id_list([data]))[0]
 
-        region_id = self.get_region_id(region_name)
-        if not region_id:
-            raise HTTPException(
-                status_code=HTTP_400_BAD_REQUEST,
-                detail="Region info not found",
-            )
-
-        query = select(self.constituency_model).filter(
-            self.constituency_model.region_id == region_id,
-            self.constituency_model.district == district_name,
-            self.constituency_model.section == section_name,
-        )
-        search_result = self.session.execute(query).scalar()
+    async def get_constituency_id_list(
+        self, data_list: List[Union[ConstituencyReqSchema, JurisdictionUpdateReqSchema]]
+    ) -> List[int]:
+        catalog = await self.get_constituency_catalog()
+        return catalog.resolve_constituency_id_list(data_list)
 
-        if not search_result:
-            raise HTTPException(
-                status_code=HTTP_400_BAD_REQUEST,
-                detail="Constituency info not found",
-            )
-
-        return search_result.id
+    async def get_bulk_constituency_id_list(
+        self,
+        bulk_data_list: List[List[ConstituencyReqSchema]],
+    ) -> List[List[int]]:
+        catalog = await self.get_constituency_catalog()
+        return catalog.resolve_bulk_constituency_id_list(bulk_data_list)
 
-    def insert_jurisdiction_data(self, politician_id: int, constituency_id: int):
+    async def insert_jurisdiction_data(self, politician_id: int, constituency_id: int):
         query = insert(self.jurisdiction_model).values(
             politician_id=politician_id, constituency_id=constituency_id
         )
-        self.session.execute(query)
+        await self.session.execute(query)
 
-    def bulk_insert_jurisdiction_data(self, data: List[dict]):
-        query = insert(self.jurisdiction_model).values(data)
-        self.session.execute(query)
+    async def bulk_insert_jurisdiction_data(self, data: List[dict]):
+        if not data:
+            return
+        await self.session.execute(insert(self.jurisdiction_model), data)
 
-    def select_jurisdiction_data_by_politician_id(self, politician_id: int):
+    async def select_jurisdiction_data_by_politician_id(self, politician_id: int):
         query = (
             select(
                 self.jurisdiction_model.id,
@@ -97,28 +91,45 @@ class AreaRepository:
                 self.region_model.id == self.constituency_model.region_id,
             )
         )
-        select_result = self.session.execute(query).all()
+        select_result = (await self.session.execute(query)).all()
         return select_result
 
-    def select_constituency_data_by_region(self, region_name: str):
-        region_id = self.get_region_id(region_name)
+    async def select_jurisdiction_data_by_politician_id_list(
+        self, politician_id_list: List[int]
+    ) -> Dict[int, List[Row]]:
+        jurisdiction_data_map = defaultdict(list)
+        if not politician_id_list:
+            return jurisdiction_data_map
+
         query = (
             select(
+                self.jurisdiction_model.id,
                 self.region_model.region,
                 self.constituency_model.district,
                 self.constituency_model.section,
+                self.jurisdiction_model.constituency_id,
+                self.jurisdiction_model.politician_id,
             )
             .select_from(self.constituency_model)
-            .filter_by(region_id=region_id)
+            .filter(self.jurisdiction_model.politician_id.in_(politician_id_list))
+            .join(
+                self.jurisdiction_model,
+                self.constituency_model.id == self.jurisdiction_model.constituency_id,
+            )
             .join(
                 self.region_model,
                 self.region_model.id == self.constituency_model.region_id,
             )
+            .order_by(self.jurisdiction_model.id)
         )
-        select_result = self.session.execute(query).all()
-        return select_result
+        for jurisdiction_data in (await self.session.execute(query)).all():
+            jurisdiction_data_map[jurisdiction_data.politician_id].append(
+                jurisdiction_data
+            )
+        return jurisdiction_data_map
 
-    def select_constituency_data_by_id(self, constituency_id: int):
+    async def select_constituency_data_by_region(self, region_name: str):
+        region_id = self.get_region_id(region_name)
         query = (
             select(
                 self.region_model.region,
@@ -126,116 +137,114 @@ class AreaRepository:
                 self.constituency_model.section,
             )
             .select_from(self.constituency_model)
-            .filter_by(id=constituency_id)
+            .filter_by(region_id=region_id)
             .join(
                 self.region_model,
                 self.region_model.id == self.constituency_model.region_id,
             )
         )
-        select_result = self.session.execute(query).all()
-        return select_result[0]
+        select_result = (await self.session.execute(query)).all()
+        return select_result
 
-    def select_politician_id_by_constituency_id(self, constituency_id: int):
-        query = select(self.jurisdiction_model.politician_id).filter_by(
-            constituency_id=constituency_id
+    async def select_constituency_district_list(self) -> List[str]:
+        query = select(func.distinct(self.constituency_model.district)).filter(
+            self.constituency_model.district.is_not(None)
         )
-        select_result = self.session.execute(query).all()
+        select_result = (await self.session.execute(query)).scalars().all()
         return select_result
 
-    def select_jurisdiction_data_by_random_text(
-        self, random_text: str, offset: int, size: int
-    ):
-        distinct_subquery = (
+    async def select_all_constituency_data(self):
+        query = select(
+            self.constituency_model.id,
+            self.constituency_model.region_id,
+            self.constituency_model.district,
+            self.constituency_model.section,
+        )
+        select_result = (await self.session.execute(query)).all()
+        return select_result
+
+    async def select_constituency_data_by_id(self, constituency_id: int):
+        query = (
             select(
-                func.distinct(self.jurisdiction_model.politician_id).label(
-                    "politician_id"
-                )
-            )
-            .select_from(self.jurisdiction_model)
-            .filter(self.constituency_model.district.like(f"%{random_text}%"))
-            .join(
-                self.constituency_model,
-                self.constituency_model.id == self.jurisdiction_model.constituency_id,
+                self.region_model.region,
+                self.constituency_model.district,
+                self.constituency_model.section,
             )
+            .select_from(self.constituency_model)
+            .filter_by(id=constituency_id)
             .join(
                 self.region_model,
                 self.region_model.id == self.constituency_model.region_id,
             )
-        ).alias("distinct_subquery")
-
-        numbered_query = (
-            select(
-                distinct_subquery.c.politician_id,
-                func.row_number().over().label("row_num"),
-            )
-            .select_from(distinct_subquery)
-            .alias("numbered_query")
         )
+        select_result = (await self.session.execute(query)).all()
+        return select_result[0]
 
-        final_query = select(numbered_query.c.politician_id).offset(offset).limit(size)
-        search_result = self.session.execute(final_query).all()
-        return search_result
+    async def select_politician_id_by_constituency_id(self, constituency_id: int):
+        query = select(self.jurisdiction_model.politician_id).filter_by(
+            constituency_id=constituency_id
+        )
+        select_result = (await self.session.execute(query)).all()
+        return select_result
 
-    def select_jurisdiction_data_by_region_id_and_text(
+    async def select_politician_id_list_by_constituency_id_list(
         self,
+        assembly_term: int,
+        constituency_id_list: List[int],
         offset: int,
         size: int,
-        region_id: int,
-        constituency_text: str = None,
     ):
-        distinct_subquery = (
-            select(
-                func.distinct(self.jurisdiction_model.politician_id).label(
-                    "politician_id"
-                )
-            )
-            .select_from(self.jurisdiction_model)
-            .filter(self.constituency_model.region_id == region_id)
-            .join(
-                self.constituency_model,
-                self.constituency_model.id == self.jurisdiction_model.constituency_id,
-            )
+        query = (
+            select(self.jurisdiction_model.politician_id)
+            .distinct()
             .join(
-                self.region_model,
-                self.region_model.id == self.constituency_model.region_id,
-            )
-        )
-        if constituency_text:
-            distinct_subquery = distinct_subquery.filter(
-                self.constituency_model.district.like(f"%{constituency_text}%")
+                Politician,
+                Politician.id == self.jurisdiction_model.politician_id,
             )
-        distinct_subquery = distinct_subquery.alias("distinct_subquery")
-
-        numbered_query = (
-            select(
-                distinct_subquery.c.politician_id,
-                func.row_number().over().label("row_num"),
+            .filter(
+                self.jurisdiction_model.constituency_id.in_(constituency_id_list),
+                Politician.assembly_term == assembly_term,
             )
-            .select_from(distinct_subquery)
-            .alias("numbered_query")
+            .order_by(self.jurisdiction_model.politician_id)
+            .offset(offset)
+            .limit(size)
         )
-
-        final_query = select(numbered_query.c.politician_id).offset(offset).limit(size)
-
-        select_result = self.session.execute(final_query).all()
+        select_result = (await self.session.execute(query)).all()
         return select_result
 
-    def check_jurisdiction_match(
+    async def check_jurisdiction_match(
         self, politician_id: int, constituency_id: int
     ) -> bool:
         query = select(self.jurisdiction_model).filter_by(
             politician_id=politician_id, constituency_id=constituency_id
         )
-        search_result = self.session.execute(query).scalar()
+        search_result = (await self.session.execute(query)).scalar()
         return True if search_result else False
 
-    def delete_jurisdiction_data(self, jurisdiction_id: int):
+    async def delete_jurisdiction_data(self, jurisdiction_id: int):
         query = delete(self.jurisdiction_model).where(
             self.jurisdiction_model.id == jurisdiction_id
         )
-        self.session.execute(query)
+        await self.session.execute(query)
+
+    async def delete_jurisdiction_data_by_id_list(
+        self, politician_id: int, jurisdiction_id_list: List[int]
+    ) -> CursorResult:
+        query = delete(self.jurisdiction_model).where(
+            self.jurisdiction_model.politician_id == politician_id,
+            self.jurisdiction_model.id.in_(jurisdiction_id_list),
+        )
+        return await self.session.execute(query)
+
+    async def select_constituency_id_list_by_politician_id(
+        self, politician_id: int
+    ) -> List[int]:
+        query = select(self.jurisdiction_model.constituency_id).filter_by(
+            politician_id=politician_id
+        )
+        return list((await self.session.scalars(query)).all())
 
-    def get_duplicated_jurisdiction(self):
+    async def get_duplicated_jurisdiction(self):
         query = (
             select(
                 self.jurisdiction_model.constituency_id,
@@ -244,5 +253,5 @@ class AreaRepository:
             .group_by(self.jurisdiction_model.constituency_id)
             .having(func.count(self.jurisdiction_model.constituency_id) > 1)
         )
-        search_result = self.session.execute(query).all()
+        search_result = (await self.session.execute(query)).all()
         return search_result
@@ -0,0 +1,47 @@
+from datetime import datetime
+
+from fastapi import Depends
+from sqlalchemy import select, insert, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database.connection import get_db
+from database.models import BulkImportJob
+
+
+class BulkImportJobRepository:
+    bulk_import_job_model = BulkImportJob
+
+    def __init__(self, session: AsyncSession = Depends(get_db)) -> None:
+        self.session = session
+
+    async def insert_bulk_import_job(self, data: dict) -> None:
+        await self.session.execute(insert(self.bulk_import_job_model).values(**data))
+
+    async def update_bulk_import_job(self, job_id: str, data: dict) -> None:
+        update_query = (
+            update(self.bulk_import_job_model)
+            .where(self.bulk_import_job_model.id == job_id)
+            .values(**data)
+        )
+        await self.session.execute(update_query)
+
+    async def update_stale_bulk_import_job(
+        self, updated_before: datetime, data: dict
+    ) -> int:
+        # 실행 중 진행 상황이 updated_before 이후로 기록되지 않은 작업 (작업자 프로세스 종료)
+        update_query = (
+            update(self.bulk_import_job_model)
+            .where(
+                self.bulk_import_job_model.status == "running",
+                self.bulk_import_job_model.updated_at < updated_before,
+            )
+            .values(**data)
+        )
+        return (await self.session.execute(update_query)).rowcount
+
+    async def select_bulk_import_job(self, job_id: str, admin_id: int):
+        select_query = select(self.bulk_import_job_model).where(
+            self.bulk_import_job_model.id == job_id,
+            self.bulk_import_job_model.admin_id == admin_id,
+        )
+        return await self.session.scalar(select_query)
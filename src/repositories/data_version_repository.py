@@ -0,0 +1,34 @@
+from typing import Optional
+
+from fastapi import Depends
+from sqlalchemy import select, insert, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database.connection import get_db
+from database.models import PublicDataVersion
+
+
+class DataVersionRepository:
+    data_version_model = PublicDataVersion
+
+    def __init__(self, session: AsyncSession = Depends(get_db)) -> None:
+        self.session = session
+
+    async def select_data_version(self, name: str) -> Optional[int]:
+        select_query = select(self.data_version_model.version).where(
+            self.data_version_model.name == name
+        )
+        return await self.session.scalar(select_query)
+
+    async def insert_data_version(self, name: str, version: int) -> None:
+        await self.session.execute(
+            insert(self.data_version_model).values(name=name, version=version)
+        )
+
+    async def increment_data_version(self, name: str) -> int:
+        update_query = (
+            update(self.data_version_model)
+            .where(self.data_version_model.name == name)
+            .values(version=self.data_version_model.version + 1)
+        )
+        return (await self.session.execute(update_query)).rowcount
@@ -1,9 +1,24 @@
 import logging
-from typing import List
+from collections import Counter, defaultdict, deque
+from datetime import datetime
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
 from fastapi import Depends
-from sqlalchemy import insert, select, update, CursorResult, delete
-from sqlalchemy.orm import Session
+from sqlalchemy import (
+    insert,
+    select,
+    update,
+    CursorResult,
+    delete,
+    text,
+    bindparam,
+    Table,
+    TextClause,
+    tuple_,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from schema.politician_request import (
     PoliticianReqSchema,
@@ -11,34 +26,84 @@ from schema.politician_request import (
     PoliticianCommitteeReqSchema,
     PoliticianCommitteeUpdateReqSchema,
 )
+from common.data_version import politician_data_version
+from common.ngram_index import politician_search_index
 from database.connection import get_db
-from database.models import Politician, PromiseCountDetail, Committee
+from database.models import (
+    Politician,
+    PromiseCountDetail,
+    Committee,
+    Jurisdiction,
+    Constituency,
+)
 
 logger = logging.getLogger("uvicorn")
 
 
+class InsertedPoliticianIdError(Exception):
+    """다중 행 INSERT 뒤 재조회한 id 가 삽입한 행과 맞지 않을 때 발생"""
+
+
+@lru_cache(maxsize=8)
+def get_multi_row_insert_query(
+    table: Table, column_name_tuple: Tuple[str, ...], row_count: int
+) -> TextClause:
+    """
+    여러 행 INSERT 문
+    - 여러 행 VALUES 의 Insert 구문은 SQLAlchemy 컴파일 캐시에 들어가지 않으므로
+      행 수별 text 구문을 만들어 두고 재사용 (같은 크기의 묶음은 컴파일 한 번)
+    """
+    column_clause = ", ".join(column_name_tuple)
+    values_clause = ", ".join(
+        "(" + ", ".join(f":{name}_{index}" for name in column_name_tuple) + ")"
+        for index in range(row_count)
+    )
+    return text(
+        f"INSERT INTO {table.name} ({column_clause}) VALUES {values_clause}"
+    ).bindparams(
+        *[
+            bindparam(f"{name}_{index}", type_=table.c[name].type)
+            for index in range(row_count)
+            for name in column_name_tuple
+        ]
+    )
+
+
 class PoliticianInfoRepository:
     politician_model = Politician
     promise_count_detail_model = PromiseCountDetail
     committee_model = Committee
+    jurisdiction_model = Jurisdiction
+    constituency_model = Constituency
 
-    def __init__(self, session: Session = Depends(get_db)) -> None:
+    def __init__(self, session: AsyncSession = Depends(get_db)) -> None:
         self.session = session
 
-    def insert_politician_data(self, data: PoliticianReqSchema) -> int:
+    def get_execution_rate_order(self, sort_type: str) -> tuple:
+        if sort_type == "desc":
+            return (
+                self.politician_model.promise_execution_rate.desc(),
+                self.politician_model.id.desc(),
+            )
+        return (
+            self.politician_model.promise_execution_rate.asc(),
+            self.politician_model.id.asc(),
+        )
+
+    async def insert_politician_data(self, data: PoliticianReqSchema) -> int:
         query = insert(self.politician_model).values(data.model_dump())
-        politician_id = self.session.execute(query).lastrowid
+        politician_id = (await self.session.execute(query)).lastrowid
         return politician_id
 
-    def insert_promise_count_detail_data(
+    async def insert_promise_count_detail_data(
         self, politician_id: int, data: PromiseCountDetailReqSchema
     ):
         data = data.model_dump()
         data["politician_id"] = politician_id
         query = insert(self.promise_count_detail_model).values(**data)
-        self.session.execute(query)
+        await self.session.execute(query)
 
-    def insert_committee_data(
+    async def insert_committee_data(
         self, politician_id: int, committee_list: List[PoliticianCommitteeReqSchema]
     ):
         bulk_data = []
@@ -50,105 +115,332 @@ class PoliticianInfoRepository:
             }
             bulk_data.append(data)
         query = insert(self.committee_model).values(bulk_data)
-        self.session.execute(query)
+        await self.session.execute(query)
+
+    async def bulk_insert_politician_data(self, data: List[dict]) -> List[int]:
+        """
+        의원 기본 정보 한 묶음(chunk) 삽입 후 입력 순서대로 id 반환
+        - MySQL, SQLite: 여러 행 INSERT 한 번 후 자연 키(assembly_term, name, political_party)로
+          id 재조회 (innodb_autoinc_lock_mode 2 처럼 id 가 연속하지 않아도 동작)
+          lastrowid 로 구한 이 INSERT 의 첫 id 이상만 조회하므로 같은 키의 기존 의원은 제외되고,
+          묶음 안에 같은 키가 여럿이면 한 INSERT 안에서 id 가 입력 순서대로 증가하므로 작은 id 부터 배정
+        - RETURNING 지원 DB(MariaDB 10.5+ 등): insertmanyvalues + RETURNING
+        - 그 외는 행별 INSERT
+        """
+        if not data:
+            return []
+        dialect = (await self.session.connection()).dialect
+        if dialect.name == "sqlite" or (
+            dialect.name == "mysql" and not dialect.insert_returning
+        ):
+            # text 구문에는 Python 측 기본값이 적용되지 않으므로 생성/수정 시각을 직접 지정
+            current_time = datetime.now()
+            data = [
+                {**row, "created_at": current_time, "updated_at": current_time}
+                for row in data
+            ]
+            column_name_tuple = tuple(data[0].keys())
+            query = get_multi_row_insert_query(
+                self.politician_model.__table__, column_name_tuple, len(data)
+            )
+            params = {
+                f"{column_name}_{index}": row[column_name]
+                for index, row in enumerate(data)
+                for column_name in column_name_tuple
+            }
+            last_row_id = (await self.session.execute(query, params)).lastrowid
+            # MySQL 은 첫 행, SQLite 는 마지막 행 id (SQLite 는 쓰기가 직렬화되어 id 가 연속)
+            first_politician_id = (
+                last_row_id if dialect.name == "mysql" else last_row_id - len(data) + 1
+            )
+            return await self.select_inserted_politician_id_list(
+                data, first_politician_id
+            )
+
+        if dialect.insert_executemany_returning_sort_by_parameter_order:
+            query = insert(self.politician_model).returning(
+                self.politician_model.id, sort_by_parameter_order=True
+            )
+            return list(await self.session.scalars(query, data))
 
-    def bulk_insert_politician_data(self, data: List[dict]) -> List[int]:
         inserted_politician_id_list = []
         for single_data in data:
             query = insert(self.politician_model).values(single_data)
-            insert_result = self.session.execute(query).inserted_primary_key
+            insert_result = (await self.session.execute(query)).inserted_primary_key
             inserted_politician_id_list.append(insert_result[0])
         return inserted_politician_id_list
 
-    def bulk_insert_committee_data(self, data: List[dict]) -> None:
-        query = insert(self.committee_model).values(data)
-        self.session.execute(query)
+    async def select_inserted_politician_id_list(
+        self, data: List[dict], first_politician_id: int
+    ) -> List[int]:
+        key_list = [
+            (row["assembly_term"], row["name"], row["political_party"]) for row in data
+        ]
+        query = (
+            select(
+                self.politician_model.id,
+                self.politician_model.assembly_term,
+                self.politician_model.name,
+                self.politician_model.political_party,
+            )
+            .where(
+                tuple_(
+                    self.politician_model.assembly_term,
+                    self.politician_model.name,
+                    self.politician_model.political_party,
+                ).in_(set(key_list)),
+                self.politician_model.id >= first_politician_id,
+                self.politician_model.id < first_politician_id + len(data),
+            )
+            .order_by(self.politician_model.id)
+        )
+        politician_id_map = defaultdict(deque)
+        for politician_id, *key in (await self.session.execute(query)).all():
+            politician_id_map[tuple(key)].append(politician_id)
+        # 대소문자/후행 공백 비교 규칙이나 동시 삽입으로 조회 결과가 삽입 행과 맞지 않으면
+        # 잘못된 id 를 연결하지 않도록 중단 (호출 측이 트랜잭션을 롤백)
+        missing_key_list = [
+            key
+            for key, count in Counter(key_list).items()
+            if len(politician_id_map[key]) != count
+        ]
+        if missing_key_list:
+            raise InsertedPoliticianIdError(
+                f"Failed to resolve inserted politician ids: {missing_key_list[:10]}"
+            )
+        return [politician_id_map[key].popleft() for key in key_list]
+
+    async def bulk_insert_committee_data(self, data: List[dict]) -> None:
+        if not data:
+            return
+        await self.session.execute(insert(self.committee_model), data)
 
-    def bulk_insert_promise_count_detail_data(self, data: List[dict]):
-        query = insert(self.promise_count_detail_model).values(data)
-        self.session.execute(query)
+    async def bulk_insert_promise_count_detail_data(self, data: List[dict]):
+        if not data:
+            return
+        await self.session.execute(insert(self.promise_count_detail_model), data)
 
-    def select_politician_data_by_id(self, politician_id: int):
+    async def select_politician_data_by_key_list(
+        self, key_list: List[Tuple[int, str, str]]
+    ):
+        """
+        (assembly_term, name, political_party) 목록에 해당하는 의원과 공약 수 세부 정보 조회
+        """
+        query = (
+            select(self.politician_model, self.promise_count_detail_model)
+            .outerjoin(
+                self.promise_count_detail_model,
+                self.promise_count_detail_model.politician_id
+                == self.politician_model.id,
+            )
+            .where(
+                tuple_(
+                    self.politician_model.assembly_term,
+                    self.politician_model.name,
+                    self.politician_model.political_party,
+                ).in_(key_list)
+            )
+            .order_by(self.politician_model.id)
+        )
+        return (await self.session.execute(query)).all()
+
+    async def bulk_update_politician_data(self, data: List[dict]) -> None:
+        # id 와 바뀐 컬럼만 담은 dict 목록, 같은 컬럼 조합끼리 executemany 로 묶여 실행
+        if not data:
+            return
+        await self.session.execute(update(self.politician_model), data)
+
+    async def bulk_update_promise_count_detail_data(self, data: List[dict]) -> None:
+        if not data:
+            return
+        await self.session.execute(update(self.promise_count_detail_model), data)
+
+    async def select_politician_data_by_id(self, politician_id: int):
         query = select(
             self.politician_model,
         ).filter_by(id=politician_id)
-        select_result = self.session.execute(query).scalar()
+        select_result = (await self.session.execute(query)).scalar()
         return select_result
 
-    def select_politician_data_by_id_list(self, politician_id_list: List[int]):
+    async def select_politician_data_by_id_list(self, politician_id_list: List[int]):
         query = select(
             self.politician_model,
         ).where(self.politician_model.id.in_(politician_id_list))
-        select_result = self.session.execute(query).all()
+        select_result = (await self.session.execute(query)).all()
         return select_result
 
-    def select_total_politician_data_by_id(self, politician_id: int):
+    async def select_total_politician_data_by_id(self, politician_id: int):
+        # AsyncSession 은 지연 로딩이 불가하므로 응답에 필요한 관계를 함께 조회
         query = (
-            select(
-                self.politician_model,
-                self.committee_model,
-                self.promise_count_detail_model,
-            )
-            .select_from(self.politician_model)
+            select(self.politician_model)
             .filter_by(id=politician_id)
-            .outerjoin(
-                self.committee_model,
-                self.committee_model.politician_id == politician_id,
-            )
-            .join(
-                self.promise_count_detail_model,
-                self.promise_count_detail_model.politician_id == politician_id,
+            .options(
+                selectinload(self.politician_model.committee),
+                selectinload(self.politician_model.promise_count_detail),
             )
         )
-        select_result = self.session.execute(query).scalar()
+        select_result = (await self.session.execute(query)).scalar()
+        return select_result
+
+    async def select_politician_data_by_assembly_term(self, assembly_term: int):
+        query = select(self.politician_model).filter_by(assembly_term=assembly_term)
+        select_result = (await self.session.execute(query)).all()
         return select_result
 
-    def get_politician_list_data_for_admin(
-        self, assembly_term: int, offset: int, size: int
+    async def get_politician_list_data_for_admin(
+        self,
+        assembly_term: int,
+        offset: int,
+        size: int,
+        sort_type: Optional[str] = None,
     ):
-        total_politician_data = self.session.execute(
-            select(self.politician_model)
-            .filter_by(assembly_term=assembly_term)
-            .offset(offset)
-            .limit(size)
+        query = select(self.politician_model).filter_by(assembly_term=assembly_term)
+        if sort_type:
+            query = query.order_by(*self.get_execution_rate_order(sort_type))
+        total_politician_data = (
+            await self.session.execute(query.offset(offset).limit(size))
         ).all()
         return total_politician_data
 
-    def get_politician_search_data_for_admin(
+    async def select_politician_search_text_by_assembly_term(self, assembly_term: int):
+        query = select(
+            self.politician_model.id,
+            self.politician_model.name,
+            self.politician_model.political_party,
+        ).filter_by(assembly_term=assembly_term)
+        select_result = (await self.session.execute(query)).all()
+        return select_result
+
+    async def search_politician_id_list_by_keyword(
+        self, assembly_term: int, name: str = None, party: str = None
+    ) -> List[int]:
+        field, keyword = ("name", name) if name else ("political_party", party)
+        return await politician_search_index.search(
+            assembly_term,
+            field,
+            keyword,
+            politician_data_version.get(),
+            self.select_politician_search_text_by_assembly_term,
+        )
+
+    async def get_politician_search_data_for_admin(
         self,
         offset: int,
         size: int,
         assembly_term: int,
         name: str = None,
         party: str = None,
+        sort_type: Optional[str] = None,
     ):
-        query = select(self.politician_model)
-        filtered_query = (
-            query.filter(
-                self.politician_model.assembly_term == assembly_term,
-                self.politician_model.name.like(f"%{name}%"),
+        politician_id_list = await self.search_politician_id_list_by_keyword(
+            assembly_term, name, party
+        )
+        if not politician_id_list:
+            return []
+
+        query = select(self.politician_model).filter(
+            self.politician_model.id.in_(politician_id_list)
+        )
+        if sort_type:
+            query = query.order_by(*self.get_execution_rate_order(sort_type))
+        else:
+            query = query.order_by(self.politician_model.id)
+        search_result = (
+            await self.session.execute(query.offset(offset).limit(size))
+        ).all()
+        return search_result
+
+    async def get_politician_list_data_by_region_id(
+        self, assembly_term: int, region_id: int, offset: int, size: int, sort_type: str
+    ):
+        region_politician_subquery = (
+            select(self.jurisdiction_model.politician_id)
+            .join(
+                self.constituency_model,
+                self.constituency_model.id == self.jurisdiction_model.constituency_id,
             )
-            if name
-            else query.filter(
+            .filter(self.constituency_model.region_id == region_id)
+        )
+        query = (
+            select(self.politician_model)
+            .filter(
                 self.politician_model.assembly_term == assembly_term,
-                self.politician_model.political_party.like(f"%{party}%"),
+                self.politician_model.id.in_(region_politician_subquery),
             )
+            .order_by(*self.get_execution_rate_order(sort_type))
+            .offset(offset)
+            .limit(size)
         )
-        search_result = self.session.execute(
-            filtered_query.offset(offset).limit(size)
-        ).all()
+        search_result = (await self.session.execute(query)).all()
         return search_result
 
-    def select_committee_data(self, politician_id: int):
+    async def select_committee_data(self, politician_id: int):
         query = select(
             self.committee_model.id,
             self.committee_model.is_main,
             self.committee_model.name,
         ).filter_by(politician_id=politician_id)
-        search_result = self.session.execute(query).all()
+        search_result = (await self.session.execute(query)).all()
         return search_result
 
-    def update_politician_data(
+    async def select_politician_with_promise_count_detail(self, politician_id: int):
+        query = (
+            select(self.politician_model, self.promise_count_detail_model)
+            .outerjoin(
+                self.promise_count_detail_model,
+                self.promise_count_detail_model.politician_id
+                == self.politician_model.id,
+            )
+            .where(self.politician_model.id == politician_id)
+        )
+        return (await self.session.execute(query)).first()
+
+    async def select_committee_data_by_id_list(
+        self, politician_id: int, committee_id_list: List[int]
+    ):
+        query = select(
+            self.committee_model.id,
+            self.committee_model.is_main,
+            self.committee_model.name,
+        ).where(
+            self.committee_model.politician_id == politician_id,
+            self.committee_model.id.in_(committee_id_list),
+        )
+        return (await self.session.execute(query)).all()
+
+    async def update_politician_columns(self, politician_id: int, data: dict) -> None:
+        query = (
+            update(self.politician_model)
+            .where(self.politician_model.id == politician_id)
+            .values(data)
+        )
+        await self.session.execute(query)
+
+    async def update_promise_count_detail_columns(
+        self, politician_id: int, data: dict
+    ) -> None:
+        query = (
+            update(self.promise_count_detail_model)
+            .where(self.promise_count_detail_model.politician_id == politician_id)
+            .values(data)
+        )
+        await self.session.execute(query)
+
+    async def bulk_update_committee_data(self, data: List[dict]) -> None:
+        if not data:
+            return
+        await self.session.execute(update(self.committee_model), data)
+
+    async def delete_committee_data_by_id_list(
+        self, politician_id: int, committee_id_list: List[int]
+    ) -> CursorResult:
+        query = delete(self.committee_model).where(
+            self.committee_model.politician_id == politician_id,
+            self.committee_model.id.in_(committee_id_list),
+        )
+        return await self.session.execute(query)
+
+    async def update_politician_data(
         self, politician_id: int, data: PoliticianReqSchema
     ) -> CursorResult[int]:
         query = (
@@ -156,16 +448,16 @@ class PoliticianInfoRepository:
             .where(self.politician_model.id == politician_id)
             .values(data.model_dump())
         )
-        update_result = self.session.execute(query)
+        update_result = await self.session.execute(query)
         return update_result
 
-    def delete_committee_data(self, committee_id: int):
+    async def delete_committee_data(self, committee_id: int):
         query = delete(self.committee_model).where(
             self.committee_model.id == committee_id
         )
-        self.session.execute(query)
+        await self.session.execute(query)
 
-    def update_committee_data(
+    async def update_committee_data(
         self,
         politician_id: int,
         committee_list: List[PoliticianCommitteeUpdateReqSchema],
@@ -180,7 +472,7 @@ class PoliticianInfoRepository:
                     .where(self.committee_model.id == committee_id)
                     .values(committee)
                 )
-                self.session.execute(query)
+                await self.session.execute(query)
             else:
                 new_committee_data = {
                     "politician_id": politician_id,
@@ -188,16 +480,16 @@ class PoliticianInfoRepository:
                     "name": committee["name"],
                 }
                 query = insert(self.committee_model).values(new_committee_data)
-                self.session.execute(query)
+                await self.session.execute(query)
 
-    def update_promise_count_detail_data(
+    async def update_promise_count_detail_data(
         self, politician_id: int, data: PromiseCountDetailReqSchema
     ) -> CursorResult[int]:
         data = data.model_dump()
         query = (
             update(self.promise_count_detail_model)
-            .where(self.politician_model.id == politician_id)
+            .where(self.promise_count_detail_model.politician_id == politician_id)
             .values(**data)
         )
-        update_result = self.session.execute(query)
+        update_result = await self.session.execute(query)
         return update_result
@@ -0,0 +1,83 @@
+from datetime import datetime
+from typing import List, Optional
+
+from fastapi import Depends
+from sqlalchemy import select, insert, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from database.connection import get_db
+from database.models import PublicSearchLog, Politician
+
+
+class SearchLogRepository:
+    search_log_model = PublicSearchLog
+
+    def __init__(self, session: AsyncSession = Depends(get_db)) -> None:
+        self.session = session
+
+    async def bulk_insert_search_count_data(self, data: List[dict]) -> None:
+        if not data:
+            return
+        await self.session.execute(insert(self.search_log_model), data)
+
+    async def select_existing_politician_id_list(
+        self, politician_id_list: List[int]
+    ) -> List[int]:
+        select_query = select(Politician.id).where(
+            Politician.id.in_(politician_id_list)
+        )
+        select_result = (await self.session.scalars(select_query)).all()
+        return select_result
+
+    async def select_search_count_by_category(
+        self, start_date: datetime, end_date: datetime
+    ):
+        search_count = func.sum(self.search_log_model.search_count).label(
+            "search_count"
+        )
+        select_query = (
+            select(self.search_log_model.search_category, search_count)
+            .where(
+                self.search_log_model.bucket_at >= start_date,
+                self.search_log_model.bucket_at < end_date,
+            )
+            .group_by(self.search_log_model.search_category)
+            .order_by(search_count.desc())
+        )
+        select_result = (await self.session.execute(select_query)).all()
+        return select_result
+
+    async def select_search_count_by_politician(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        size: int,
+        assembly_term: Optional[int] = None,
+    ):
+        search_count = func.sum(self.search_log_model.search_count).label(
+            "search_count"
+        )
+        select_query = (
+            select(
+                self.search_log_model.politician_id,
+                Politician.name,
+                Politician.political_party,
+                search_count,
+            )
+            .join(Politician, Politician.id == self.search_log_model.politician_id)
+            .where(
+                self.search_log_model.bucket_at >= start_date,
+                self.search_log_model.bucket_at < end_date,
+            )
+            .group_by(
+                self.search_log_model.politician_id,
+                Politician.name,
+                Politician.political_party,
+            )
+            .order_by(search_count.desc(), self.search_log_model.politician_id)
+            .limit(size)
+        )
+        if assembly_term is not None:
+            select_query = select_query.where(Politician.assembly_term == assembly_term)
+        select_result = (await self.session.execute(select_query)).all()
+        return select_result
@@ -1,16 +1,60 @@
 from datetime import datetime
-from typing import Optional, List
+from typing import Any, Dict, Optional, List
 
 from pydantic import BaseModel
 
 
 class AdminLogRes(BaseModel):
+    id: int
+    admin_id: int
     admin_nickname: str
     action: str
+    politician_id: Optional[int] = None
     politician_name: Optional[str] = None
+    detail: Optional[Any] = None
     created_at: datetime
 
 
+class AdminLogPageRes(BaseModel):
+    admin_log_list: List[AdminLogRes]
+    next_cursor: Optional[str] = None
+
+
+class AdminLogArchiveSegmentRes(BaseModel):
+    file: str
+    start_at: datetime
+    end_at: datetime
+    first_id: int
+    last_id: int
+    row_count: int
+    bytes: int
+
+
+class AdminLogArchiveSegmentListRes(BaseModel):
+    retention_days: int
+    segment_list: List[AdminLogArchiveSegmentRes]
+
+
+class CategorySearchCountResSchema(BaseModel):
+    search_category: str
+    search_count: int
+
+
+class PoliticianSearchCountResSchema(BaseModel):
+    politician_id: int
+    name: str
+    political_party: str
+    search_count: int
+
+
+class SearchAnalyticsRes(BaseModel):
+    start_date: datetime
+    end_date: datetime
+    total_search_count: int
+    category_list: List[CategorySearchCountResSchema]
+    politician_list: List[PoliticianSearchCountResSchema]
+
+
 class DuplicatedJurisdictionPoliticianResSchema(BaseModel):
     id: int
     name: str
@@ -26,3 +70,137 @@ class DuplicatedJurisdictionResSchema(BaseModel):
 class IntegrityErrorRes(BaseModel):
     duplicated_jurisdiction: List[DuplicatedJurisdictionResSchema] = None
     incomplete_politician: List = None
+
+
+class SnapshotCacheStatsRes(BaseModel):
+    hit_count: int
+    miss_count: int
+    rebuild_count: int
+    last_rebuild_ms: Optional[float] = None
+    avg_rebuild_ms: Optional[float] = None
+    data_version: int
+    cached_assembly_terms: List[int]
+
+
+class ResponseCacheStatsRes(BaseModel):
+    enabled: bool
+    local_enabled: bool
+    local_size: int
+    local_hit_count: int
+    hit_count: int
+    miss_count: int
+    error_count: int
+
+
+class SearchIndexStatsRes(BaseModel):
+    indexed_assembly_terms: List[int]
+    document_count: int
+    rebuild_count: int
+    incremental_update_count: int
+    last_rebuild_ms: Optional[float] = None
+
+
+class AutocompleteIndexStatsRes(BaseModel):
+    indexed_assembly_terms: List[int]
+    suggestion_count: int
+    rebuild_count: int
+    last_rebuild_ms: Optional[float] = None
+
+
+class BcryptPoolStatsRes(BaseModel):
+    pool_size: int
+    queue_size: int
+    in_flight_count: int
+    queued_count: int
+    peak_in_flight_count: int
+    utilization: float
+    completed_count: int
+    rejected_count: int
+    avg_wait_ms: Optional[float] = None
+    max_wait_ms: Optional[float] = None
+    avg_run_ms: Optional[float] = None
+
+
+class JtiCacheStatsRes(BaseModel):
+    size: int
+    ttl: float
+    hit_count: int
+    miss_count: int
+    invalidation_count: int
+    listening: bool
+
+
+class VerifiedTokenCacheStatsRes(BaseModel):
+    size: int
+    max_size: int
+    hit_count: int
+    miss_count: int
+    expired_count: int
+    hit_ratio: Optional[float] = None
+
+
+class BulkImportQueueStatsRes(BaseModel):
+    worker_count: int
+    queue_size: int
+    queued_count: int
+    running_count: int
+    submitted_count: int
+    rejected_count: int
+    completed_count: int
+    failed_count: int
+
+
+class AuditLogWriterStatsRes(BaseModel):
+    buffered_count: int
+    batch_size: int
+    flush_interval: float
+    recorded_count: int
+    flushed_count: int
+    flush_count: int
+    failed_flush_count: int
+    fallback_count: int
+    replayed_count: int
+    rejected_count: int
+    last_flush_ms: Optional[float] = None
+
+
+class AdminLogArchiverStatsRes(BaseModel):
+    retention_days: int
+    running: bool
+    run_count: int
+    archived_count: int
+    last_run_ms: Optional[float] = None
+
+
+class SearchAggregatorStatsRes(BaseModel):
+    key_count: int
+    bucket_seconds: int
+    flush_interval: float
+    recorded_count: int
+    flushed_count: int
+    flushed_row_count: int
+    failed_flush_count: int
+    dropped_count: int
+    last_flush_ms: Optional[float] = None
+
+
+class TrendingTrackerStatsRes(BaseModel):
+    recorded_count: int
+    checkpoint_count: int
+    last_checkpoint_ms: Optional[float] = None
+    tracked_count: Dict[str, int]
+
+
+class ServerMetricsRes(BaseModel):
+    public_politician_list_cache: SnapshotCacheStatsRes
+    public_response_cache: ResponseCacheStatsRes
+    politician_search_index: SearchIndexStatsRes
+    politician_autocomplete_index: AutocompleteIndexStatsRes
+    bcrypt_pool: BcryptPoolStatsRes
+    admin_jti_cache: JtiCacheStatsRes
+    verified_token_cache: VerifiedTokenCacheStatsRes
+    bulk_import_queue: BulkImportQueueStatsRes
+    audit_log_writer: AuditLogWriterStatsRes
+    admin_log_archiver: AdminLogArchiverStatsRes
+    public_search_aggregator: SearchAggregatorStatsRes
+    politician_trending_tracker: TrendingTrackerStatsRes
@@ -1,6 +1,6 @@
 from typing import List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator
 
 
 class ConstituencyReqSchema(BaseModel):
@@ -78,3 +78,55 @@ class SinglePoliticianUpdateRequest(BaseModel):
     promise_count_detail: PromiseCountDetailReqSchema
     jurisdiction: List[JurisdictionUpdateReqSchema]
     committee: Optional[List[PoliticianCommitteeUpdateReqSchema]] = None
+
+
+class PoliticianPatchReqSchema(BaseModel):
+    name: Optional[str] = None
+    assembly_term: Optional[int] = None
+    profile_url: Optional[str] = None
+    political_party: Optional[str] = None
+    elected_count: Optional[int] = None
+    total_promise_count: Optional[int] = None
+    completed_promise_count: Optional[int] = None
+    in_progress_promise_count: Optional[int] = None
+    pending_promise_count: Optional[int] = None
+    discarded_promise_count: Optional[int] = None
+    other_promise_count: Optional[int] = None
+    resolve_required_promise_count: Optional[int] = None
+    resolved_promise_count: Optional[int] = None
+    total_required_funds: Optional[int] = None
+    total_secured_funds: Optional[int] = None
+    total_executed_funds: Optional[int] = None
+
+    @field_validator("name", "assembly_term", "political_party", "elected_count")
+    @classmethod
+    def check_not_null(cls, value):
+        # 생략은 허용, NOT NULL 컬럼에 null 을 명시하면 거절
+        if value is None:
+            raise ValueError("must not be null")
+        return value
+
+
+class PoliticianCommitteePatchReqSchema(BaseModel):
+    id: int
+    is_main: Optional[bool] = None
+    name: Optional[str] = None
+
+
+class PoliticianCommitteeDiffReqSchema(BaseModel):
+    added: List[PoliticianCommitteeReqSchema] = []
+    updated: List[PoliticianCommitteePatchReqSchema] = []
+    deleted: List[int] = []
+
+
+class JurisdictionDiffReqSchema(BaseModel):
+    added: List[ConstituencyReqSchema] = []
+    deleted: List[int] = []
+
+
+class SinglePoliticianPatchRequest(BaseModel):
+    politician_id: int
+    base_info: Optional[PoliticianPatchReqSchema] = None
+    promise_count_detail: Optional[PromiseCountDetailReqSchema] = None
+    committee: Optional[PoliticianCommitteeDiffReqSchema] = None
+    jurisdiction: Optional[JurisdictionDiffReqSchema] = None
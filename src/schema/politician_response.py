@@ -1,4 +1,5 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, List, Optional
 
 from pydantic import BaseModel
 
@@ -7,10 +8,53 @@ class AddPoliticianDataRes(BaseModel):
     politician_id: int
 
 
+class PatchPoliticianDataRes(BaseModel):
+    politician_id: int
+    changed_field_list: List[str]
+
+
 class AddBulkPoliticianDataRes(BaseModel):
     new_politician_data_count: int
 
 
+class UpsertBulkPoliticianDataRes(BaseModel):
+    inserted_politician_data_count: int
+    updated_politician_data_count: int
+    unchanged_politician_data_count: int
+
+
+class ImportRowErrorResSchema(BaseModel):
+    line: int
+    message: str
+
+
+class ImportBulkPoliticianDataRes(BaseModel):
+    new_politician_data_count: int
+    error_count: int
+    errors: List[ImportRowErrorResSchema]
+
+
+class SubmitBulkImportJobRes(BaseModel):
+    job_id: str
+    status: str
+
+
+class BulkImportJobRes(BaseModel):
+    job_id: str
+    status: str
+    body_bytes: int
+    processed_count: int
+    new_politician_data_count: int
+    error_count: int
+    errors: List[ImportRowErrorResSchema]
+    failure_detail: Optional[Any] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    elapsed_seconds: float
+    rows_per_second: Optional[float] = None
+
+
 class PromiseCountDetailResSchema(BaseModel):
     completed_national_promise_count: Optional[int] = None
     total_national_promise_count: Optional[int] = None
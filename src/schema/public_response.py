@@ -32,3 +32,18 @@ class PublicPoliticianListElementResSchema(PublicSinglePoliticianResSchema):
 
     class Config:
         from_attributes = True
+
+
+class PublicAutocompleteResSchema(BaseModel):
+    text: str
+    category: str
+    politician_id: Optional[int] = None
+
+
+class PublicTrendingPoliticianResSchema(PublicPoliticianListElementResSchema):
+    search_count: int
+
+
+class PublicTrendingRes(BaseModel):
+    window: str
+    politician_list: List[PublicTrendingPoliticianResSchema]
@@ -0,0 +1,73 @@
+import asyncio
+import json
+from datetime import datetime
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+from admin.admin_log_archive import AdminLogArchiver
+from database.models import Base, Admin, AdminLog
+
+
+def test_run_once_moves_old_logs_to_daily_segments(tmp_path):
+    async def main():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'wip.db'}")
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+        async with session_factory() as session:
+            session.add(Admin(id=1, email="a@wip.kr", password="-", nickname="관리자"))
+            await session.flush()
+            await session.execute(
+                insert(AdminLog),
+                [
+                    {
+                        "admin_id": 1,
+                        "action": action,
+                        "created_at": created_at,
+                        "updated_at": created_at,
+                    }
+                    for action, created_at in (
+                        ("create", datetime(2024, 1, 1, 9)),
+                        ("update", datetime(2024, 1, 1, 18)),
+                        ("update", datetime(2024, 1, 2, 9)),
+                        ("create", datetime(2024, 3, 1, 9)),
+                    )
+                ],
+            )
+            await session.commit()
+
+        archiver = AdminLogArchiver(
+            retention_days=30,
+            archive_dir=str(tmp_path / "archive"),
+            interval=3600,
+            batch_size=2,
+            session_factory=session_factory,
+        )
+        archived_count = await archiver.run_once(now=datetime(2024, 3, 10, 12))
+        async with session_factory() as session:
+            remaining_id_list = (await session.scalars(select(AdminLog.id))).all()
+        await engine.dispose()
+
+        archived_line_list = [
+            line
+            async for chunk in archiver.iter_admin_log(
+                start_date=datetime(2024, 1, 1, 12), action="update"
+            )
+            for line in chunk.decode().splitlines()
+        ]
+        return archiver, archived_count, remaining_id_list, archived_line_list
+
+    archiver, archived_count, remaining_id_list, archived_line_list = asyncio.run(
+        main()
+    )
+
+    assert archived_count == 3
+    assert remaining_id_list == [4]
+    assert [
+        (segment["start_at"][:10], segment["row_count"])
+        for segment in archiver.select_segment_list()
+    ] == [("2024-01-01", 2), ("2024-01-02", 1)]
+    assert len(archiver.select_segment_list(start_date=datetime(2024, 1, 2))) == 1
+    assert [json.loads(line)["id"] for line in archived_line_list] == [2, 3]
+    assert json.loads(archived_line_list[0])["admin_nickname"] == "관리자"
@@ -0,0 +1,80 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+from admin.dashboard.dashboard_service import get_admin_log
+from database.models import Base, Admin, AdminLog, Politician
+from repositories.admin_repository import AdminRepository
+
+
+async def run_with_session(callback):
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+
+    async with async_sessionmaker(bind=engine, expire_on_commit=False)() as session:
+        session.add(Admin(id=1, email="a@wip.kr", password="-", nickname="관리자"))
+        session.add(
+            Politician(
+                id=1, assembly_term=21, name="의원", political_party="정당", elected_count=1
+            )
+        )
+        await session.flush()
+        # 같은 시각의 로그가 페이지 경계에 걸리도록 created_at 을 두 개씩 같게 설정
+        await session.execute(
+            insert(AdminLog),
+            [
+                {
+                    "admin_id": 1,
+                    "politician_id": None if index % 2 else 1,
+                    "action": "bulk_create" if index % 2 else "update",
+                    "created_at": datetime(2024, 1, 1, 0, index // 2),
+                    "updated_at": datetime(2024, 1, 1),
+                }
+                for index in range(5)
+            ],
+        )
+        await session.commit()
+        result = await callback(AdminRepository(session))
+    await engine.dispose()
+    return result
+
+
+def test_select_admin_log_page_follows_keyset_cursor():
+    async def callback(repository: AdminRepository):
+        first_page = await repository.select_admin_log_page(2)
+        second_page = await repository.select_admin_log_page(
+            2, (first_page[1].created_at, first_page[1].id)
+        )
+        return first_page, second_page
+
+    first_page, second_page = asyncio.run(run_with_session(callback))
+
+    assert [admin_log.id for admin_log in first_page] == [5, 4, 3]
+    assert [admin_log.id for admin_log in second_page] == [3, 2, 1]
+    assert [admin_log.politician_name for admin_log in first_page] == [
+        "의원",
+        None,
+        "의원",
+    ]
+
+
+def test_get_admin_log_converts_aware_bound_to_local_time():
+    async def callback(repository: AdminRepository):
+        # ?start_date=...+09:00 처럼 시간대가 있는 경계는 서버 로컬 시각으로 비교
+        start_date = datetime(2024, 1, 1, 0, 1).astimezone(timezone(timedelta(hours=9)))
+        return await get_admin_log(
+            admin_repository=repository,
+            cursor=None,
+            size=10,
+            target_admin_id=None,
+            action=None,
+            start_date=start_date,
+            end_date=None,
+        )
+
+    admin_log_page = asyncio.run(run_with_session(callback))
+
+    assert [admin_log.id for admin_log in admin_log_page.admin_log_list] == [5, 4, 3]
@@ -0,0 +1,32 @@
+from common.area_matcher import ConstituencyMatcher
+from common.enums import RegionType
+
+SEOUL = RegionType.SEOUL.value[0]
+GWANGJU = RegionType.GWANGJU.value[0]
+GYEONGGI = RegionType.GYEONGGI.value[0]
+
+CONSTITUENCY_DATA = [
+    (1, SEOUL, "강남구", "갑"),
+    (2, SEOUL, "강남구", "을"),
+    (3, SEOUL, "중구", None),
+    (4, GWANGJU, "북구", "갑"),
+    (5, GWANGJU, "중구", None),
+    (6, GYEONGGI, "광주시", "갑"),
+    (7, GYEONGGI, "성남시 분당구", "갑"),
+]
+
+
+def test_get_constituency_id_list():
+    matcher = ConstituencyMatcher(CONSTITUENCY_DATA)
+
+    assert matcher.get_constituency_id_list("서울특별시 강남구") == [1, 2]
+    assert matcher.get_constituency_id_list("강남") == [1, 2]
+    assert matcher.get_constituency_id_list("강남구 갑") == [1]
+    assert matcher.get_constituency_id_list("서울") == [1, 2, 3]
+    assert matcher.get_constituency_id_list("중구") == [3, 5]
+    assert matcher.get_constituency_id_list("광주 중구") == [5]
+    assert matcher.get_constituency_id_list("경기도 광주시") == [6]
+    assert matcher.get_constituency_id_list("광주광역시") == [4, 5]
+    assert matcher.get_constituency_id_list("분당") == [7]
+    assert matcher.get_constituency_id_list("서울 분당구") == []
+    assert matcher.get_constituency_id_list("없는 지역") == []
@@ -0,0 +1,123 @@
+import asyncio
+import json
+import os
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+from admin.audit_log_writer import AuditLogWriter
+from database.models import Base, Admin, AdminLog
+
+
+def broken_session_factory():
+    raise ConnectionError("database is down")
+
+
+def test_flush_writes_fallback_file_and_replays_it(tmp_path):
+    fallback_path = str(tmp_path / "admin_log_fallback.jsonl")
+    writer = AuditLogWriter(
+        batch_size=2,
+        flush_interval=60,
+        fallback_path=fallback_path,
+        session_factory=broken_session_factory,
+    )
+
+    async def main():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'wip.db'}")
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+        async with session_factory() as session:
+            session.add(Admin(id=1, email="a@wip.kr", password="-", nickname="관리자"))
+            await session.commit()
+
+        writer.record(1, "bulk_create", detail={"inserted": 3})
+        writer.record(1, "bulk_upsert")
+        writer.record(1, "bulk_create")
+        await writer.flush()
+        with open(f"{fallback_path}.{os.getpid()}", encoding="utf-8") as file:
+            fallback_line_count = len(file.readlines())
+
+        writer.session_factory = session_factory
+        writer.record(1, "bulk_create")
+        await writer.flush()
+        async with session_factory() as session:
+            admin_log_list = (
+                await session.scalars(select(AdminLog).order_by(AdminLog.id))
+            ).all()
+        await engine.dispose()
+        return fallback_line_count, admin_log_list
+
+    fallback_line_count, admin_log_list = asyncio.run(main())
+
+    assert fallback_line_count == 3
+    assert [admin_log.action for admin_log in admin_log_list] == [
+        "bulk_create",
+        "bulk_create",
+        "bulk_upsert",
+        "bulk_create",
+    ]
+    assert admin_log_list[1].detail == {"inserted": 3}
+    assert list(tmp_path.glob("admin_log_fallback.jsonl*")) == []
+    assert writer.get_stats()["replayed_count"] == 3
+    assert writer.get_stats()["buffered_count"] == 0
+
+
+def test_replay_claims_orphan_file_and_quarantines_rejected_rows(tmp_path):
+    fallback_path = str(tmp_path / "admin_log_fallback.jsonl")
+    # 종료된 워커가 남긴 파일: 정상 행, 없는 관리자 행, 읽을 수 없는 줄
+    with open(f"{fallback_path}.999999999", "w", encoding="utf-8") as file:
+        for admin_id in (1, 2):
+            file.write(
+                json.dumps(
+                    {
+                        "admin_id": admin_id,
+                        "politician_id": None,
+                        "action": "bulk_create",
+                        "detail": None,
+                        "created_at": "2024-01-01T00:00:00",
+                        "updated_at": "2024-01-01T00:00:00",
+                    }
+                )
+                + "\n"
+            )
+        file.write("{broken\n")
+
+    async def main():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'wip.db'}")
+
+        @event.listens_for(engine.sync_engine, "connect")
+        def enable_foreign_key(dbapi_connection, connection_record):
+            dbapi_connection.execute("PRAGMA foreign_keys=ON")
+
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+        async with session_factory() as session:
+            session.add(Admin(id=1, email="a@wip.kr", password="-", nickname="관리자"))
+            await session.commit()
+
+        writer = AuditLogWriter(
+            batch_size=10,
+            flush_interval=60,
+            fallback_path=fallback_path,
+            session_factory=session_factory,
+        )
+        await writer.replay_fallback_file()
+        async with session_factory() as session:
+            admin_id_list = (await session.scalars(select(AdminLog.admin_id))).all()
+        await engine.dispose()
+        return writer, admin_id_list
+
+    writer, admin_id_list = asyncio.run(main())
+
+    with open(f"{fallback_path}.{os.getpid()}.rejected", encoding="utf-8") as file:
+        rejected_line_list = file.readlines()
+    assert admin_id_list == [1]
+    assert len(rejected_line_list) == 2
+    assert json.loads(rejected_line_list[1])["admin_id"] == 2
+    assert sorted(path.name for path in tmp_path.glob("admin_log_fallback.jsonl*")) == [
+        f"admin_log_fallback.jsonl.{os.getpid()}.rejected"
+    ]
+    assert writer.get_stats()["replayed_count"] == 1
+    assert writer.get_stats()["rejected_count"] == 2
@@ -0,0 +1,18 @@
+from admin.auth.auth_manager import AuthManager
+
+
+def test_refresh_token_digest_verified_in_constant_time():
+    auth_manager = AuthManager()
+    token_digest = auth_manager.digest_token("refresh-token")
+
+    assert auth_manager.is_token_digest(token_digest)
+    assert auth_manager.verify_token_digest("refresh-token", token_digest)
+    assert not auth_manager.verify_token_digest("other-token", token_digest)
+
+
+def test_bcrypt_hash_is_not_token_digest():
+    auth_manager = AuthManager()
+    hashed_token = auth_manager.hash_text("refresh-token")
+
+    assert not auth_manager.is_token_digest(hashed_token)
+    assert auth_manager.verify_text("refresh-token", hashed_token)
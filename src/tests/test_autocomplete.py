@@ -0,0 +1,36 @@
+import asyncio
+
+from common.autocomplete import PoliticianAutocompleteIndex, get_choseong_text
+
+
+async def loader(assembly_term: int):
+    politician_data_list = [
+        (1, "이재명", "더불어민주당"),
+        (2, "이준석", "개혁신당"),
+        (3, "한동훈", "국민의힘"),
+    ]
+    return politician_data_list, ["강남구", "중구", None]
+
+
+def test_get_choseong_text():
+    assert get_choseong_text("이재명") == "ㅇㅈㅁ"
+    assert get_choseong_text("A당") == "Aㄷ"
+
+
+def test_search_supports_choseong_and_partial_syllable():
+    autocomplete_index = PoliticianAutocompleteIndex()
+
+    def search(keyword: str):
+        return [
+            suggestion.text
+            for suggestion in asyncio.run(
+                autocomplete_index.search(21, keyword, 10, 0, loader)
+            )
+        ]
+
+    assert search("ㅇㅈ") == ["이재명", "이준석"]
+    assert search("이ㅈㅁ") == ["이재명"]
+    assert search("이주") == ["이준석"]
+    assert search("ㄱ") == ["개혁신당", "국민의힘", "강남구"]
+    assert search("중") == ["중구"]
+    assert search("없음") == []
@@ -0,0 +1,40 @@
+import asyncio
+from threading import Event
+
+import pytest
+from fastapi import HTTPException
+from starlette.status import HTTP_503_SERVICE_UNAVAILABLE
+
+from admin.auth.bcrypt_executor import BcryptExecutor
+
+
+def test_run_rejects_when_pool_and_queue_are_full():
+    executor = BcryptExecutor(pool_size=1, queue_size=1)
+    release_event = Event()
+
+    def blocking_hash(text: str) -> str:
+        release_event.wait(timeout=5)
+        return f"hashed-{text}"
+
+    async def main():
+        task_list = [
+            asyncio.create_task(executor.run(blocking_hash, str(index)))
+            for index in range(2)
+        ]
+        await asyncio.sleep(0)
+        with pytest.raises(HTTPException) as exc_info:
+            await executor.run(blocking_hash, "rejected")
+        release_event.set()
+        return exc_info.value, await asyncio.gather(*task_list)
+
+    error, result_list = asyncio.run(main())
+    executor.shutdown()
+
+    assert error.status_code == HTTP_503_SERVICE_UNAVAILABLE
+    assert result_list == ["hashed-0", "hashed-1"]
+
+    stats = executor.get_stats()
+    assert stats["completed_count"] == 2
+    assert stats["rejected_count"] == 1
+    assert stats["peak_in_flight_count"] == 2
+    assert stats["in_flight_count"] == 0
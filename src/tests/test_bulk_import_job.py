@@ -0,0 +1,142 @@
+import asyncio
+import os
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+from starlette.status import HTTP_503_SERVICE_UNAVAILABLE
+
+from admin.politician.bulk_import_job import BulkImportJobQueue
+from database.models import Base
+from repositories.bulk_import_job_repository import BulkImportJobRepository
+
+
+async def make_byte_stream(body: bytes):
+    yield body
+
+
+async def make_session_factory(tmp_path) -> async_sessionmaker:
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'wip.db'}")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    return async_sessionmaker(bind=engine, expire_on_commit=False)
+
+
+def test_submit_spools_body_and_rejects_when_queue_is_full(tmp_path):
+    async def main():
+        session_factory = await make_session_factory(tmp_path)
+        job_queue = BulkImportJobQueue(
+            worker_count=0,
+            queue_size=1,
+            max_body_bytes=1024,
+            session_factory=session_factory,
+        )
+        job = await job_queue.submit(
+            1, "application/x-ndjson", make_byte_stream(b'{"a": 1}\n')
+        )
+        with open(job.file_path, "rb") as file:
+            spooled_body = file.read()
+        with pytest.raises(HTTPException) as exc_info:
+            await job_queue.submit(
+                1, "application/x-ndjson", make_byte_stream(b'{"a": 2}\n')
+            )
+        queued_job = await job_queue.get_job(job.job_id, 1)
+        other_admin_queued_job = await job_queue.get_job(job.job_id, 2)
+        await job_queue.stop()
+
+        # 다른 워커 프로세스는 DB 에 기록된 상태를 조회
+        other_worker_job_queue = BulkImportJobQueue(
+            worker_count=0,
+            queue_size=1,
+            max_body_bytes=1024,
+            session_factory=session_factory,
+        )
+        stopped_job = await other_worker_job_queue.get_job(job.job_id, 1)
+        other_admin_stopped_job = await other_worker_job_queue.get_job(job.job_id, 2)
+        unknown_job = await other_worker_job_queue.get_job("unknown", 1)
+        await session_factory.kw["bind"].dispose()
+        return (
+            job_queue,
+            job,
+            spooled_body,
+            exc_info.value,
+            queued_job,
+            stopped_job,
+            unknown_job,
+            other_admin_queued_job,
+            other_admin_stopped_job,
+        )
+
+    (
+        job_queue,
+        job,
+        spooled_body,
+        error,
+        queued_job,
+        stopped_job,
+        unknown_job,
+        other_admin_queued_job,
+        other_admin_stopped_job,
+    ) = asyncio.run(main())
+
+    assert spooled_body == b'{"a": 1}\n'
+    assert error.status_code == HTTP_503_SERVICE_UNAVAILABLE
+    assert queued_job.status == "queued"
+    assert stopped_job.status == "failed"
+    assert stopped_job.failure_detail == "Server shut down before the job finished"
+    assert stopped_job.body_bytes == len(b'{"a": 1}\n')
+    assert unknown_job is None
+    # 다른 관리자가 등록한 작업은 없는 작업과 같이 응답
+    assert other_admin_queued_job is None
+    assert other_admin_stopped_job is None
+    assert not os.path.exists(job.file_path)
+    assert job_queue.get_stats()["rejected_count"] == 1
+
+
+def test_fail_stale_jobs_marks_only_abandoned_running_jobs(tmp_path):
+    async def main():
+        session_factory = await make_session_factory(tmp_path)
+        now = datetime.now()
+        async with session_factory() as session:
+            job_repo = BulkImportJobRepository(session)
+            # 종료된 워커의 작업은 진행 상황이 job_timeout 넘게 기록되지 않음
+            for job_id, status, updated_at in (
+                ("stale", "running", now - timedelta(seconds=120)),
+                ("alive", "running", now),
+                ("queued", "queued", now - timedelta(seconds=120)),
+            ):
+                await job_repo.insert_bulk_import_job(
+                    {
+                        "id": job_id,
+                        "admin_id": 1,
+                        "status": status,
+                        "body_bytes": 0,
+                        "started_at": updated_at,
+                        "updated_at": updated_at,
+                    }
+                )
+            await session.commit()
+
+        job_queue = BulkImportJobQueue(
+            worker_count=0,
+            queue_size=1,
+            max_body_bytes=1024,
+            job_timeout=60,
+            session_factory=session_factory,
+        )
+        await job_queue.fail_stale_jobs()
+        job_list = [
+            await job_queue.get_job(job_id, 1)
+            for job_id in ("stale", "alive", "queued")
+        ]
+        await session_factory.kw["bind"].dispose()
+        return job_list
+
+    stale_job, alive_job, queued_job = asyncio.run(main())
+
+    assert stale_job.status == "failed"
+    assert stale_job.failure_detail == "Worker stopped before the job finished"
+    assert stale_job.finished_at is not None
+    assert alive_job.status == "running"
+    assert queued_job.status == "queued"
@@ -0,0 +1,50 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from common.constituency_catalog import ConstituencyCatalog
+from common.enums import RegionType
+from schema.politician_request import ConstituencyReqSchema
+
+SEOUL = RegionType.SEOUL.value[0]
+SEJONG = RegionType.SEJONG.value[0]
+
+
+async def loader():
+    return [
+        (1, SEOUL, "강남구", "갑"),
+        (2, SEOUL, "강남구", "을"),
+        (3, SEJONG, None, None),
+    ]
+
+
+def test_resolve_bulk_constituency_id_list():
+    catalog = asyncio.run(ConstituencyCatalog().load(loader))
+
+    assert catalog.resolve_bulk_constituency_id_list(
+        [
+            [
+                ConstituencyReqSchema(region="서울", district="강남구", section="을"),
+                ConstituencyReqSchema(region="세종"),
+            ],
+            [ConstituencyReqSchema(region="서울", district="강남구", section="갑")],
+        ]
+    ) == [[2, 3], [1]]
+    assert catalog.get_constituency_key(2) == ("서울", "강남구", "을")
+
+
+def test_resolve_reports_every_unknown_constituency():
+    catalog = asyncio.run(ConstituencyCatalog().load(loader))
+
+    with pytest.raises(HTTPException) as exc_info:
+        catalog.resolve_bulk_constituency_id_list(
+            [
+                [ConstituencyReqSchema(region="서울", district="강남구", section="병")],
+                [ConstituencyReqSchema(region="서울", district="강남구", section="갑")],
+                [ConstituencyReqSchema(region="부산", district="강남구", section="갑")],
+            ]
+        )
+
+    unknown_list = exc_info.value.detail["unknown_constituency"]
+    assert [unknown["politician_index"] for unknown in unknown_list] == [0, 2]
@@ -0,0 +1,49 @@
+import asyncio
+
+import fakeredis
+
+from admin.auth.jti_cache import AdminJtiCache
+
+
+def test_fill_skipped_when_jti_changed_during_lookup():
+    jti_cache = AdminJtiCache(ttl=30)
+    assert jti_cache.get(1) == (False, None)
+
+    generation = jti_cache.generation
+    asyncio.run(jti_cache.update(1, "new-jti"))
+    jti_cache.fill(1, "old-jti", generation)
+    assert jti_cache.get(1) == (True, "new-jti")
+
+    asyncio.run(jti_cache.update(1, None))
+    assert jti_cache.get(1) == (True, None)
+
+
+def test_entry_expires_and_remote_message_invalidates():
+    jti_cache = AdminJtiCache(ttl=-1)
+    jti_cache.fill(1, "jti", jti_cache.generation)
+    assert jti_cache.get(1) == (False, None)
+
+    jti_cache.ttl = 30
+    asyncio.run(jti_cache.update(1, "jti"))
+    jti_cache.handle_message({"data": f"{jti_cache.worker_id}:1"})
+    assert jti_cache.get(1) == (True, "jti")
+    jti_cache.handle_message({"data": "other-worker:1"})
+    assert jti_cache.get(1) == (False, None)
+
+
+def test_update_publishes_with_async_client():
+    async def main():
+        publish_client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+        pubsub = publish_client.pubsub(ignore_subscribe_messages=True)
+        await pubsub.subscribe(AdminJtiCache.channel)
+        jti_cache = AdminJtiCache(ttl=30, publish_client=publish_client)
+        await jti_cache.update(1, None)
+        message = None
+        for _ in range(10):
+            message = message or await pubsub.get_message(timeout=0.1)
+        await pubsub.close()
+        return jti_cache.worker_id, message
+
+    worker_id, message = asyncio.run(main())
+
+    assert message["data"] == f"{worker_id}:1"
@@ -0,0 +1,58 @@
+import asyncio
+
+from common.ngram_index import PoliticianNgramIndex
+
+POLITICIAN_DATA = [
+    (1, "홍길동", "더불어민주당"),
+    (2, "김길동", "국민의힘"),
+    (3, "이순신", "정의당"),
+]
+
+
+def make_loader(load_count: dict):
+    async def loader(assembly_term: int):
+        load_count["count"] += 1
+        return POLITICIAN_DATA
+
+    return loader
+
+
+def test_search_matches_like_semantics():
+    search_index = PoliticianNgramIndex()
+    loader = make_loader({"count": 0})
+
+    assert asyncio.run(search_index.search(21, "name", "길동", 0, loader)) == [1, 2]
+    assert asyncio.run(search_index.search(21, "name", "동", 0, loader)) == [1, 2]
+    assert asyncio.run(search_index.search(21, "name", "홍동", 0, loader)) == []
+    assert asyncio.run(search_index.search(21, "political_party", "민주", 0, loader)) == [
+        1
+    ]
+    assert asyncio.run(search_index.search(21, "political_party", "당", 0, loader)) == [
+        1,
+        3,
+    ]
+
+
+def test_apply_changes_updates_index_without_rebuild():
+    search_index = PoliticianNgramIndex()
+    load_count = {"count": 0}
+    loader = make_loader(load_count)
+    asyncio.run(search_index.search(21, "name", "길동", 0, loader))
+
+    search_index.apply_changes(
+        [
+            (2, {"assembly_term": 21, "name": "김유신", "political_party": "국민의힘"}),
+            (4, {"assembly_term": 21, "name": "강감찬", "political_party": "정의당"}),
+        ],
+        1,
+    )
+
+    assert asyncio.run(search_index.search(21, "name", "길동", 1, loader)) == [1]
+    assert asyncio.run(search_index.search(21, "political_party", "정의", 1, loader)) == [
+        3,
+        4,
+    ]
+    assert load_count["count"] == 1
+
+    asyncio.run(search_index.search(21, "name", "길동", 3, loader))
+    assert load_count["count"] == 2
@@ -0,0 +1,55 @@
+import asyncio
+
+from admin.politician.politician_import_parser import parse_politician_rows
+
+
+async def make_byte_stream(body: bytes, size: int):
+    for start in range(0, len(body), size):
+        yield body[start : start + size]
+
+
+def collect_rows(content_type: str, body: bytes, max_line_bytes: int = 1024):
+    async def main():
+        return [
+            row
+            async for row in parse_politician_rows(
+                content_type, make_byte_stream(body, 7), max_line_bytes
+            )
+        ]
+
+    return asyncio.run(main())
+
+
+def test_csv_rows_are_parsed_across_chunk_boundaries():
+    body = (
+        "\ufeffname,assembly_term,political_party,elected_count,constituency,committee\n"
+        "홍길동,21,정당,1,서울/종로구/갑,국방위원회;외교통일위원회\n"
+        "\n"
+        "오류,21,정당,x,서울/종로구/갑,\n"
+    ).encode()
+
+    (line_number, politician, _), (error_line_number, _, error_message) = collect_rows(
+        "text/csv; charset=utf-8", body
+    )
+
+    assert line_number == 2
+    assert politician.base_info.name == "홍길동"
+    assert politician.constituency[0].district == "종로구"
+    assert [committee.name for committee in politician.committee] == [
+        "국방위원회",
+        "외교통일위원회",
+    ]
+    assert error_line_number == 4
+    assert "elected_count" in error_message
+
+
+def test_ndjson_line_over_limit_is_reported_and_skipped():
+    body = b'{"base_info": "' + b"x" * 100 + b'"}\n{"broken"\n'
+
+    row_list = collect_rows("application/x-ndjson", body, max_line_bytes=50)
+
+    assert [(line_number, message) for line_number, _, message in row_list][0] == (
+        1,
+        "Line too long",
+    )
+    assert row_list[1][0] == 2 and row_list[1][1] is None
@@ -0,0 +1,144 @@
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+from database.models import Base, Politician, PromiseCountDetail
+from repositories.politician_info_repository import (
+    InsertedPoliticianIdError,
+    PoliticianInfoRepository,
+)
+from schema.politician_request import PromiseCountDetailReqSchema
+
+
+async def run_with_session(callback):
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+
+    async with async_sessionmaker(bind=engine, expire_on_commit=False)() as session:
+        for politician_id in (1, 2):
+            session.add(
+                Politician(
+                    id=politician_id,
+                    assembly_term=21,
+                    name=f"의원{politician_id}",
+                    political_party="정당",
+                    elected_count=1,
+                )
+            )
+            session.add(
+                PromiseCountDetail(
+                    politician_id=politician_id, total_national_promise_count=1
+                )
+            )
+        await session.commit()
+        result = await callback(PoliticianInfoRepository(session))
+    await engine.dispose()
+    return result
+
+
+def test_select_total_politician_data_loads_relationships():
+    async def callback(repository: PoliticianInfoRepository):
+        return await repository.select_total_politician_data_by_id(1)
+
+    politician = asyncio.run(run_with_session(callback))
+
+    assert politician.committee == []
+    assert politician.promise_count_detail.total_national_promise_count == 1
+
+
+def test_update_promise_count_detail_only_targets_politician():
+    async def callback(repository: PoliticianInfoRepository):
+        await repository.update_promise_count_detail_data(
+            1, PromiseCountDetailReqSchema(total_national_promise_count=5)
+        )
+        return [
+            (
+                await repository.select_total_politician_data_by_id(politician_id)
+            ).promise_count_detail.total_national_promise_count
+            for politician_id in (1, 2)
+        ]
+
+    assert asyncio.run(run_with_session(callback)) == [5, 1]
+
+
+def test_bulk_insert_politician_data_returns_ids_in_input_order():
+    async def callback(repository: PoliticianInfoRepository):
+        # 기존 의원과 같은 키, 묶음 안에서 중복된 키도 새로 삽입된 행의 id 로 배정
+        politician_id_list = await repository.bulk_insert_politician_data(
+            [
+                {
+                    "assembly_term": assembly_term,
+                    "name": name,
+                    "political_party": "정당",
+                    "elected_count": elected_count,
+                }
+                for assembly_term, name, elected_count in (
+                    (22, "갑", 1),
+                    (21, "의원1", 2),
+                    (22, "을", 1),
+                    (22, "갑", 3),
+                )
+            ]
+        )
+        politician_list = await repository.select_politician_data_by_id_list(
+            politician_id_list
+        )
+        politician_map = {
+            row[0].id: (row[0].name, row[0].elected_count) for row in politician_list
+        }
+        return [politician_map[politician_id] for politician_id in politician_id_list]
+
+    assert asyncio.run(run_with_session(callback)) == [
+        ("갑", 1),
+        ("의원1", 2),
+        ("을", 1),
+        ("갑", 3),
+    ]
+
+
+def test_select_politician_data_by_key_list_matches_natural_key():
+    async def callback(repository: PoliticianInfoRepository):
+        return [
+            (politician.id, promise_count_detail.total_national_promise_count)
+            for politician, promise_count_detail in (
+                await repository.select_politician_data_by_key_list(
+                    [(21, "의원2", "정당"), (21, "의원1", "다른정당"), (22, "의원1", "정당")]
+                )
+            )
+        ]
+
+    assert asyncio.run(run_with_session(callback)) == [(2, 1)]
+
+
+def test_update_politician_columns_writes_only_given_columns():
+    async def callback(repository: PoliticianInfoRepository):
+        await repository.update_politician_columns(1, {"elected_count": 3})
+        (
+            politician,
+            promise_count_detail,
+        ) = await repository.select_politician_with_promise_count_detail(1)
+        return politician.elected_count, politician.name, promise_count_detail.id
+
+    elected_count, name, promise_count_detail_id = asyncio.run(
+        run_with_session(callback)
+    )
+
+    assert (elected_count, name) == (3, "의원1")
+    assert promise_count_detail_id is not None
+
+
+def test_select_inserted_politician_id_list_raises_on_missing_rows():
+    async def callback(repository: PoliticianInfoRepository):
+        # 저장된 키가 요청 키와 다르게 비교되는 경우 (예: 후행 공백) 재조회 결과가 모자람
+        with pytest.raises(InsertedPoliticianIdError):
+            await repository.select_inserted_politician_id_list(
+                [
+                    {"assembly_term": 21, "name": "의원1", "political_party": "정당"},
+                    {"assembly_term": 21, "name": "의원2 ", "political_party": "정당"},
+                ],
+                1,
+            )
+
+    asyncio.run(run_with_session(callback))
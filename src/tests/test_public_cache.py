@@ -0,0 +1,77 @@
+import asyncio
+
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+from common.data_version import DataVersion, politician_data_version
+from database.models import Base
+from public.public_cache import PublicPoliticianListCache
+from schema.public_response import PublicPoliticianListElementResSchema
+
+
+def make_politician(politician_id: int, promise_execution_rate: int | None):
+    return PublicPoliticianListElementResSchema(
+        id=politician_id,
+        name=f"의원{politician_id}",
+        political_party="정당",
+        promise_execution_rate=promise_execution_rate,
+        constituency=[],
+    )
+
+
+def test_snapshot_sorted_like_database_order():
+    cache = PublicPoliticianListCache()
+    politician_list = [
+        make_politician(1, 50),
+        make_politician(2, None),
+        make_politician(3, 80),
+        make_politician(4, 50),
+    ]
+
+    async def loader(assembly_term: int):
+        return politician_list
+
+    snapshot = asyncio.run(cache.get_snapshot(21, loader))
+
+    assert [x.id for x in snapshot.get_sorted_list("desc")] == [3, 4, 1, 2]
+    assert [x.id for x in snapshot.get_sorted_list("asc")] == [2, 1, 4, 3]
+
+
+def test_snapshot_rebuilt_after_data_version_bump():
+    cache = PublicPoliticianListCache()
+    load_count = {"count": 0}
+
+    async def loader(assembly_term: int):
+        load_count["count"] += 1
+        return [make_politician(1, 10)]
+
+    asyncio.run(cache.get_snapshot(21, loader))
+    asyncio.run(cache.get_snapshot(21, loader))
+    assert load_count["count"] == 1
+    assert cache.get_stats()["hit_count"] == 1
+
+    asyncio.run(politician_data_version.bump())
+    asyncio.run(cache.get_snapshot(21, loader))
+    assert load_count["count"] == 2
+    assert cache.get_stats()["rebuild_count"] == 2
+
+
+def test_data_version_shared_through_database(tmp_path):
+    async def main():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'wip.db'}")
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+        first_worker_version = DataVersion("test", session_factory=session_factory)
+        second_worker_version = DataVersion("test", session_factory=session_factory)
+
+        await second_worker_version.refresh()
+        before_version = second_worker_version.get()
+        await first_worker_version.bump()
+        await second_worker_version.refresh()
+        await engine.dispose()
+        return first_worker_version, second_worker_version, before_version
+
+    first_worker_version, second_worker_version, before_version = asyncio.run(main())
+
+    assert second_worker_version.get() == before_version + 1
+    assert first_worker_version.get_tag() == second_worker_version.get_tag()
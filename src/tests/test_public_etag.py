@@ -0,0 +1,11 @@
+from public.public_etag import is_etag_matched, make_etag
+
+
+def test_etag_matched_with_list_and_weak_prefix():
+    etag = make_etag("politician_list", "epoch-1", "/path", "page=0")
+
+    assert is_etag_matched(etag, etag)
+    assert is_etag_matched(f'"other", W/{etag}', etag)
+    assert is_etag_matched("*", etag)
+    assert not is_etag_matched(None, etag)
+    assert not is_etag_matched(make_etag("politician_list", "epoch-2"), etag)
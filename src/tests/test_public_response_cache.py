@@ -0,0 +1,95 @@
+import asyncio
+
+import fakeredis
+from pydantic import TypeAdapter
+
+from common.data_version import DataVersion
+from public.public_response_cache import PublicResponseCache
+from schema.public_response import PublicConstituencyResSchema
+
+
+def test_local_bytes_cache_serves_without_rebuild():
+    response_cache = PublicResponseCache(None, ttl=60, local_max_size=1)
+    type_adapter = TypeAdapter(PublicConstituencyResSchema)
+    build_count = {"count": 0}
+
+    def builder():
+        build_count["count"] += 1
+        return PublicConstituencyResSchema(region="서울", district="종로구")
+
+    first_key = response_cache.make_key("politician", "first")
+    second_key = response_cache.make_key("politician", "second")
+    asyncio.run(response_cache.get_response(first_key, builder, type_adapter))
+    response = asyncio.run(
+        response_cache.get_response(first_key, builder, type_adapter)
+    )
+
+    assert build_count["count"] == 1
+    assert response.body == type_adapter.dump_json(builder())
+
+    asyncio.run(response_cache.get_response(second_key, builder, type_adapter))
+    assert list(response_cache.local_cache.keys()) == [second_key]
+    assert response_cache.get_stats()["local_size"] == 1
+
+
+def test_response_cache_shared_between_instances():
+    redis_server = fakeredis.FakeServer()
+    first_worker_cache = PublicResponseCache(
+        fakeredis.aioredis.FakeRedis(server=redis_server), ttl=60
+    )
+    second_worker_cache = PublicResponseCache(
+        fakeredis.aioredis.FakeRedis(server=redis_server), ttl=60
+    )
+    type_adapter = TypeAdapter(PublicConstituencyResSchema)
+    build_count = {"count": 0}
+
+    def builder():
+        build_count["count"] += 1
+        return PublicConstituencyResSchema(region="서울", district="종로구")
+
+    key = first_worker_cache.make_key("constituency", "seoul")
+
+    async def main():
+        first_response = await first_worker_cache.get_response(
+            key, builder, type_adapter, etag='"tag"'
+        )
+        second_response = await second_worker_cache.get_response(
+            key, builder, type_adapter, etag='"tag"'
+        )
+        return (
+            first_response,
+            second_response,
+            await first_worker_cache.redis_client.ttl(key),
+        )
+
+    first_response, second_response, ttl = asyncio.run(main())
+
+    assert build_count["count"] == 1
+    assert first_response.body == second_response.body
+    assert second_response.headers["etag"] == '"tag"'
+    assert 0 < ttl <= 60
+
+
+def test_data_version_shared_between_workers():
+    redis_server = fakeredis.FakeServer()
+    first_worker_version = DataVersion(
+        "test", fakeredis.aioredis.FakeRedis(server=redis_server)
+    )
+    second_worker_version = DataVersion(
+        "test", fakeredis.aioredis.FakeRedis(server=redis_server)
+    )
+
+    async def main():
+        await second_worker_version.refresh()
+        before_tag = second_worker_version.get_tag()
+        await first_worker_version.bump()
+        # 다음 갱신 전까지는 redis 를 조회하지 않고 이전 버전을 사용
+        cached_tag = second_worker_version.get_tag()
+        await second_worker_version.refresh()
+        return before_tag, cached_tag
+
+    before_tag, cached_tag = asyncio.run(main())
+
+    assert cached_tag == before_tag
+    assert second_worker_version.get_tag() != before_tag
+    assert first_worker_version.get() == second_worker_version.get()
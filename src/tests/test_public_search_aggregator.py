@@ -0,0 +1,129 @@
+import asyncio
+from datetime import datetime
+
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+from common.enums import SearchCategory
+from database.models import Base, Politician, PublicSearchLog
+from public.public_search_aggregator import PublicSearchAggregator
+from repositories.search_log_repository import SearchLogRepository
+
+
+def broken_session_factory():
+    raise ConnectionError("database is down")
+
+
+def test_flush_inserts_one_row_per_bucket_and_retries_after_failure(tmp_path):
+    aggregator = PublicSearchAggregator(
+        bucket_seconds=3600,
+        flush_interval=60,
+        max_key_count=100,
+        session_factory=broken_session_factory,
+    )
+
+    async def main():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'wip.db'}")
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+        async with session_factory() as session:
+            session.add(
+                Politician(
+                    id=1,
+                    assembly_term=21,
+                    name="의원",
+                    political_party="정당",
+                    elected_count=1,
+                )
+            )
+            await session.commit()
+
+        for _ in range(3):
+            aggregator.record(SearchCategory.POLITICIAN, 1)
+        aggregator.record(SearchCategory.NAME)
+        await aggregator.flush()
+        key_count_after_failure = len(aggregator.counter)
+
+        aggregator.session_factory = session_factory
+        aggregator.record(SearchCategory.POLITICIAN, 1)
+        await aggregator.flush()
+        async with session_factory() as session:
+            search_log_list = (await session.scalars(select(PublicSearchLog))).all()
+            search_log_repo = SearchLogRepository(session)
+            category_list = await search_log_repo.select_search_count_by_category(
+                datetime(2000, 1, 1), datetime(2100, 1, 1)
+            )
+            politician_list = await search_log_repo.select_search_count_by_politician(
+                datetime(2000, 1, 1), datetime(2100, 1, 1), 10
+            )
+        await engine.dispose()
+        return key_count_after_failure, search_log_list, category_list, politician_list
+
+    (
+        key_count_after_failure,
+        search_log_list,
+        category_list,
+        politician_list,
+    ) = asyncio.run(main())
+
+    assert key_count_after_failure == 2
+    assert len(search_log_list) == 2
+    assert [tuple(category) for category in category_list] == [
+        ("politician", 4),
+        ("name", 1),
+    ]
+    assert [tuple(politician) for politician in politician_list] == [(1, "의원", "정당", 4)]
+    assert aggregator.get_stats()["flushed_count"] == 5
+
+
+def test_flush_drops_unknown_politician_id(tmp_path):
+    async def main():
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'wip.db'}")
+
+        # MySQL 처럼 public_search_log.politician_id 외래 키를 검사
+        @event.listens_for(engine.sync_engine, "connect")
+        def enable_foreign_key(dbapi_connection, connection_record):
+            dbapi_connection.execute("PRAGMA foreign_keys=ON")
+
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+        session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+        async with session_factory() as session:
+            session.add(
+                Politician(
+                    id=1,
+                    assembly_term=21,
+                    name="의원",
+                    political_party="정당",
+                    elected_count=1,
+                )
+            )
+            await session.commit()
+
+        aggregator = PublicSearchAggregator(
+            bucket_seconds=3600,
+            flush_interval=60,
+            max_key_count=100,
+            session_factory=session_factory,
+        )
+        aggregator.record(SearchCategory.POLITICIAN, 1)
+        aggregator.record(SearchCategory.POLITICIAN, 999)
+        aggregator.record(SearchCategory.POLITICIAN, 999)
+        aggregator.record(SearchCategory.LIST)
+        await aggregator.flush()
+        async with session_factory() as session:
+            search_log_list = (await session.scalars(select(PublicSearchLog))).all()
+        await engine.dispose()
+        return aggregator, search_log_list
+
+    aggregator, search_log_list = asyncio.run(main())
+
+    assert sorted(
+        (search_log.search_category, search_log.politician_id)
+        for search_log in search_log_list
+    ) == [("list", None), ("politician", 1)]
+    assert len(aggregator.counter) == 0
+    assert aggregator.get_stats()["failed_flush_count"] == 0
+    assert aggregator.get_stats()["flushed_count"] == 2
+    assert aggregator.get_stats()["dropped_count"] == 2
@@ -0,0 +1,52 @@
+import asyncio
+
+from public.public_trending import (
+    SpaceSavingCounter,
+    SlidingWindowCounter,
+    PoliticianTrendingTracker,
+)
+
+
+def test_space_saving_counter_keeps_heavy_hitters_within_capacity():
+    counter = SpaceSavingCounter(capacity=3)
+    for item in [1] * 50 + [2] * 30 + list(range(100, 120)):
+        counter.add(item)
+
+    assert len(counter.count_map) == 3
+    assert counter.count_map[1] == 50
+    assert counter.count_map[2] == 30
+
+
+def test_sliding_window_counter_drops_expired_slices():
+    window_counter = SlidingWindowCounter(slice_seconds=60, slice_count=2, capacity=10)
+    window_counter.add(1, now=0, count=5)
+    window_counter.add(2, now=60, count=3)
+    window_counter.add(2, now=120)
+
+    assert window_counter.get_ranking(now=120) == [(2, 4)]
+    assert list(window_counter.slice_map) == [1, 2]
+
+
+def test_checkpoint_restores_window_counts(tmp_path):
+    checkpoint_path = str(tmp_path / "trending.json")
+    stopped_tracker = PoliticianTrendingTracker(10, 0, checkpoint_path, 60)
+    stopped_tracker.worker_id = 999999998
+    for politician_id in (1, 1, 2):
+        stopped_tracker.record(politician_id)
+    asyncio.run(stopped_tracker.checkpoint())
+
+    # 실행 중인 다른 워커의 파일은 가져가지 않음
+    running_tracker = PoliticianTrendingTracker(10, 0, checkpoint_path, 60)
+    running_tracker.record(3)
+    asyncio.run(running_tracker.checkpoint())
+
+    restored_tracker = PoliticianTrendingTracker(10, 0, checkpoint_path, 60)
+    restored_tracker.worker_id = 999999997
+    restored_tracker.record(2)
+    asyncio.run(restored_tracker.restore_checkpoint())
+
+    assert restored_tracker.get_ranking("hour") == [(1, 2), (2, 2)]
+    assert restored_tracker.get_ranking("day") == [(1, 2), (2, 2)]
+    assert sorted(path.name for path in tmp_path.iterdir()) == sorted(
+        ["trending.json.999999997", f"trending.json.{running_tracker.worker_id}"]
+    )
@@ -0,0 +1,26 @@
+import time
+
+from admin.auth.token_cache import VerifiedTokenCache, TokenClaims
+
+
+def test_claims_cached_until_token_exp():
+    token_cache = VerifiedTokenCache(max_size=2)
+    token_cache.set("valid", TokenClaims(1, "jti", time.time() + 60))
+    token_cache.set("expired", TokenClaims(2, "jti", time.time() - 1))
+
+    assert token_cache.get("valid").admin_id == 1
+    assert token_cache.get("expired") is None
+    assert token_cache.get_stats()["expired_count"] == 1
+
+
+def test_least_recently_used_entry_evicted():
+    token_cache = VerifiedTokenCache(max_size=2)
+    exp = time.time() + 60
+    token_cache.set("first", TokenClaims(1, "jti", exp))
+    token_cache.set("second", TokenClaims(2, "jti", exp))
+    token_cache.get("first")
+    token_cache.set("third", TokenClaims(3, "jti", exp))
+
+    assert token_cache.get("second") is None
+    assert token_cache.get("first").admin_id == 1
+    assert token_cache.get_stats()["hit_ratio"] == 2 / 3